@@ -0,0 +1,354 @@
+# benchmarks/mock_site.py
+"""
+Local mock of all seven procurement sites, for benchmarks that need no network.
+
+Serves synthetic listing and detail pages with the DOM each scraper reads:
+
+    /<source>/list?page=N      listing page N (1-based), newest notices first
+    /<source>/notice/<i>       detail page of notice i
+    /worldbank/api/<name>      the World Bank search API (procnotices, projects)
+
+Every source has the same number of notices, published evenly over the last
+`days` days, and every response can be delayed to mimic a remote host.
+Links are absolute, as several scrapers navigate to hrefs as they are.
+
+    python -m benchmarks.mock_site --notices 5000 --page-size 20 --latency 50
+"""
+
+import argparse
+import asyncio
+import html
+import logging
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+COUNTRIES = ['Kenya', 'Morocco', 'India', 'Senegal', 'Viet Nam', 'Peru', 'Egypt', 'Uzbekistan']
+SECTORS = ['Energy', 'Water', 'Transport', 'Health', 'Education', 'Agriculture']
+
+
+class MockSite:
+    """
+    Synthetic notices shared by every source's pages.
+
+    notices per source, page_size rows per listing page and latency seconds
+    (plus up to jitter seconds) added to every response.
+    """
+
+    def __init__(self, notices: int = 500, page_size: int = 20, latency: float = 0.0,
+                 jitter: float = 0.0, days: int = 30, today: Optional[date] = None):
+        self.notices = notices
+        self.page_size = max(1, page_size)
+        self.latency = latency
+        self.jitter = jitter
+        self.days = days
+        self.today = today or date.today()
+        self.requests = 0
+
+    # Dates, pages and links
+
+    def published(self, i: int) -> date:
+        """Notice 0 is published today, the last one `days` days ago"""
+        return self.today - timedelta(days=i * self.days // max(self.notices, 1))
+
+    @property
+    def since(self) -> date:
+        """Oldest publish date of any notice, the start of a window covering them all"""
+        return self.today - timedelta(days=self.days)
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.notices // self.page_size))
+
+    def page_notices(self, page: int) -> range:
+        start = (page - 1) * self.page_size
+        return range(start, min(start + self.page_size, self.notices))
+
+    @staticmethod
+    def host(request: web.Request) -> str:
+        return f"http://{request.host}"
+
+    def list_url(self, request: web.Request, source: str, page: int) -> str:
+        return f"{self.host(request)}/{source}/list?page={page}"
+
+    def notice_url(self, request: web.Request, source: str, i: int) -> str:
+        return f"{self.host(request)}/{source}/notice/{i}"
+
+    def start_url(self, base: str, source: str) -> str:
+        """Listing URL to give a scraper, base being e.g. http://127.0.0.1:8765"""
+        return f"{base}/{source}/list?page=1"
+
+    # Listing pages
+
+    def worldbank_list(self, request, page: int) -> str:
+        rows = "".join(
+            f"<tr><td><a href='{self.notice_url(request, 'worldbank', i)}'>Procurement notice {i}</a></td>"
+            f"<td>{COUNTRIES[i % len(COUNTRIES)]}</td>"
+            f"<td><a href='{self.host(request)}/worldbank/project/P{100000 + i}'>Project {i}</a></td>"
+            f"<td>Request for Bids</td><td>English</td>"
+            f"<td>{self.published(i).strftime('%B %d, %Y')}</td></tr>"
+            for i in self.page_notices(page)
+        )
+        last = page >= self.page_count
+        pager = (f"<ul class='pagination'><li class='active'><a>{page}</a></li>"
+                 f"<li class='{'disabled' if last else ''}'><a href='{self.list_url(request, 'worldbank', page + 1)}'>"
+                 f"<i class='fa fa-angle-right'></i></a></li></ul>")
+        return f"<table class='project-opt-table'><tbody>{rows}</tbody></table>{pager}"
+
+    def ebrd_list(self, request, page: int) -> str:
+        cards = "".join(
+            f"<div class='search-result__result-card'>"
+            f"<h4 class='project-details'><a href='{self.notice_url(request, 'ebrd', i)}'>Tender {i}</a></h4>"
+            f"<div class='search-result__project-details date-block'><div><p>Issue date</p>"
+            f"<p><span>Date: </span><span>{self.published(i).strftime('%d %b %Y')}</span></p></div></div></div>"
+            for i in self.page_notices(page)
+        )
+        pager = ""
+        if page < self.page_count:
+            pager = f"<a class='pagination__button--next' href='{self.list_url(request, 'ebrd', page + 1)}'>Next</a>"
+        return f"<div class='search-results'>{cards}</div>{pager}"
+
+    def isdb_list(self, request, page: int) -> str:
+        articles = "".join(
+            f"<article><div class='field-title'><a href='{self.notice_url(request, 'isdb', i)}'>Tender {i}</a></div></article>"
+            for i in self.page_notices(page)
+        )
+        pager = ""
+        if page < self.page_count:
+            pager = (f"<ul class='pager'><li class='pager__item--next'>"
+                     f"<a href='{self.list_url(request, 'isdb', page + 1)}'>Next</a></li></ul>")
+        return f"<div data-index-view='tenders_listing'>{articles}</div>{pager}"
+
+    def afdb_list(self, request, page: int) -> str:
+        items = "".join(
+            f"<div class='col-md-4'><div class='field-content'>"
+            f"<span class='date-display-single'>{self.published(i).strftime('%d-%b-%Y')}</span></div>"
+            f"<span class='field-content'><a href='{self.notice_url(request, 'afdb', i)}'>"
+            f"Notice {i} - {COUNTRIES[i % len(COUNTRIES)]} - Works</a></span></div>"
+            for i in self.page_notices(page)
+        )
+        pager = ""
+        if page < self.page_count:
+            pager = (f"<ul class='pager'><li class='next'><a title='Go to next page' "
+                     f"href='{self.list_url(request, 'afdb', page + 1)}'>next</a></li></ul>")
+        return f"<div class='views-bootstrap-grid-plugin-style'><div class='row'>{items}</div></div>{pager}"
+
+    def aiib_list(self, request, page: int) -> str:
+        rows = "".join(
+            f"<div class='table-row'>"
+            f"<div class='table-col table-date'><span class='s2'>{self.published(i).strftime('%b %d, %Y')}</span></div>"
+            f"<div class='table-col table-country'><span class='country-value'>{COUNTRIES[i % len(COUNTRIES)]}</span></div>"
+            f"<div class='table-col table-project'><a href='{self.host(request)}/aiib/download/{i}.pdf'>"
+            f"<span class='title-value'>Project {i}</span></a></div>"
+            f"<div class='table-col table-energy'><span class='sector-value'>{SECTORS[i % len(SECTORS)]}</span></div>"
+            f"<div class='table-col table-type'><span class='type-value'>Procurement Notice</span></div></div>"
+            for i in self.page_notices(page)
+        )
+        pager = f"<a class='next' href='{self.list_url(request, 'aiib', page + 1)}'>Next</a>" if page < self.page_count else ""
+        return f"<div class='table-body'>{rows}</div>{pager}"
+
+    def afd_list(self, request, page: int) -> str:
+        rows = "".join(
+            f"<tr><td class='published'>{self.published(i).strftime('%b %d, %Y')}</td>"
+            f"<td class='country'>{COUNTRIES[i % len(COUNTRIES)]}</td>"
+            f"<td><a href='{self.notice_url(request, 'afd', i)}'>Tender {i}</a></td>"
+            f"<td class='deadline'>{(self.published(i) + timedelta(days=30)).strftime('%b %d, %Y')}</td></tr>"
+            for i in self.page_notices(page)
+        )
+        pager = f"<a href='{self.list_url(request, 'afd', page + 1)}'>Next</a>" if page < self.page_count else ""
+        return f"<div><table id='notice'><tbody>{rows}</tbody></table>{pager}</div>"
+
+    def tendersinfo_list(self, request, page: int) -> str:
+        notices = list(self.page_notices(page))
+        half = (len(notices) + 1) // 2
+
+        def panel(heading: str, ids: List[int]) -> str:
+            links = "".join(f"<p><a class='tenderBrief' href='{self.notice_url(request, 'tendersinfo', i)}'>"
+                            f"Tender {i}</a></p>" for i in ids)
+            return f"<div class='panel'><div class='panel-heading'>{heading}</div><div class='panel-body'>{links}</div></div>"
+
+        pager = f"<ul class='pagination'><li class='active'><a>{page}</a></li>"
+        if page < self.page_count:
+            pager += f"<li><a href='{self.list_url(request, 'tendersinfo', page + 1)}'>{page + 1}</a></li>"
+        pager += "</ul>"
+        return panel("Global Tenders", notices[:half]) + panel("India Tenders", notices[half:]) + pager
+
+    # Detail pages
+
+    def worldbank_detail(self, request, i: int) -> str:
+        labels = [('Project ID', f"P{100000 + i}"), ('Status', 'Active'), ('Team Leader', f"Leader {i}"),
+                  ('Borrower', 'Ministry of Finance'), ('Approval Date', self.published(i).strftime('%B %d, %Y')),
+                  ('Region', 'Africa'), ('Commitment Amount', f"US$ {i * 1000:,}")]
+        fields = "".join(f"<div><label>{label}</label><p class='document-info'>{value}</p></div>" for label, value in labels)
+        return f"<div class='project-detail'>{fields}</div><div class='detail-download-section'>Downloads</div>"
+
+    def ebrd_detail(self, request, i: int) -> str:
+        labels = [('Procurement Ref No.', f"REF-{i}"), ('Location', COUNTRIES[i % len(COUNTRIES)]),
+                  ('Business Sector', SECTORS[i % len(SECTORS)]), ('Notice Type', 'Invitation for Tenders'),
+                  ('Issue Date', self.published(i).strftime('%d %b %Y')),
+                  ('Closing Date', (self.published(i) + timedelta(days=30)).strftime('%d %b %Y'))]
+        cards = "".join(f"<div class='project-overview__main-card'><div class='project-overview__card-title'>{label}</div>"
+                        f"<div class='project-overview__card-description'>{value}</div></div>" for label, value in labels)
+        return f"<div class='project-overview__projectID'>{50000 + i}</div>{cards}"
+
+    def isdb_detail(self, request, i: int) -> str:
+        values = {
+            'notice-type': 'General Procurement Notice',
+            'issue-date': self.published(i).strftime('%d %B %Y'),
+            'close-date': (self.published(i) + timedelta(days=30)).strftime('%d %B %Y'),
+            'tender-type': 'Goods',
+            'project-code': f"ISDB-{i}",
+            'project-title': f"Project {i}",
+            'email': f"procurement{i}@example.org",
+        }
+        fields = "".join(f"<div class='field--name-field-{name}'><div class='field--item'>{value}</div></div>"
+                         for name, value in values.items())
+        documents = (f"<div class='field--name-field-documents'><span class='file-link'>"
+                     f"<a href='{self.host(request)}/isdb/files/{i}.pdf'>Notice</a></span></div>")
+        return f"<div class='details'>{fields}{documents}</div>"
+
+    def afdb_detail(self, request, i: int) -> str:
+        sectors = "".join(f"<li><a>{SECTORS[(i + k) % len(SECTORS)]}</a></li>" for k in range(2))
+        return f"<h1>Notice {i}</h1><div id='block-views-keywords-block'><ul>{sectors}</ul></div>"
+
+    def afd_detail(self, request, i: int) -> str:
+        return (f"<div class='content'>Description of tender {i}</div>"
+                f"<p><span class='label'>Funding Agency</span><span>Agence Française de Développement</span></p>"
+                f"<p><span class='label'>Reference</span><span>AFD-{i}</span></p>"
+                f"<a href='/afd/download/{i}'>Tender document</a>")
+
+    def tendersinfo_detail(self, request, i: int) -> str:
+        labels = [('Tender TI Ref No', f"TI{i}"), ('Tender Date', self.published(i).strftime('%d %b %Y')),
+                  ('Tender Description', f"Supply of goods {i}"),
+                  ('Tender Deadline', (self.published(i) + timedelta(days=30)).strftime('%d %b %Y')),
+                  ('Tender Project Location', COUNTRIES[i % len(COUNTRIES)]),
+                  ('Tender Sector', SECTORS[i % len(SECTORS)])]
+        rows = "".join(f"<div class='form-group'><label>{label}</label><div><p>{html.escape(value)}</p></div></div>"
+                       for label, value in labels)
+        return f"<div class='form-horizontal'>{rows}</div>"
+
+    # World Bank search API
+
+    def worldbank_notices_api(self, request) -> Dict:
+        """Notices newest first from offset os (the date filters are left to the scraper)"""
+        rows = int(request.query.get('rows', '10'))
+        offset = int(request.query.get('os', '0'))
+        notices = [{
+            'id': f"OP{i:08d}",
+            'bid_description': f"Procurement notice {i}",
+            'project_ctry_name': COUNTRIES[i % len(COUNTRIES)],
+            'project_name': f"Project {i}",
+            'project_id': f"P{100000 + i}",
+            'notice_type': 'Request for Bids',
+            'notice_lang_name': 'English',
+            'noticedate': self.published(i).strftime('%d-%b-%Y'),
+        } for i in range(offset, min(offset + rows, self.notices))]
+        return {'rows': rows, 'os': offset, 'total': self.notices, 'procnotices': notices}
+
+    def worldbank_projects_api(self, request) -> Dict:
+        project_id = request.query.get('id', '')
+        i = int(project_id[1:]) - 100000 if project_id[1:].isdigit() else -1
+        if not 0 <= i < self.notices:
+            return {'projects': {}}
+        return {'projects': {project_id: {
+            'id': project_id, 'status': 'Active', 'teamleadname': [f"Leader {i}"],
+            'borrower': 'Ministry of Finance', 'boardapprovaldate': f"{self.published(i).isoformat()}T00:00:00Z",
+            'regionname': 'Africa', 'curr_total_commitment': f"{i}",
+        }}}
+
+    # Server
+
+    async def delay(self):
+        self.requests += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + (self.jitter * ((self.requests * 7919) % 100) / 100))
+
+    def page(self, body: str) -> web.Response:
+        return web.Response(text=f"<!DOCTYPE html><html><head><meta charset='utf-8'></head><body>{body}</body></html>",
+                            content_type='text/html')
+
+    def listing_handler(self, render: Callable[[web.Request, int], str]):
+        async def handler(request: web.Request) -> web.Response:
+            await self.delay()
+            page = int(request.query.get('page', '1'))
+            if page < 1 or page > self.page_count:
+                raise web.HTTPNotFound()
+            return self.page(render(request, page))
+        return handler
+
+    def detail_handler(self, render: Callable[[web.Request, int], str], offset: int = 0):
+        async def handler(request: web.Request) -> web.Response:
+            await self.delay()
+            i = int(request.match_info['i']) - offset
+            if not 0 <= i < self.notices:
+                raise web.HTTPNotFound()
+            return self.page(render(request, i))
+        return handler
+
+    def api_handler(self, render: Callable[[web.Request], Dict]):
+        async def handler(request: web.Request) -> web.Response:
+            await self.delay()
+            return web.json_response(render(request))
+        return handler
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        details: Dict[str, Callable] = {
+            'worldbank': self.worldbank_detail, 'ebrd': self.ebrd_detail, 'isdb': self.isdb_detail,
+            'afdb': self.afdb_detail, 'afd': self.afd_detail, 'tendersinfo': self.tendersinfo_detail,
+        }
+        listings: Dict[str, Callable] = {
+            'worldbank': self.worldbank_list, 'ebrd': self.ebrd_list, 'isdb': self.isdb_list,
+            'afdb': self.afdb_list, 'aiib': self.aiib_list, 'afd': self.afd_list,
+            'tendersinfo': self.tendersinfo_list,
+        }
+        for source, render in listings.items():
+            app.router.add_get(f"/{source}/list", self.listing_handler(render))
+        for source, render in details.items():
+            app.router.add_get(f"/{source}/notice/{{i:\\d+}}", self.detail_handler(render))
+        # World Bank details live on the project pages linked from each row
+        app.router.add_get("/worldbank/project/P{i:\\d+}", self.detail_handler(self.worldbank_detail, offset=100000))
+        app.router.add_get("/worldbank/api/procnotices", self.api_handler(self.worldbank_notices_api))
+        app.router.add_get("/worldbank/api/projects", self.api_handler(self.worldbank_projects_api))
+        return app
+
+
+async def serve(site: MockSite, host: str = '127.0.0.1', port: int = 8765) -> web.AppRunner:
+    """Start the mock site in the running event loop; stop it with `await runner.cleanup()`"""
+    runner = web.AppRunner(site.app(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info(f"Mock site on http://{host}:{port}: {site.notices} notices per source, "
+                f"{site.page_count} pages of {site.page_size}")
+    return runner
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Serve synthetic procurement listings for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--notices", type=int, default=500, help="notices per source")
+    parser.add_argument("--page-size", type=int, default=20, help="notices per listing page")
+    parser.add_argument("--latency", type=float, default=0.0, help="milliseconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many more milliseconds per response")
+    parser.add_argument("--days", type=int, default=30, help="publish dates spread over the last DAYS days")
+    return parser.parse_args()
+
+
+async def main(args):
+    site = MockSite(args.notices, args.page_size, args.latency / 1000, args.jitter / 1000, args.days)
+    runner = await serve(site, args.host, args.port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(main(parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,194 @@
+# benchmarks/run.py
+"""
+Benchmark every scraper against the local mock site at several scales.
+
+For each notice count the mock site is served from this process and each
+source is scraped in its own worker process (so peak RSS is per scraper),
+streaming rows with iter_rows and writing nothing. Reports listing pages/sec,
+detail fetches/sec, peak RSS and wall time per source and scale.
+
+    python -m benchmarks.run --notices 50 500 5000 50000 --page-size 20 --latency 50
+    python -m benchmarks.run --sources WorldBank AFD --notices 1000 --output bench.json
+
+Runs headless and needs no network; the listing page caps of World Bank and
+AfDB are lifted so every scale is crawled to the end.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import resource
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List
+from benchmarks.mock_site import MockSite, serve
+from src.config.settings import BROWSER_ARGS, MAX_GLOBAL_PAGES
+from src.scrapers.afd_scraper import AFDScraper
+from src.scrapers.afdb_scraper import AfDBScraper
+from src.scrapers.aiib_scraper import AIIBScraper
+from src.scrapers.ebrd_scraper import EBRDScraper
+from src.scrapers.isdb_scraper import ISDBScraper
+from src.scrapers.tenders_info_scraper import TendersInfoScraper
+from src.scrapers.world_bank_scraper import WorldBankScraper
+from src.utils.browser_pool import BrowserPool
+from src.utils.date_window import DateWindow
+
+logger = logging.getLogger(__name__)
+
+# Source name -> (scraper class, mock site path)
+SOURCES = {
+    "WorldBank": (WorldBankScraper, "worldbank"),
+    "EBRD": (EBRDScraper, "ebrd"),
+    "TendersInfo": (TendersInfoScraper, "tendersinfo"),
+    "ISDB": (ISDBScraper, "isdb"),
+    "AfDB": (AfDBScraper, "afdb"),
+    "AIIB": (AIIBScraper, "aiib"),
+    "AFD": (AFDScraper, "afd"),
+}
+
+# Search API endpoints of the mock site, so World Bank's API mode never leaves it
+API_OPTIONS = {
+    "WorldBank": {'notices_api': "/worldbank/api/procnotices", 'projects_api': "/worldbank/api/projects"},
+}
+
+COLUMNS = [
+    ('source', 'source', '{}'), ('notices', 'notices', '{}'), ('pages', 'listing_pages', '{:.0f}'),
+    ('rows', 'rows', '{}'), ('details', 'detail_fetches', '{:.0f}'), ('wall s', 'wall_seconds', '{:.1f}'),
+    ('pages/s', 'pages_per_second', '{:.2f}'), ('details/s', 'details_per_second', '{:.2f}'),
+    ('RSS MB', 'peak_rss_mb', '{:.0f}'), ('child MB', 'peak_child_rss_mb', '{:.0f}'),
+]
+
+
+def max_rss_mb(who: int) -> float:
+    """Peak resident set size in MB (ru_maxrss is KB on Linux, bytes on macOS)"""
+    rss = resource.getrusage(who).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+async def run_worker(source: str, base: str, since: date, until: date, http_details: bool) -> Dict:
+    """Scrape one source from the mock site and measure it (runs in the worker process)"""
+    scraper_class, path = SOURCES[source]
+    checkpoint_dir = tempfile.mkdtemp(prefix="bench-checkpoints-")
+    async with BrowserPool(max_browsers=1, max_contexts_per_browser=1, max_pages=MAX_GLOBAL_PAGES,
+                           headless=True, launch_args=BROWSER_ARGS) as browser_pool:
+        scraper = scraper_class(
+            f"{base}/{path}/list?page=1",
+            browser_pool=browser_pool,
+            date_window=DateWindow(since, until),
+            incremental=False,
+            use_http_cache=False,
+            http_details=http_details,
+            # Scaling runs never touch the real checkpoints
+            checkpoint_dir=Path(checkpoint_dir),
+            **{option: base + endpoint for option, endpoint in API_OPTIONS.get(source, {}).items()}
+        )
+        # Scaling runs crawl every page
+        scraper.MAX_LISTING_PAGES = None
+
+        started = time.perf_counter()
+        rows = 0
+        async for _ in scraper.iter_rows():
+            rows += 1
+        wall = time.perf_counter() - started
+
+    counters = scraper.collect_metrics().counters
+    pages = counters.get('listing_pages', 0)
+    details = counters.get('detail_http_pages', 0) + counters.get('detail_browser_pages', 0)
+    return {
+        'source': source,
+        'rows': rows,
+        'listing_pages': pages,
+        'detail_fetches': details,
+        'wall_seconds': wall,
+        'pages_per_second': pages / wall if wall else 0.0,
+        'details_per_second': details / wall if wall else 0.0,
+        'peak_rss_mb': max_rss_mb(resource.RUSAGE_SELF),
+        # Largest finished child process, i.e. the browser's biggest process
+        'peak_child_rss_mb': max_rss_mb(resource.RUSAGE_CHILDREN),
+        'counters': counters,
+    }
+
+
+async def run_source(source: str, base: str, site: MockSite, http_details: bool) -> Dict:
+    """Run one source's worker process and return its measurements"""
+    command = [sys.executable, '-m', 'benchmarks.run', '--worker', source, '--base', base,
+               '--since', site.since.isoformat(), '--until', site.today.isoformat()]
+    if not http_details:
+        command.append('--browser-details')
+    process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE)
+    stdout, _ = await process.communicate()
+    if process.returncode != 0:
+        logger.error(f"{source} benchmark failed (exit code {process.returncode})")
+        return {'source': source, 'notices': site.notices, 'error': process.returncode}
+    result = json.loads(stdout.decode().strip().splitlines()[-1])
+    result['notices'] = site.notices
+    return result
+
+
+async def run_benchmarks(args) -> List[Dict]:
+    results = []
+    for notices in args.notices:
+        site = MockSite(notices, args.page_size, args.latency / 1000, args.jitter / 1000, args.days)
+        runner = await serve(site, '127.0.0.1', args.port)
+        try:
+            for source in args.sources:
+                logger.info(f"Benchmarking {source} with {notices} notices")
+                result = await run_source(source, f"http://127.0.0.1:{args.port}", site, not args.browser_details)
+                results.append(result)
+                print(format_row(result), flush=True)
+        finally:
+            await runner.cleanup()
+    return results
+
+
+def format_row(result: Dict) -> str:
+    if 'error' in result:
+        return f"{result['source']:<12} {result['notices']:>8}  failed (exit code {result['error']})"
+    cells = [fmt.format(result[key]) for _, key, fmt in COLUMNS]
+    return f"{cells[0]:<12}" + "".join(f"{cell:>10}" for cell in cells[1:])
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers against the local mock site")
+    parser.add_argument("--sources", nargs="+", choices=list(SOURCES), default=list(SOURCES))
+    parser.add_argument("--notices", nargs="+", type=int, default=[50, 500], help="notice counts to run, per source")
+    parser.add_argument("--page-size", type=int, default=20, help="notices per listing page")
+    parser.add_argument("--latency", type=float, default=0.0, help="milliseconds added to every mock response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many more milliseconds per response")
+    parser.add_argument("--days", type=int, default=30, help="publish dates spread over the last DAYS days")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--browser-details", action="store_true",
+                        help="render every detail page in the browser instead of the HTTP fast path")
+    parser.add_argument("--output", type=Path, help="also write the results as JSON")
+    parser.add_argument("--verbose", action="store_true")
+    # Internal: run one source in a worker process
+    parser.add_argument("--worker", choices=list(SOURCES), help=argparse.SUPPRESS)
+    parser.add_argument("--base", help=argparse.SUPPRESS)
+    parser.add_argument("--since", type=date.fromisoformat, help=argparse.SUPPRESS)
+    parser.add_argument("--until", type=date.fromisoformat, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    # Logs go to stderr, a worker's stdout is its JSON result
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, stream=sys.stderr)
+
+    if args.worker:
+        result = asyncio.run(run_worker(args.worker, args.base, args.since, args.until, not args.browser_details))
+        print(json.dumps(result))
+        return
+
+    print(f"{COLUMNS[0][0]:<12}" + "".join(f"{title:>10}" for title, _, _ in COLUMNS[1:]))
+    results = asyncio.run(run_benchmarks(args))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
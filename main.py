@@ -1,8 +1,9 @@
 # main.py
 
+import argparse
 import asyncio
 import logging
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from src.scrapers.world_bank_scraper import WorldBankScraper
 from src.scrapers.ebrd_scraper import EBRDScraper
@@ -11,74 +12,211 @@ from src.scrapers.isdb_scraper import ISDBScraper
 from src.scrapers.afdb_scraper import AfDBScraper
 from src.scrapers.aiib_scraper import AIIBScraper
 from src.scrapers.afd_scraper import AFDScraper
+from src.utils.browser_pool import BrowserPool
+from src.utils.http_cache import HttpCache
+from src.utils.date_window import DateWindow, record_successful_run
 from src.utils.logging_utils import setup_logging
-from src.config.settings import WORLD_BANK_URL, EBRD_URL, TENDERS_INFO_URL, ISDB_URL, AFDB_URL, AIIB_URL, AFD_URL, OUTPUT_DIR
+from src.utils.metrics import write_prometheus, write_run_report
+from src.utils.seen_index import SeenIndex
+from src.utils.traffic import RECORD, REPLAY, TrafficArchive
+from src.storage.sink import ResultSink
+from src.storage.writers import make_writers
+from src.config.settings import (
+    WORLD_BANK_URL, EBRD_URL, TENDERS_INFO_URL, ISDB_URL, AFDB_URL, AIIB_URL, AFD_URL, OUTPUT_DIR, OUTPUT_WRITERS,
+    HEADLESS, BROWSER_ARGS, MAX_CONCURRENT_SOURCES, MAX_BROWSERS, MAX_CONTEXTS_PER_BROWSER,
+    MAX_GLOBAL_PAGES, SOURCE_CONCURRENCY, METRICS_PROMETHEUS_PATH, HTTP_CACHE, INCREMENTAL
+)
 
 logger = logging.getLogger(__name__)
 
-async def run_scraper(scraper_class, url, site_name):
-    """Run a specific scraper"""
+# (scraper class, start URL, site name) for every source in a full sweep
+SCRAPERS = [
+    (WorldBankScraper, WORLD_BANK_URL, "WorldBank"),
+    (EBRDScraper, EBRD_URL, "EBRD"),
+    (TendersInfoScraper, TENDERS_INFO_URL, "TendersInfo"),
+    (ISDBScraper, ISDB_URL, "ISDB"),
+    (AfDBScraper, AFDB_URL, "AfDB"),
+    (AIIBScraper, AIIB_URL, "AIIB"),
+    (AFDScraper, AFD_URL, "AFD"),
+]
+
+async def run_scraper(scraper_class, url, site_name, browser_pool=None, seen_index=None, writers=None,
+                      resume=False, window_options=None, run_metrics=None, http_cache=None,
+                      traffic_mode=None):
+    """
+    Run a specific scraper, streaming its rows to every configured output writer.
+
+    window_options are passed to DateWindow.from_settings (since, until, days,
+    since_last_run) to override the configured date window. The scraper's
+    metrics are appended to run_metrics, or written as their own run report
+    when no list is given. traffic_mode "record" captures the source's
+    traffic and "replay" runs it offline from that capture.
+    """
+    own_writers = writers is None
+    scraper = None
+    sink = None
+    success = False
+    rows = 0
     try:
+        if own_writers:
+            writers = make_writers(OUTPUT_WRITERS)
+
         # Initialize and run scraper
-        scraper = scraper_class(url)
-        df = await scraper.scrape_data()
-        
-        if not df.empty:
-            # Save results to CSV
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = OUTPUT_DIR / f"{site_name}_data_{timestamp}.csv"
-            df.to_csv(output_path, index=False)
-            logger.info(f"{site_name} data saved to {output_path}")
-            return len(df)
+        traffic = TrafficArchive(scraper_class.SOURCE_NAME, traffic_mode) if traffic_mode else None
+        date_window = DateWindow.from_settings(scraper_class.SOURCE_NAME, **(window_options or {}))
+        if traffic is not None and traffic.date_window is not None and not window_options:
+            # A replay only has the listing pages the recorded run's window reached
+            date_window = traffic.date_window
+        scraper = scraper_class(
+            url,
+            browser_pool=browser_pool,
+            max_concurrent_pages=SOURCE_CONCURRENCY.get(site_name),
+            seen_index=seen_index,
+            http_cache=http_cache,
+            resume=resume,
+            date_window=date_window,
+            # Recordings capture the whole window, replays must not depend on earlier runs
+            incremental=INCREMENTAL and traffic is None,
+            traffic=traffic
+        )
+        sink = ResultSink(scraper, writers)
+        rows = await sink.consume(scraper.iter_rows())
+        # Only a complete live crawl up to today moves the start of the next --since-last-run
+        # window, to the end of the window it covered; backfills and truncated crawls leave it
+        if traffic_mode != REPLAY:
+            if not scraper.crawl_complete:
+                logger.warning(f"{site_name}: crawl incomplete ({scraper.incomplete_reason}), "
+                               f"last successful run not updated")
+            elif date_window.until == date.today():
+                record_successful_run(scraper_class.SOURCE_NAME, date_window.until)
+        success = True
+
+        if rows:
+            logger.info(f"{site_name}: {rows} rows saved")
         else:
             logger.info(f"No data to save for {site_name}")
-            return 0
-            
+        return rows
+
     except Exception as e:
         logger.error(f"Error running {site_name} scraper: {str(e)}")
-        return 0
+        # Batches flushed before the error are kept
+        rows = sink.written if sink else 0
+        return rows
+
+    finally:
+        if own_writers and writers:
+            for writer in writers:
+                writer.close()
+        if scraper is not None:
+            metrics = scraper.collect_metrics()
+            metrics.set("rows_written", rows)
+            metrics.finish(success)
+            logger.info(f"{site_name} metrics: {metrics.summary()}")
+            if run_metrics is not None:
+                run_metrics.append(metrics)
+            else:
+                write_metrics([metrics])
+
+def write_metrics(run_metrics):
+    """Write the run's JSON report, and the Prometheus file when METRICS_PROMETHEUS_PATH is set"""
+    try:
+        write_run_report(run_metrics)
+        if METRICS_PROMETHEUS_PATH:
+            write_prometheus(run_metrics, METRICS_PROMETHEUS_PATH)
+    except OSError as e:
+        logger.warning(f"Could not write run metrics: {str(e)}")
+
+async def run_all(scrapers=SCRAPERS, resume=False, window_options=None, traffic_mode=None):
+    """Run all sources concurrently on one shared browser pool"""
+    source_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
+    seen_index = SeenIndex()
+    # Recording and replaying must see every request, so they run without the cache
+    http_cache = HttpCache() if HTTP_CACHE and not traffic_mode else None
+    writers = make_writers(OUTPUT_WRITERS)
+    run_metrics = []
 
-async def main():
+    async def run_limited(scraper_class, url, site_name, browser_pool):
+        async with source_semaphore:
+            started = datetime.now()
+            rows = await run_scraper(scraper_class, url, site_name, browser_pool, seen_index, writers, resume,
+                                     window_options, run_metrics, http_cache, traffic_mode)
+            elapsed = (datetime.now() - started).total_seconds()
+            logger.info(f"{site_name} finished in {elapsed:.1f}s with {rows} rows")
+            return rows
+
+    async with BrowserPool(
+        max_browsers=MAX_BROWSERS,
+        max_contexts_per_browser=MAX_CONTEXTS_PER_BROWSER,
+        max_pages=MAX_GLOBAL_PAGES,
+        headless=HEADLESS,
+        launch_args=BROWSER_ARGS
+    ) as browser_pool:
+        results = await asyncio.gather(*[
+            run_limited(scraper_class, url, site_name, browser_pool)
+            for scraper_class, url, site_name in scrapers
+        ])
+
+    seen_index.close()
+    if http_cache is not None:
+        http_cache.close()
+    for writer in writers:
+        writer.close()
+    write_metrics(run_metrics)
+    return sum(results)
+
+async def main(resume=False, window_options=None, traffic_mode=None):
     """Main function to run all scrapers"""
     # Set up logging
     setup_logging()
-    
+
     # Create output directory if it doesn't exist
     Path(OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
-    
-    # Run scrapers sequentially instead of concurrently to avoid browser issues
-    total_rows = 0
-    
-    # Run World Bank scraper
-    rows = await run_scraper(WorldBankScraper, WORLD_BANK_URL, "WorldBank")
-    total_rows += rows
-    
-    # Run EBRD scraper
-    rows = await run_scraper(EBRDScraper, EBRD_URL, "EBRD")
-    total_rows += rows
-    
-    # Run TendersInfo scraper
-    rows = await run_scraper(TendersInfoScraper, TENDERS_INFO_URL, "TendersInfo")
-    total_rows += rows
-    
-    # Run ISDB scraper
-    rows = await run_scraper(ISDBScraper, ISDB_URL, "ISDB")
-    total_rows += rows
-    
-    # Run AfDB scraper
-    rows = await run_scraper(AfDBScraper, AFDB_URL, "AfDB")
-    total_rows += rows
-    
-    # Run AIIB scraper
-    rows = await run_scraper(AIIBScraper, AIIB_URL, "AIIB")
-    total_rows += rows
-    
-    # Run AFD scraper
-    rows = await run_scraper(AFDScraper, AFD_URL, "AFD")
-    total_rows += rows
-    
+
+    # Run all scrapers concurrently, sharing one Playwright instance
+    started = datetime.now()
+    total_rows = await run_all(resume=resume, window_options=window_options, traffic_mode=traffic_mode)
+    elapsed = (datetime.now() - started).total_seconds()
+
     # Log summary of results
-    logger.info(f"Scraping completed. Total rows extracted: {total_rows}")
+    logger.info(f"Scraping completed in {elapsed:.1f}s. Total rows extracted: {total_rows}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scrape procurement notices from every source")
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="continue each source from the checkpoint left by a failed run instead of page 1"
+    )
+    parser.add_argument("--since", type=date.fromisoformat, metavar="YYYY-MM-DD", help="oldest publish date to scrape")
+    parser.add_argument("--until", type=date.fromisoformat, metavar="YYYY-MM-DD", help="newest publish date to scrape (default: today)")
+    parser.add_argument("--days", type=int, help="scrape the last DAYS days when --since is not given")
+    parser.add_argument(
+        "--since-last-run", action="store_true", default=None,
+        help="start each source's window at its last successful run"
+    )
+    traffic = parser.add_mutually_exclusive_group()
+    traffic.add_argument(
+        "--record", dest="traffic_mode", action="store_const", const=RECORD,
+        help="record each source's traffic under TRAFFIC_DIR for offline replays"
+    )
+    traffic.add_argument(
+        "--replay", dest="traffic_mode", action="store_const", const=REPLAY,
+        help="run from the traffic recorded by --record, without any network access"
+    )
+    args = parser.parse_args()
+    if args.since and args.until and args.since > args.until:
+        parser.error("--since must not be after --until")
+    return args
+
+def window_options(args) -> dict:
+    """Date window overrides given on the command line (settings are used for the rest)"""
+    options = {
+        'since': args.since,
+        'until': args.until,
+        'days': args.days,
+        'since_last_run': args.since_last_run,
+    }
+    return {key: value for key, value in options.items() if value is not None}
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    args = parse_args()
+    asyncio.run(main(resume=args.resume, window_options=window_options(args), traffic_mode=args.traffic_mode))
\ No newline at end of file
@@ -9,18 +9,139 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = BASE_DIR / 'data'
 RAW_DATA_DIR = DATA_DIR / 'raw'
 PROCESSED_DATA_DIR = DATA_DIR / 'processed'
+STATE_DIR = DATA_DIR / 'state'
+
+# Incremental scraping: skip notices recorded in the seen index by earlier runs
+INCREMENTAL = True
+SEEN_INDEX_PATH = STATE_DIR / 'seen_notices.db'
+
+# Publish date window scraped by every source; listings are newest first, so
+# pagination stops at the first notice older than the window
+DATE_WINDOW_DAYS = 7  # Window length ending at DATE_UNTIL when DATE_SINCE is not set
+DATE_SINCE = None  # ISO date "YYYY-MM-DD", or None
+DATE_UNTIL = None  # ISO date "YYYY-MM-DD", or None for today
+SINCE_LAST_RUN = False  # Start each source's window at its last successful run instead
+LAST_RUNS_PATH = STATE_DIR / 'last_runs.json'
+
+# Consolidated tender store: one row per (source, notice), upserted by every run
+TENDER_STORE_PATH = DATA_DIR / 'tenders.db'
+
+# Canonical datetime64 publish date added next to each source's raw date string
+PUBLISHED_ON_COLUMN = 'published_on'
+
+# Where run_scraper writes each source's rows: any of "store", "csv" (timestamped
+# per-run files in OUTPUT_DIR) and "parquet" (needs pyarrow)
+OUTPUT_WRITERS = ['store']
+PARQUET_DIR = DATA_DIR / 'parquet'  # Partitioned by source and publish month
+
+# Streaming output: rows are flushed to the writers in batches while a source is still running
+SINK_BATCH_SIZE = 100  # Rows per flush
+STREAM_QUEUE_PAGES = 4  # Listing pages buffered between a scraper and its sink
+
+# Checkpoints of streamed crawls, used by `python main.py --resume` after a failed run
+CHECKPOINT_DIR = STATE_DIR / 'checkpoints'
+CHECKPOINT_MAX_AGE_HOURS = 24  # Older checkpoints are ignored, the listings will have shifted
 
 # Logging
 LOG_DIR = BASE_DIR / 'logs'
 LOG_FILE = LOG_DIR / 'scraper.log'
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
+# Run metrics: per-source counters and phase timings, written as one JSON report per run
+METRICS_DIR = DATA_DIR / 'metrics'
+# Also write them in Prometheus text format here (e.g. node_exporter's textfile
+# collector directory), or None
+METRICS_PROMETHEUS_PATH = None
+
 # Output directory for scraped data
 OUTPUT_DIR = PROCESSED_DATA_DIR
 
 # Browser settings
 HEADLESS = False  # Set to True for production
 TIMEOUT = 60000  # milliseconds
+BROWSER_ARGS = []  # Launch args of every pooled browser (scrapers add their own LAUNCH_ARGS)
+
+# Resource blocking: browser requests the scrapers never read are aborted
+# (scrapers can allowlist URLs a site really needs with RESOURCE_ALLOWLIST)
+BLOCK_RESOURCES = True
+BLOCKED_RESOURCE_TYPES = ['image', 'media', 'font']
+BLOCKED_DOMAINS = [
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'googlesyndication.com',
+    'facebook.net', 'connect.facebook.com', 'hotjar.com', 'clarity.ms', 'nr-data.net',
+    'newrelic.com', 'linkedin.com', 'twitter.com', 'addthis.com', 'sharethis.com',
+    'youtube.com', 'vimeo.com', 'siteimproveanalytics.com', 'siteimproveanalytics.io',
+]
+
+# HTTP fast path: fetch static detail pages without a browser, falling back to it when JS is needed
+HTTP_DETAILS = True
+HTTP_TIMEOUT = 30  # seconds
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_CONNECTIONS_PER_HOST = 5
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# On-disk cache of detail pages fetched over HTTP: entries younger than their source's TTL
+# are used without a request, older ones are revalidated with If-None-Match /
+# If-Modified-Since, and a 304 reuses the cached fields without re-parsing
+HTTP_CACHE = True
+HTTP_CACHE_PATH = DATA_DIR / 'http_cache.db'
+HTTP_CACHE_TTL_HOURS = 24
+# Per-source TTL overrides (hours)
+SOURCE_CACHE_TTL_HOURS = {
+    "WorldBank": 72,  # Project pages rarely change once published
+    "TendersInfo": 12,
+}
+
+# Recorded traffic for offline runs and reproducible benchmarks (main.py --record / --replay):
+# each source's browser traffic as HAR plus its HTTP fast-path responses
+TRAFFIC_DIR = DATA_DIR / 'traffic'
+
+# Orchestrator settings (all sources run concurrently on one Playwright instance)
+MAX_CONCURRENT_SOURCES = 7  # Global limit on sources scraped at the same time
+MAX_BROWSERS = 2  # Chromium instances in the shared pool
+MAX_CONTEXTS_PER_BROWSER = 4  # Browser contexts per pooled Chromium instance
+MAX_GLOBAL_PAGES = 20  # Detail pages open at once across all sources (idle pooled pages included)
+IDLE_PAGE_TIMEOUT = 30  # Seconds a pooled page stays open unused (closed sooner when other sources wait for one)
+
+# Listings whose pages have their own URL (?page=N) are read this many pages at once
+# on pooled pages, ahead of the page being processed (1: click through page by page)
+PARALLEL_LISTING_PAGES = 4
+
+# Adaptive per-host concurrency (AIMD): detail requests to a host start at the
+# source's concurrency below, grow while responses stay fast and healthy, and
+# halve on timeouts, 429/5xx responses or latency far above the host's baseline
+ADAPTIVE_CONCURRENCY = True
+ADAPTIVE_MIN_CONCURRENCY = 1
+ADAPTIVE_MAX_CONCURRENCY = 16  # Also the number of detail workers per source
+ADAPTIVE_LATENCY_FACTOR = 3.0  # Latency above this multiple of the baseline counts as congestion
+
+# Per-source concurrent detail pages (overrides the module default); the starting
+# point of the adaptive limit, or a fixed limit when ADAPTIVE_CONCURRENCY is off
+SOURCE_CONCURRENCY = {
+    "WorldBank": 5,
+    "EBRD": 5,
+    "TendersInfo": 5,
+    "ISDB": 5,
+    "AfDB": 5,
+    "AIIB": 10,
+    "AFD": 5,
+}
+
+# Navigation retries: exponential backoff with full jitter, capped per source by a
+# retry budget; a per-source circuit breaker stops navigating to a host that is down
+RETRY_ATTEMPTS = 3  # Attempts per navigation, including the first
+RETRY_BASE_DELAY = 1.0  # Seconds, doubled per attempt (the actual wait is jittered below it)
+RETRY_MAX_DELAY = 30.0
+RETRY_BUDGET_RATIO = 0.2  # Retries allowed per navigation made, on top of RETRY_BUDGET_MIN
+RETRY_BUDGET_MIN = 10
+CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive failed navigations that open the circuit
+CIRCUIT_RESET_TIMEOUT = 60  # Seconds before a trial navigation is let through
+
+# World Bank: read procurement notices and project details from the JSON search API
+# behind the site instead of rendering its Angular table (the table is the fallback)
+WORLD_BANK_API = True
+WORLD_BANK_NOTICES_API = "https://search.worldbank.org/api/v2/procnotices"
+WORLD_BANK_PROJECTS_API = "https://search.worldbank.org/api/v2/projects"
+WORLD_BANK_API_PAGE_SIZE = 100  # Notices per API request
 
 # Site URLs
 WORLD_BANK_URL = "https://projects.worldbank.org/en/projects-operations/procurement?srce=both"
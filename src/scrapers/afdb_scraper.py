@@ -266,159 +266,93 @@
 
 # src/scrapers/afdb_scraper.py
 
-from playwright.async_api import async_playwright
-import asyncio
-from datetime import datetime, timedelta
-import pandas as pd
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional
 from src.scrapers.base_scraper import BaseScraper
-from src.utils.date_utils import normalize_date, format_date_for_site
+from src.utils.html_extract import Field, SelectorMap
 
 logger = logging.getLogger(__name__)
 
-# Number of concurrent detail page processing
-MAX_CONCURRENT_PAGES = 5
-
 class AfDBScraper(BaseScraper):
-    def __init__(self, base_url: str):
-        super().__init__(base_url)
-        # Format today's date and date from a week ago
-        self.today = datetime.now()
-        # AfDB format is like "18-Apr-2025"
-        self.today_str = self.today.strftime("%d-%b-%Y")
-        
-        # Calculate the date from a week ago
-        self.week_ago = self.today - timedelta(days=7)
-        self.week_ago_str = self.week_ago.strftime("%d-%b-%Y")
-        
-        self.results = []
+    SOURCE_NAME = "AfDB"
+
+    # Browser settings
+    CONCURRENT_PAGES = 5  # Concurrent detail pages
+    MAX_LISTING_PAGES = 10  # Process up to 10 pages as specified
+
+    LISTING_READY_SELECTOR = ".views-bootstrap-grid-plugin-style .row"
+    # Drupal pager with ?page=N links, so listing pages are read several at once
+    NEXT_PAGE_SELECTOR = "li.next a[title='Go to next page']"
+    PAGE_PARAM = "page"
+
+    # Detail page fields: sectors are the links in the "related sections" block
+    DETAIL_SELECTORS = SelectorMap({
+        'sectors': Field("#block-views-keywords-block ul li a", many=True),
+    }, ready_selector="#block-views-keywords-block")
+
+    # Every grid item as a plain object
+    LISTING_SCRIPT = """
+        () => Array.from(document.querySelectorAll('.views-bootstrap-grid-plugin-style .row > div')).map(item => {
+            const date = item.querySelector('div.field-content span.date-display-single');
+            const link = item.querySelector('span.field-content a');
+            return {
+                publish_date: date ? date.innerText : null,
+                title: link ? link.innerText : null,
+                href: link ? link.getAttribute('href') : null
+            };
+        })
+    """
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(base_url, **kwargs)
         # Extract the base domain from the URL
         self.domain = '/'.join(base_url.split('/')[:3])  # Get "https://www.afdb.org"
-        self.semaphore = None  # Will be initialized in scrape_data
         
         logger.info(f"AfDB scraper initialized with base domain: {self.domain}")
-        logger.info(f"Date range: {self.week_ago_str} to {self.today_str}")
-
-    async def init_browser(self):
-        """Initialize browser instance"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=False)
-        self.context = await self.browser.new_context()
-        self.context.set_default_timeout(60000)  # 60 seconds timeout
-        self.page = await self.context.new_page()
-        # Create a semaphore to limit concurrent pages
-        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
-
-    async def close_browser(self):
-        """Close browser instance"""
-        await self.context.close()
-        await self.browser.close()
-        await self.playwright.stop()
-
-    async def is_date_in_range(self, date_text: str) -> bool:
-        """Check if a date is within our specified range (week_ago to today)"""
-        try:
-            # AfDB format is like "18-Apr-2025"
-            date_obj = datetime.strptime(date_text.strip(), "%d-%b-%Y")
-            return self.week_ago <= date_obj <= self.today
-        except ValueError as e:
-            logger.warning(f"Could not parse date: {date_text}. Error: {str(e)}")
-            return False
-            
-    async def is_date_older_than_range(self, date_text: str) -> bool:
-        """Check if a date is older than our range"""
-        try:
-            date_obj = datetime.strptime(date_text.strip(), "%d-%b-%Y")
-            return date_obj < self.week_ago
-        except ValueError:
-            return False
 
     async def extract_sector_info(self, detail_url: str) -> str:
         """Extract sector information from the detail page"""
-        detail_page = None
         try:
-            # Use semaphore to limit concurrent pages
-            async with self.semaphore:
-                # Create a new page for the detail view
-                detail_page = await self.context.new_page()
-                await detail_page.goto(detail_url)
-                await detail_page.wait_for_load_state("networkidle")
-                
-                # Find the related sections block
-                related_sections = await detail_page.query_selector('#block-views-keywords-block')
-                
-                if not related_sections:
-                    logger.warning(f"Related sections block not found on {detail_url}")
-                    return "N/A"
-                
-                # Extract all li elements within the related sections
-                sector_items = await related_sections.query_selector_all("ul li a")
-                
-                sectors = []
-                for item in sector_items:
-                    sector_text = await item.inner_text()
-                    sectors.append(sector_text.strip())
-                
-                # Join sectors with dash
-                result = " - ".join(sectors)
-                logger.debug(f"Extracted sectors: {result}")
-                return result
-                
+            fields = await self.fetch_detail_fields(detail_url, self.read_sector_info)
+            if not fields or 'sectors' not in fields:
+                logger.warning(f"Related sections block not found on {detail_url}")
+                return "N/A"
+
+            # Join sectors with dash
+            result = " - ".join(fields['sectors'])
+            logger.debug(f"Extracted sectors: {result}")
+            return result
+
         except Exception as e:
             logger.error(f"Error extracting sector info from {detail_url}: {str(e)}")
             return "N/A"
-        finally:
-            if detail_page:
-                await detail_page.close()
-
-    async def process_row_batch(self, rows):
-        """Process a batch of table rows in parallel"""
-        tasks = []
-        for row in rows:
-            tasks.append(self.process_row(row))
-        
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks)
-        
-        # Filter out None results and "STOP_SEARCH" signals
-        filtered_results = []
-        should_stop = False
-        
-        for result in results:
-            if result == "STOP_SEARCH":
-                should_stop = True
-            elif result is not None:
-                filtered_results.append(result)
-        
-        return filtered_results, should_stop
 
-    async def process_row(self, row) -> Optional[Dict]:
-        """Process a single row from the table"""
+    async def read_sector_info(self, detail_page, detail_url: str) -> Optional[Dict]:
+        """Read sector information on a pooled detail worker page"""
+        await self.open_detail(detail_page, detail_url)
+
+        fields = await self.read_rendered_fields(detail_page)
+        # Only report sectors when the related sections block exists at all
+        if not await detail_page.query_selector('#block-views-keywords-block'):
+            fields.pop('sectors', None)
+        return fields
+
+    async def process_row(self, row: Dict) -> Optional[Dict]:
+        """Process a single grid item read from the page (already known to be in our date range)"""
         try:
-            # Extract date from the row
-            date_cell = await row.query_selector("div.field-content span.date-display-single")
-            if not date_cell:
-                return None
-                
-            publish_date = await date_cell.inner_text()
-            publish_date = publish_date.strip()
+            # Publication date of the item
+            publish_date = row['publish_date'].strip()
             
-            # Check if date is older than our range (signal to stop searching further pages)
-            if await self.is_date_older_than_range(publish_date):
-                return "STOP_SEARCH"
+            # Title text and link
+            if not row['href']:
+                return None
                 
-            # Check if date is in our range
-            if not await self.is_date_in_range(publish_date):
+            # Skip notices already scraped by an earlier run
+            if self.is_known_notice(row['href']):
                 return None
             
-            # Extract title cell and link
-            title_cell = await row.query_selector("span.field-content a")
-            if not title_cell:
-                return None
-                
-            title_text = await title_cell.inner_text()
-            title_link = await title_cell.get_attribute('href')
+            title_text = row['title']
+            title_link = row['href']
             
             # Get full URL for the detail page
             if title_link.startswith('/'):
@@ -448,71 +382,33 @@ class AfDBScraper(BaseScraper):
             logger.error(f"Error processing row: {str(e)}")
             return None
 
-    async def extract_table_data(self) -> Tuple[List[Dict], bool]:
-        """Extract data from the current page's grid items"""
+    async def extract_table_data(self) -> List[Dict]:
+        """Read the current page's grid items in our date range"""
         try:
             # Wait for the grid to be visible (based on code1.txt structure)
             await self.page.wait_for_selector(".views-bootstrap-grid-plugin-style .row", state="visible")
             
-            # Get all grid items (column divs) from the grid
-            grid_items = await self.page.query_selector_all(".views-bootstrap-grid-plugin-style .row > div")
-            logger.info(f"Found {len(grid_items)} grid items")
-            
-            if not grid_items:
-                return [], False
-            
-            # Process grid items in parallel batches
-            batch_size = MAX_CONCURRENT_PAGES
-            all_results = []
-            
-            for i in range(0, len(grid_items), batch_size):
-                batch = grid_items[i:i+batch_size]
-                logger.info(f"Processing batch {i//batch_size + 1} ({len(batch)} rows)")
-                
-                batch_results, should_stop = await self.process_row_batch(batch)
-                all_results.extend(batch_results)
-                
-                logger.info(f"Found {len(batch_results)} matching rows in this batch")
-                
-                if should_stop:
-                    return all_results, True
-            
-            return all_results, False
+            # Read all grid items (column divs) from the grid
+            return self.select_listing_items(await self.read_listing_rows())
             
         except Exception as e:
             logger.error(f"Error extracting grid data: {str(e)}")
-            return [], False
+            self.mark_incomplete("could not read a listing page")
+            return []
 
-    async def check_page_for_date_range(self) -> Tuple[bool, bool]:
-        """
-        Check if the current page has dates in our range and if we should stop searching
+    def select_listing_items(self, grid_items: List[Dict]) -> List[Dict]:
+        """A listing page's grid items in our date range, read here or ahead by URL"""
+        logger.info(f"Found {len(grid_items)} grid items")
         
-        Returns:
-            Tuple[bool, bool]: (has_matches, should_stop_searching)
-        """
-        try:
-            # Get all date elements on the page
-            date_elems = await self.page.query_selector_all("span.date-display-single")
-            
-            has_matches = False
-            should_stop_searching = False
-            
-            for elem in date_elems:
-                date_text = await elem.inner_text()
-                date_text = date_text.strip()
-                
-                # Check if date is in our range
-                if await self.is_date_in_range(date_text):
-                    has_matches = True
-                
-                # Check if date is older than our range
-                if await self.is_date_older_than_range(date_text):
-                    should_stop_searching = True
-            
-            return (has_matches, should_stop_searching)
-        except Exception as e:
-            logger.error(f"Error checking for date range: {str(e)}")
-            return (False, False)
+        if not grid_items:
+            return []
+        
+        grid_items = self.rows_in_window(grid_items, 'publish_date')
+        
+        if self.page_is_known([item['href'] for item in grid_items]):
+            return []
+        
+        return grid_items
 
     async def check_next_page(self) -> bool:
         """Check if there's a next page and navigate to it if it exists"""
@@ -525,11 +421,8 @@ class AfDBScraper(BaseScraper):
                 href = await next_link.get_attribute('href')
                 logger.info(f"Found next page link: {href}")
                 
-                # Click to navigate to next page
-                await next_link.click()
-                await self.page.wait_for_load_state("networkidle")
-                # Wait for grid to appear on the next page
-                await self.page.wait_for_selector(".views-bootstrap-grid-plugin-style", state="visible")
+                # Click to navigate to next page and wait for the new grid
+                await self.click_and_wait(next_link)
                 logger.info("Navigated to next page")
                 return True
             else:
@@ -538,74 +431,21 @@ class AfDBScraper(BaseScraper):
                 
         except Exception as e:
             logger.error(f"Error checking next page: {str(e)}")
+            self.mark_incomplete("could not move to the next listing page")
             return False
 
     async def scrape_data(self):
         """Main scraping function"""
         try:
-            await self.init_browser()
-            await self.page.goto(self.base_url)
-            await self.page.wait_for_load_state("networkidle")
+            self.reset_results()
+            async with self:
+                await self.open_listing()
             
-            current_page = 1
-            max_pages = 10  # Process up to 10 pages as specified
-            found_older_date = False
+                # Page through the grid while detail workers fetch the sectors
+                await self.pipeline_details(self.listing_pages(), self.process_row)
             
-            while current_page <= max_pages:
-                logger.info(f"Processing page {current_page}")
-                
-                # First check if this page has any matching dates in our range
-                has_matches, should_stop_searching = await self.check_page_for_date_range()
-                
-                if has_matches:
-                    logger.info(f"Found dates in our range on page {current_page}, extracting data")
-                    # Extract data from current page
-                    page_data, should_stop = await self.extract_table_data()
-                    self.results.extend(page_data)
-                    
-                    logger.info(f"Found {len(page_data)} matching rows on page {current_page}")
-                    
-                    # If we should stop searching further pages, break here
-                    if should_stop or should_stop_searching:
-                        logger.info("Found dates older than our range, stopping search")
-                        found_older_date = True
-                        break
-                elif should_stop_searching:
-                    logger.info(f"Found dates older than our range on page {current_page}, stopping search")
-                    found_older_date = True
-                    break
-                else:
-                    logger.info(f"No matching dates found on page {current_page}, checking next page")
-                
-                # Check and navigate to next page if exists
-                has_next = await self.check_next_page()
-                if not has_next:
-                    logger.info("No more pages to process")
-                    break
-                    
-                current_page += 1
-                
-            if not found_older_date and current_page > max_pages:
-                logger.info(f"Reached maximum page limit ({max_pages}). Stopping search.")
-            
-            # Log final results
-            if self.results:
-                logger.info(f"Total rows collected: {len(self.results)}")
-            else:
-                logger.info("No matching rows found within date range")
-            
-            # Convert results to DataFrame
-            df = pd.DataFrame(self.results)
-            
-            if not df.empty:
-                logger.info(f"Total rows collected: {len(df)}")
-            else:
-                logger.info("No matching rows found")
-                
-            return df
+                return self.results_frame()
             
         except Exception as e:
             logger.error(f"Error during scraping: {str(e)}")
-            raise
-        finally:
-            await self.close_browser()
\ No newline at end of file
+            raise
\ No newline at end of file
@@ -1,128 +1,76 @@
-
-
 # src/scrapers/aiib_scraper.py
 
-from playwright.async_api import async_playwright
-import asyncio
-from datetime import datetime, timedelta
-import pandas as pd
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional
 from src.scrapers.base_scraper import BaseScraper
-from src.utils.date_utils import normalize_date, format_date_for_site
 
 logger = logging.getLogger(__name__)
 
-# Increase concurrent page processing for AIIB
-MAX_CONCURRENT_PAGES = 10
-
 class AIIBScraper(BaseScraper):
-    def __init__(self, base_url: str):
-        super().__init__(base_url)
-        # Format today's date and date from a week ago
-        self.today = datetime.now()
-        self.today_str = self.today.strftime("%b %d, %Y")  # Format used by AIIB: "Mar 27, 2025"
-        
-        # Calculate the date from a week ago
-        self.week_ago = self.today - timedelta(days=7)
-        self.week_ago_str = self.week_ago.strftime("%b %d, %Y")
-        
-        self.results = []
-        # Extract the base domain from the URL
-        self.domain = '/'.join(base_url.split('/')[:3])  # Get "https://www.aiib.org"
-        
-        logger.info(f"AIIB scraper initialized with base domain: {self.domain}")
-        logger.info(f"Date range: {self.week_ago_str} to {self.today_str}")
+    SOURCE_NAME = "AIIB"
+    NOTICE_URL_FIELD = 'download_link'
+    PUBLISH_DATE_FIELD = 'issue_date'
 
-    async def init_browser(self):
-        """Initialize browser instance"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=False)
-        self.context = await self.browser.new_context()
-        self.context.set_default_timeout(60000)  # 60 seconds timeout
-        self.page = await self.context.new_page()
-        # Create a semaphore to limit concurrent pages
-        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+    # Browser settings
+    CONCURRENT_PAGES = 10  # More concurrent detail pages than the other sources
 
-    async def close_browser(self):
-        """Close browser instance"""
-        await self.context.close()
-        await self.browser.close()
-        await self.playwright.stop()
+    LISTING_READY_SELECTOR = ".table-body"
 
-    async def is_date_in_range(self, date_text: str) -> bool:
-        """Check if a date is within our specified range (week_ago to today)"""
-        try:
-            # AIIB format can be like "Mar 27, 2025" or "April 18, 2025"
-            # Handle both abbreviated and full month names
-            try:
-                date_obj = datetime.strptime(date_text.strip(), "%b %d, %Y")
-            except ValueError:
-                date_obj = datetime.strptime(date_text.strip(), "%B %d, %Y")
-            
-            return self.week_ago <= date_obj <= self.today
-        except ValueError as e:
-            logger.warning(f"Could not parse date: {date_text}. Error: {str(e)}")
-            return False
+    # Every opportunity row as a plain object
+    LISTING_SCRIPT = """
+        () => Array.from(document.querySelectorAll('.table-row')).map(row => {
+            const text = selector => {
+                const elem = row.querySelector(selector);
+                return elem ? elem.innerText : null;
+            };
+            const link = row.querySelector('.table-col.table-project a');
+            return {
+                issue_date: text('.table-col.table-date .s2'),
+                country: text('.table-col.table-country .country-value'),
+                title: text('.table-col.table-project .title-value'),
+                download_link: link ? link.getAttribute('href') : null,
+                sector: text('.table-col.table-energy .sector-value'),
+                notice_type: text('.table-col.table-type .type-value')
+            };
+        })
+    """
 
-    async def is_date_older_than_range(self, date_text: str) -> bool:
-        """Check if a date is older than our range"""
-        try:
-            # Try to parse with both abbreviated and full month names
-            try:
-                date_obj = datetime.strptime(date_text.strip(), "%b %d, %Y")
-            except ValueError:
-                date_obj = datetime.strptime(date_text.strip(), "%B %d, %Y")
-            
-            return date_obj < self.week_ago
-        except ValueError:
-            return False
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(base_url, **kwargs)
+        # Extract the base domain from the URL
+        self.domain = '/'.join(base_url.split('/')[:3])  # Get "https://www.aiib.org"
+        
+        logger.info(f"AIIB scraper initialized with base domain: {self.domain}")
 
-    async def process_row(self, row):
-        """Process a single row from the table"""
+    async def process_row(self, row: Dict) -> Optional[Dict]:
+        """Process a single row read from the table"""
         try:
-            # Extract the issue date from the row
-            date_elem = await row.query_selector(".table-col.table-date .s2")
-            if not date_elem:
+            # Issue date of the row
+            if not row['issue_date']:
                 return None
                 
-            issue_date = await date_elem.inner_text()
-            issue_date = issue_date.strip()
-            
-            # Check if date is older than our range
-            if await self.is_date_older_than_range(issue_date):
-                logger.info(f"Found date {issue_date} older than our range, stopping search")
-                return "STOP_SEARCH"
+            issue_date = row['issue_date'].strip()
             
-            # Check if date is in our range
-            if not await self.is_date_in_range(issue_date):
-                logger.info(f"Skipping row with issue date {issue_date} (outside range)")
+            # Check if date is in our range (an older date stops pagination)
+            if not self.check_date(issue_date):
+                if not self.pagination_stopped:
+                    logger.info(f"Skipping row with issue date {issue_date} (outside range)")
                 return None
             
-            # Extract the member/country
-            country_elem = await row.query_selector(".table-col.table-country .country-value")
-            country = await country_elem.inner_text() if country_elem else "N/A"
-            
-            # Extract project/notice title
-            title_elem = await row.query_selector(".table-col.table-project .title-value")
-            title = await title_elem.inner_text() if title_elem else "N/A"
+            # Skip notices already scraped by an earlier run
+            if self.is_known_notice(row['download_link']):
+                return None
             
-            # Extract the download link
-            download_link_elem = await row.query_selector(".table-col.table-project a")
-            download_link = await download_link_elem.get_attribute('href') if download_link_elem else None
+            country = row['country'] or "N/A"
+            title = row['title'] or "N/A"
+            sector = row['sector'] or "N/A"
+            notice_type = row['notice_type'] or "N/A"
             
             # Make the download link absolute if it's relative
+            download_link = row['download_link']
             if download_link and download_link.startswith('/'):
                 download_link = self.domain + download_link
             
-            # Extract sector
-            sector_elem = await row.query_selector(".table-col.table-energy .sector-value")
-            sector = await sector_elem.inner_text() if sector_elem else "N/A"
-            
-            # Extract notice type
-            type_elem = await row.query_selector(".table-col.table-type .type-value")
-            notice_type = await type_elem.inner_text() if type_elem else "N/A"
-            
             # Create result
             result = {
                 'issue_date': issue_date,
@@ -140,58 +88,36 @@ class AIIBScraper(BaseScraper):
             logger.error(f"Error processing row: {str(e)}")
             return None
 
-    async def process_rows_batch(self, rows) -> Tuple[List[Dict], bool]:
-        """Process a batch of rows in parallel"""
-        tasks = []
-        for row in rows:
-            tasks.append(self.process_row(row))
-        
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks)
-        
-        # Check if any result is the stop signal
-        should_stop = False
-        filtered_results = []
-        
-        for result in results:
-            if result == "STOP_SEARCH":
-                should_stop = True
-            elif result is not None:
-                filtered_results.append(result)
-        
-        return filtered_results, should_stop
-
-    async def extract_table_data(self) -> Tuple[List[Dict], bool]:
+    async def extract_table_data(self) -> List[Dict]:
         """Extract opportunities from current page that match the date range"""
         try:
-            # Get all rows from the table
-            rows = await self.page.query_selector_all(".table-row")
+            # Read all rows from the table
+            rows = await self.read_listing_rows()
             logger.info(f"Found {len(rows)} rows in the table")
             
             if not rows:
-                return [], False
+                return []
+            
+            if self.page_is_known([row['download_link'] for row in rows]):
+                return []
             
-            # Process rows in parallel batches
-            batch_size = MAX_CONCURRENT_PAGES
+            # Rows are plain data now, so they are filtered in order without batching
             all_results = []
             
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i:i+batch_size]
-                logger.info(f"Processing batch {i//batch_size + 1} ({len(batch)} rows)")
-                
-                batch_results, should_stop = await self.process_rows_batch(batch)
-                all_results.extend(batch_results)
-                
-                logger.info(f"Found {len(batch_results)} matching rows in this batch")
-                
-                if should_stop:
-                    return all_results, True
+            for row in rows:
+                result = await self.process_row(row)
+                # Rows after the first one older than our range are older still
+                if self.pagination_stopped:
+                    break
+                if result is not None:
+                    all_results.append(result)
             
-            return all_results, False
+            return all_results
             
         except Exception as e:
             logger.error(f"Error extracting table data: {str(e)}")
-            return [], False
+            self.mark_incomplete("could not read a listing page")
+            return []
 
     async def check_next_page(self) -> bool:
         """Check if there's a next page and navigate to it if it exists"""
@@ -199,10 +125,8 @@ class AIIBScraper(BaseScraper):
             # Check for next page link
             next_page_elem = await self.page.query_selector("a.next")
             if next_page_elem:
-                await next_page_elem.click()
-                await self.page.wait_for_load_state("networkidle")
                 # Wait for the table to load on the next page
-                await self.page.wait_for_selector(".table-body", state="visible")
+                await self.click_and_wait(next_page_elem)
                 logger.info("Navigated to next page")
                 return True
             else:
@@ -211,56 +135,50 @@ class AIIBScraper(BaseScraper):
                 
         except Exception as e:
             logger.error(f"Error checking next page: {str(e)}")
+            self.mark_incomplete("could not move to the next listing page")
             return False
 
     async def scrape_data(self):
         """Main scraping function"""
         try:
-            await self.init_browser()
-            await self.page.goto(self.base_url)
-            await self.page.wait_for_load_state("networkidle")
-            
-            # Wait for the table to be visible
-            await self.page.wait_for_selector(".table-body", state="visible")
-            logger.info("Table found")
-            
-            current_page = 1
-            should_stop = False
-            
-            while not should_stop:
-                logger.info(f"Processing page {current_page}")
+            self.reset_results()
+            async with self:
+                # Wait for the table to be visible
+                if await self.open_listing():
+                    logger.info("Table found")
+            
+                current_page = 1
+            
+                while True:
+                    # Pages finished by the checkpointed run are only paged through
+                    if current_page <= self.resume_page:
+                        if not await self.check_next_page():
+                            break
+                        current_page += 1
+                        continue
+
+                    logger.info(f"Processing page {current_page}")
                 
-                # Extract data from current page
-                page_data, should_stop_search = await self.extract_table_data()
-                self.results.extend(page_data)
+                    # Extract data from current page
+                    page_data = await self.extract_table_data()
+                    await self.emit(page_data, page=current_page)
                 
-                logger.info(f"Found {len(page_data)} matching rows on page {current_page}")
+                    logger.info(f"Found {len(page_data)} matching rows on page {current_page}")
                 
-                # If we should stop searching (found dates older than our range), break
-                if should_stop_search:
-                    logger.info("Found dates older than our range, stopping search")
-                    break
+                    # Dates older than our range (or a known page) end the search
+                    if self.pagination_stopped:
+                        break
                 
-                # Check and navigate to next page if exists
-                has_next = await self.check_next_page()
-                if not has_next:
-                    logger.info("No more pages to process")
-                    break
+                    # Check and navigate to next page if exists
+                    has_next = await self.check_next_page()
+                    if not has_next:
+                        logger.info("No more pages to process")
+                        break
                     
-                current_page += 1
-            
-            # Convert results to DataFrame
-            df = pd.DataFrame(self.results)
+                    current_page += 1
             
-            if not df.empty:
-                logger.info(f"Total rows collected: {len(df)}")
-            else:
-                logger.info("No matching rows found")
-                
-            return df
+                return self.results_frame()
             
         except Exception as e:
             logger.error(f"Error during scraping: {str(e)}")
-            raise
-        finally:
-            await self.close_browser()
\ No newline at end of file
+            raise
\ No newline at end of file
@@ -1,18 +1,875 @@
 from abc import ABC, abstractmethod
+import asyncio
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urldefrag
 import pandas as pd
+from playwright.async_api import async_playwright, Browser, BrowserContext, Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from src.config.settings import (
+    ADAPTIVE_CONCURRENCY, BLOCK_RESOURCES, CHECKPOINT_DIR, HEADLESS, HTTP_CACHE, HTTP_CACHE_TTL_HOURS, HTTP_DETAILS,
+    INCREMENTAL, PARALLEL_LISTING_PAGES, PUBLISHED_ON_COLUMN, SOURCE_CACHE_TTL_HOURS, STREAM_QUEUE_PAGES
+)
+from src.utils.adaptive_limiter import HostLimiters, LimiterSlot, is_throttle_status
+from src.utils.date_utils import normalize_dates, parse_date, to_iso_date
+from src.utils.date_window import DateWindow, IN_RANGE, NEWER, OLDER
+from src.utils.browser_pool import BrowserPool
+from src.utils.checkpoint import Checkpoint
+from src.utils.html_extract import SelectorMap
+from src.utils.metrics import RunMetrics
+from src.utils.http_cache import CacheEntry, HttpCache
+from src.utils.http_fetcher import HttpFetcher
+from src.utils.pagination import PageUrls
+from src.utils.seen_index import SeenIndex, fingerprint
+from src.utils.page_pool import DetailPagePool, PageHandler
+from src.utils.resource_policy import ResourcePolicy
+from src.utils.retry import Retrier, TransientHTTPError
+from src.utils.traffic import TrafficArchive
+
+logger = logging.getLogger(__name__)
+
+# The concurrency slot the current detail task holds (a host's LimiterSlot or the
+# source's semaphore), given back while the task waits out a retry back-off
+_held_slot: ContextVar[Any] = ContextVar('held_slot', default=None)
+
+# Signature of the listing before a pagination click: item count plus the first and
+# last item's text, and a marker on the first item that a new document will not have
+LISTING_MARK_SCRIPT = """
+    (selector) => {
+        const items = document.querySelectorAll(selector);
+        window.__listingSignature = items.length + '|' +
+            (items.length ? items[0].innerText + '|' + items[items.length - 1].innerText : '');
+        if (items.length) items[0].setAttribute('data-scraper-seen', '1');
+    }
+"""
+
+LISTING_CHANGED_SCRIPT = """
+    (selector) => {
+        const items = document.querySelectorAll(selector);
+        if (!items.length) return false;
+        if (window.__listingSignature === undefined || !items[0].hasAttribute('data-scraper-seen')) return true;
+        const signature = items.length + '|' + items[0].innerText + '|' + items[items.length - 1].innerText;
+        return signature !== window.__listingSignature;
+    }
+"""
 
 
 class BaseScraper(ABC):
-    def __init__(self, base_url: str):
+    # Source name used for the seen index and output files
+    SOURCE_NAME = ""
+    # Output column holding the notice URL that identifies a notice across runs
+    NOTICE_URL_FIELD = 'url'
+    # Output columns promoted to indexed columns of the tender store (None when the source has none)
+    PUBLISH_DATE_FIELD: Optional[str] = 'publish_date'
+    COUNTRY_FIELD: Optional[str] = 'country'
+    TITLE_FIELD: Optional[str] = 'title'
+
+    # Browser settings, overridden per source where the site needs it
+    LAUNCH_ARGS: List[str] = []
+    CONTEXT_OPTIONS: Dict = {}
+    # URL substrings never blocked by the resource policy (scripts or assets the site needs)
+    RESOURCE_ALLOWLIST: List[str] = []
+    DEFAULT_TIMEOUT = 60000  # milliseconds
+    CONCURRENT_PAGES = 5  # Default number of concurrent detail pages
+    # Fields read from each detail page; enables the HTTP-only fast path when set
+    DETAIL_SELECTORS: Optional[SelectorMap] = None
+    # JavaScript returning the current listing page as an array of plain row objects
+    LISTING_SCRIPT: Optional[str] = None
+    # Upper bound on listing pages read by listing_pages (None: until the listing ends)
+    MAX_LISTING_PAGES: Optional[int] = None
+    # Elements whose presence means the listing / a detail page has rendered; waited on
+    # after DOMContentLoaded instead of network idle (None: DOMContentLoaded is enough)
+    LISTING_READY_SELECTOR: Optional[str] = None
+    DETAIL_READY_SELECTOR: Optional[str] = None
+    # Next link of a server-rendered pager; when its URL numbers the pages with
+    # PAGE_PARAM (?page=N), listing_pages opens pages by URL, several at once,
+    # instead of clicking through
+    NEXT_PAGE_SELECTOR: Optional[str] = None
+    PAGE_PARAM: Optional[str] = None
+
+    def __init__(self, base_url: str, browser_pool: Optional[BrowserPool] = None,
+                 browser: Optional[Browser] = None, context: Optional[BrowserContext] = None,
+                 max_concurrent_pages: Optional[int] = None, http_details: bool = HTTP_DETAILS,
+                 incremental: bool = INCREMENTAL, seen_index: Optional[SeenIndex] = None,
+                 resume: bool = False, block_resources: bool = BLOCK_RESOURCES,
+                 date_window: Optional[DateWindow] = None,
+                 adaptive_concurrency: bool = ADAPTIVE_CONCURRENCY,
+                 http_cache: Optional[HttpCache] = None, use_http_cache: bool = HTTP_CACHE,
+                 traffic: Optional[TrafficArchive] = None,
+                 parallel_listing_pages: int = PARALLEL_LISTING_PAGES,
+                 checkpoint_dir: Path = CHECKPOINT_DIR):
         self.base_url = base_url
+        # Shared browser pool (set by the orchestrator)
+        self.browser_pool = browser_pool
+        # Already-running browser or context injected by the caller; never closed by the scraper
+        self.browser = browser
+        self.context = context
+        # Per-source override for CONCURRENT_PAGES
+        self.max_concurrent_pages = max_concurrent_pages
+        # Listing pages read at once when the pager has page URLs
+        self.parallel_listing_pages = max(1, parallel_listing_pages)
+        # AIMD limit per detail host, starting at concurrent_pages (fixed limit when disabled)
+        self.host_limits = HostLimiters(self.concurrent_pages) if adaptive_concurrency else None
+        self._detail_slots = asyncio.Semaphore(self.concurrent_pages) if self.host_limits is None else None
+        # Backoff, retry budget and circuit breaker shared by all of this source's navigations
+        self.retrier = Retrier(self.SOURCE_NAME)
+        # Counters and per-phase timings of this run, reported by run_scraper
+        self.metrics = RunMetrics(self.SOURCE_NAME)
+        # Fetch detail pages over plain HTTP when the source defines DETAIL_SELECTORS
+        self.http_details = http_details and self.DETAIL_SELECTORS is not None
+        # Record this run's traffic, or replay a recorded run with no network
+        self.traffic = traffic
+        # Cache of HTTP-fetched detail pages (opened by init_browser unless injected);
+        # bypassed with a traffic archive so recordings and replays see every request
+        self.use_http_cache = use_http_cache and self.http_details and traffic is None
+        self.http_cache = http_cache
+        self._owns_http_cache = False
+        # Skip notices scraped by earlier runs (index opened lazily unless injected)
+        self.incremental = incremental
+        self.seen_index = seen_index
+        # Publish dates to collect; pagination stops once the listing is past them
+        self.date_window = date_window or DateWindow.from_settings(self.SOURCE_NAME)
+        self.stop_reason: Optional[str] = None
+        # Why an error cut the crawl short (None when it was not), so the run is not
+        # recorded as complete and its checkpoint is kept for --resume
+        self.incomplete_reason: Optional[str] = None
+        logger.info(f"{self.SOURCE_NAME} date range: {self.date_window}")
+        if self.traffic is not None and self.traffic.recording:
+            self.traffic.date_window = self.date_window
+        # Rows collected by scrape_data, unless iter_rows is streaming them out
+        self.results: List[Dict] = []
+        self.rows_emitted = 0
+        self._row_queue: Optional[asyncio.Queue] = None
+        # Continue a failed streamed crawl from its checkpoint instead of page 1
+        self.resume = resume
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.checkpoint = Checkpoint(self.SOURCE_NAME, self.checkpoint_dir)
+        self.resume_page = 0
+        self.resume_pending: List[str] = []
+        # (rows emitted, page, pending URLs) marks waiting for their rows to be flushed
+        self._progress_marks: List[Tuple[int, Optional[int], Optional[List[str]]]] = []
+        self._checkpoint_rows = 0
+
+        self.playwright = None
+        self.page = None
+        self.detail_pool = None
+        self.http_fetcher = None
+        # Abort images, fonts, media and trackers on contexts this scraper creates
+        self.resource_policy = ResourcePolicy(allowlist=self.RESOURCE_ALLOWLIST) if block_resources else None
+        self._owns_browser = False
+        self._owns_context = False
+        self._session_depth = 0
+
+    @property
+    def concurrent_pages(self) -> int:
+        """Number of detail pages this source may have open at once"""
+        return self.max_concurrent_pages or self.CONCURRENT_PAGES
+
+    @property
+    def detail_workers(self) -> int:
+        """Detail workers to start: the adaptive ceiling, since the host limits decide how many run"""
+        return self.host_limits.max_limit if self.host_limits else self.concurrent_pages
+
+    def browser_concurrency(self) -> int:
+        """Detail pages this source may use right now: its hosts' current browser limits"""
+        if self.host_limits is None:
+            return self.concurrent_pages
+        limits = [limiter.current for key, limiter in self.host_limits.limiters.items()
+                  if key.endswith("(browser)")]
+        return sum(limits) or self.concurrent_pages
 
-    @abstractmethod
     async def init_browser(self):
-        pass
+        """Get a browser context ready, launching Playwright only when nothing was injected"""
+        if self.context is None:
+            if self.browser_pool:
+                self.context = await self.browser_pool.new_context(launch_args=self.LAUNCH_ARGS,
+                                                                   **self.CONTEXT_OPTIONS)
+            else:
+                if self.browser is None:
+                    self.playwright = await async_playwright().start()
+                    self.browser = await self.playwright.chromium.launch(
+                        headless=HEADLESS,
+                        args=self.LAUNCH_ARGS
+                    )
+                    self._owns_browser = True
+                self.context = await self.browser.new_context(**self.CONTEXT_OPTIONS)
+            self._owns_context = True
+            if self.resource_policy is not None:
+                await self.resource_policy.apply(self.context)
+        if self.traffic is not None:
+            # After the resource policy, so a replay answers requests before the policy sees them
+            await self.traffic.apply(self.context)
+
+        self.context.set_default_timeout(self.DEFAULT_TIMEOUT)
+        self.page = await self.context.new_page()
+        # Long-lived pages for detail URLs, opened inside the source's or host's slot and
+        # bounded by the pool's global page limit; idle ones follow the current concurrency
+        self.detail_pool = DetailPagePool(
+            self.context,
+            self.browser_concurrency,
+            limiter=self.browser_pool.page_semaphore if self.browser_pool else None
+        )
+        if self.http_details:
+            self.http_fetcher = HttpFetcher(max_per_host=self.detail_workers, limiters=self.host_limits,
+                                            archive=self.traffic)
+        if self.use_http_cache and self.http_cache is None:
+            self.http_cache = HttpCache()
+            self._owns_http_cache = True
 
-    @abstractmethod
     async def close_browser(self):
-        pass
+        """Close whatever init_browser opened, leaving injected browsers and contexts running"""
+        if self.host_limits is not None and self.host_limits.limiters:
+            logger.info(f"{self.SOURCE_NAME} detail concurrency: {self.host_limits.summary()}")
+        if self.retrier.budget.operations:
+            logger.info(f"{self.SOURCE_NAME} navigation: {self.retrier.summary()}")
+
+        if self.detail_pool is not None:
+            await self.detail_pool.close()
+            self.detail_pool = None
+
+        if self.http_fetcher is not None:
+            await self.http_fetcher.close()
+            self.http_fetcher = None
+
+        if self._owns_http_cache:
+            self.http_cache.close()
+            self.http_cache = None
+            self._owns_http_cache = False
+
+        try:
+            if self.page is not None:
+                await self.page.close()
+        except Exception as e:
+            logger.warning(f"Error closing page: {str(e)}")
+        self.page = None
+
+        if self._owns_context and self.context is not None:
+            if self.resource_policy is not None:
+                logger.info(f"{self.SOURCE_NAME} resource policy: {self.resource_policy.summary()}")
+            try:
+                if self.browser_pool:
+                    await self.browser_pool.release_context(self.context)
+                else:
+                    await self.context.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser context: {str(e)}")
+            self.context = None
+            self._owns_context = False
+
+        if self.traffic is not None:
+            if self.traffic.recording:
+                self.traffic.save()
+            else:
+                logger.info(f"{self.SOURCE_NAME} traffic: {self.traffic.summary()}")
+
+        if self._owns_browser and self.browser is not None:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {str(e)}")
+            self.browser = None
+            self._owns_browser = False
+
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+
+    def notice_key(self, url: Optional[str]) -> Optional[str]:
+        """Absolute notice URL without fragment, used as the seen index key"""
+        if not isinstance(url, str) or not url.strip() or url == "N/A":
+            return None
+        return urldefrag(urljoin(self.base_url, url.strip()))[0]
+
+    def get_seen_index(self) -> SeenIndex:
+        if self.seen_index is None:
+            self.seen_index = SeenIndex()
+        return self.seen_index
+
+    def is_known_notice(self, url: Optional[str]) -> bool:
+        """True when incremental and the notice was already scraped by an earlier run"""
+        key = self.notice_key(url)
+        if not self.incremental or key is None:
+            return False
+        return self.get_seen_index().is_known(self.SOURCE_NAME, key)
+
+    def page_is_known(self, urls: List[Optional[str]]) -> bool:
+        """True when every notice on a listing page is already indexed, which stops pagination"""
+        urls = [url for url in urls if self.notice_key(url)]
+        if not urls or not all(self.is_known_notice(url) for url in urls):
+            return False
+        self.stop_pagination("all notices on this page were scraped by earlier runs")
+        return True
+
+    def stop_pagination(self, reason: str):
+        """Ask scrape_data not to load further listing pages (the first reason is kept)"""
+        if self.stop_reason is None:
+            self.stop_reason = reason
+            logger.info(f"{self.SOURCE_NAME}: stopping pagination, {reason}")
+
+    @property
+    def pagination_stopped(self) -> bool:
+        return self.stop_reason is not None
+
+    def mark_incomplete(self, reason: str):
+        """Record that an error the scraper carried on from cut the crawl short"""
+        if self.incomplete_reason is None:
+            self.incomplete_reason = reason
+            logger.warning(f"{self.SOURCE_NAME}: crawl incomplete, {reason}")
+
+    @property
+    def crawl_complete(self) -> bool:
+        return self.incomplete_reason is None
+
+    def classify_date(self, date_text: Optional[str]) -> Optional[str]:
+        """Where a listing date falls in the date window (IN_RANGE, NEWER, OLDER), None if unparseable"""
+        date_obj = parse_date(date_text)
+        if date_obj is None:
+            logger.warning(f"Could not parse date: {date_text}")
+            return None
+        return self.date_window.classify(date_obj)
+
+    def check_date(self, date_text: Optional[str]) -> bool:
+        """True when a notice's date is inside the window; an older date stops pagination"""
+        status = self.classify_date(date_text)
+        if status == OLDER:
+            self.stop_pagination(f"reached {date_text.strip()}, older than {self.date_window}")
+        return status == IN_RANGE
+
+    def rows_in_window(self, rows: List[Dict], date_key: str) -> List[Dict]:
+        """The in-range rows of a listing page; a row older than the window stops pagination"""
+        matches = []
+        counts = Counter()
+        for row in rows:
+            date_text = (row.get(date_key) or "").strip()
+            status = self.classify_date(date_text) if date_text else None
+            counts[status or 'undated'] += 1
+            if status == IN_RANGE:
+                matches.append(row)
+            elif status == OLDER:
+                self.stop_pagination(f"reached {date_text}, older than {self.date_window}")
+        logger.info(f"{len(rows)} listing rows: {counts[IN_RANGE]} in range, {counts[NEWER]} newer, "
+                    f"{counts[OLDER]} older, {counts['undated']} undated")
+        return matches
+
+    def remember_notices(self, rows: Iterable[Dict]) -> int:
+        """Record saved rows in the seen index so later runs skip them"""
+        if not self.incremental:
+            return 0
+        entries = []
+        for row in rows:
+            key = self.notice_key(row.get(self.NOTICE_URL_FIELD))
+            if key is not None:
+                entries.append((key, fingerprint(row)))
+        return self.get_seen_index().mark_seen(self.SOURCE_NAME, entries)
+
+    def to_store_record(self, row: Dict) -> Dict:
+        """Map a scraped row onto the tender store's columns"""
+        def column(field):
+            value = row.get(field) if field else None
+            if not isinstance(value, str) or not value.strip() or value == "N/A":
+                return None
+            return value.strip()
+
+        url = self.notice_key(row.get(self.NOTICE_URL_FIELD))
+        published_on = row.get(PUBLISHED_ON_COLUMN)
+        if isinstance(published_on, pd.Timestamp) and not pd.isna(published_on):
+            publish_date = published_on.date().isoformat()
+        else:
+            publish_date = to_iso_date(column(self.PUBLISH_DATE_FIELD))
+        return {
+            'source': self.SOURCE_NAME,
+            'notice_id': url or fingerprint(row),
+            'publish_date': publish_date,
+            'country': column(self.COUNTRY_FIELD),
+            'title': column(self.TITLE_FIELD),
+            'url': url,
+            # The canonical date is the publish_date column, the row keeps the site's own string
+            'data': {key: value for key, value in row.items() if key != PUBLISHED_ON_COLUMN}
+        }
+
+    def reset_results(self):
+        """Start a new crawl with no collected rows"""
+        self.results = []
+        self.rows_emitted = 0
+        self.stop_reason = None
+        self.incomplete_reason = None
+
+    async def emit(self, rows: List[Dict], page: Optional[int] = None,
+                   pending: Optional[List[str]] = None):
+        """Hand over one listing page's rows; page and pending URLs are checkpointed once they are flushed"""
+        self.rows_emitted += len(rows)
+        if page is not None:
+            self.metrics.count("listing_pages")
+        if self._row_queue is not None:
+            if rows:
+                await self._row_queue.put(list(rows))
+            if page is not None or pending is not None:
+                self._progress_marks.append((self.rows_emitted, page, pending))
+        else:
+            self.results.extend(rows)
+
+    def start_checkpoint(self):
+        """Load the checkpoint to resume from, or discard it for a fresh crawl"""
+        self._progress_marks = []
+        if self.resume and self.checkpoint.load():
+            self.resume_page = self.checkpoint.page
+            self.resume_pending = list(self.checkpoint.pending)
+            logger.info(f"Resuming {self.SOURCE_NAME} after page {self.resume_page} "
+                        f"({self.checkpoint.rows_emitted} rows already saved, "
+                        f"{len(self.resume_pending)} detail URLs pending)")
+        else:
+            self.checkpoint.clear()
+            self.checkpoint = Checkpoint(self.SOURCE_NAME, self.checkpoint_dir)
+            self.resume_page = 0
+            self.resume_pending = []
+        self._checkpoint_rows = self.checkpoint.rows_emitted
+
+    def commit_progress(self, rows_written: int):
+        """Checkpoint the latest page whose rows are all among the rows_written flushed rows"""
+        ready = [mark for mark in self._progress_marks if mark[0] <= rows_written]
+        if not ready:
+            return
+        self._progress_marks = self._progress_marks[len(ready):]
+        for _, page, pending in ready:
+            if page is not None:
+                self.checkpoint.page = page
+            self.checkpoint.pending = list(pending) if pending is not None else []
+        self.checkpoint.rows_emitted = self._checkpoint_rows + rows_written
+        self.checkpoint.save()
+
+    def finish_checkpoint(self):
+        """The crawl completed and every row is on disk, nothing is left to resume"""
+        self._progress_marks = []
+        if self.incomplete_reason is not None:
+            logger.info(f"Keeping the {self.SOURCE_NAME} checkpoint, the crawl stopped short "
+                        f"({self.incomplete_reason}); run with --resume to continue")
+            return
+        self.checkpoint.clear()
+
+    def results_frame(self) -> pd.DataFrame:
+        """DataFrame of the collected rows (empty when they were streamed by iter_rows)"""
+        if self.rows_emitted:
+            logger.info(f"Total rows collected: {self.rows_emitted}")
+        else:
+            logger.info("No matching rows found")
+        return self.normalize_frame(pd.DataFrame(self.results))
+
+    def normalize_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Add the canonical datetime64 publish date column next to the source's raw date string"""
+        if df.empty or PUBLISHED_ON_COLUMN in df.columns:
+            return df
+        field = self.PUBLISH_DATE_FIELD
+        if field and field in df.columns:
+            df.insert(df.columns.get_loc(field) + 1, PUBLISHED_ON_COLUMN, normalize_dates(df[field]))
+        else:
+            df[PUBLISHED_ON_COLUMN] = pd.NaT
+        return df
+
+    async def iter_rows(self) -> AsyncIterator[Dict]:
+        """Run scrape_data and yield each row as soon as its page is emitted"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_PAGES)
+        finished = object()
+
+        async def crawl():
+            try:
+                await self.scrape_data()
+            finally:
+                await queue.put(finished)
+
+        self.start_checkpoint()
+        self._row_queue = queue
+        task = asyncio.create_task(crawl())
+        try:
+            while True:
+                rows = await queue.get()
+                if rows is finished:
+                    break
+                for row in rows:
+                    yield row
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+            self._row_queue = None
+
+    async def wait_ready(self, page, ready_selector: Optional[str], timeout: Optional[float] = None) -> bool:
+        """Wait for a readiness selector to become visible; False (with a warning) on timeout"""
+        if not ready_selector:
+            return True
+        try:
+            await page.wait_for_selector(ready_selector, state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            self.metrics.count("ready_timeouts")
+            logger.warning(f"Timed out waiting for {ready_selector} on {page.url}, continuing with partial content")
+            return False
+
+    async def goto_ready(self, page, url: str, ready_selector: Optional[str] = None,
+                         ready_timeout: Optional[float] = None, listing: bool = False, **kwargs) -> bool:
+        """Open url and wait for DOMContentLoaded and ready_selector, retrying under the source's budget"""
+        async def navigate():
+            # Timed per attempt, the back-off between attempts is not navigation time
+            with self.metrics.timer(phase):
+                response = await page.goto(url, wait_until="domcontentloaded", **kwargs)
+            status = response.status if response is not None else None
+            if self.host_limits is not None:
+                self.host_limits.report_status(url, status)
+            if is_throttle_status(status):
+                raise TransientHTTPError(status, response.headers.get('retry-after'))
+
+        phase = "listing_navigation" if listing or page is self.page else "detail_navigation"
+        self.metrics.count(f"{phase}s")
+        try:
+            await self.retrier.run(navigate, f"{self.SOURCE_NAME} navigation to {url}",
+                                   retry_on=(PlaywrightError, TransientHTTPError), sleep=self.backoff_sleep)
+        except Exception:
+            self.metrics.count("navigation_failures")
+            raise
+        return await self.wait_ready(page, ready_selector, timeout=ready_timeout)
+
+    @staticmethod
+    async def backoff_sleep(seconds: float):
+        """Wait out a retry back-off without holding the detail slot of the current task"""
+        slot = _held_slot.get()
+        if slot is None:
+            await asyncio.sleep(seconds)
+        elif isinstance(slot, LimiterSlot):
+            await slot.pause(seconds)
+        else:
+            slot.release()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                await slot.acquire()
+
+    async def open_listing(self, url: Optional[str] = None) -> bool:
+        """Open the listing (base_url by default) and wait until it has rendered"""
+        return await self.goto_ready(self.page, url or self.base_url, self.LISTING_READY_SELECTOR)
+
+    async def open_detail(self, detail_page, url: str, **kwargs) -> bool:
+        """Open a detail page on a pooled worker page and wait until it has rendered"""
+        return await self.goto_ready(detail_page, url, self.DETAIL_READY_SELECTOR, **kwargs)
+
+    async def click_and_wait(self, element, selector: Optional[str] = None, js_click: bool = False):
+        """Click a pagination control and wait until the listing has changed"""
+        selector = selector or self.LISTING_READY_SELECTOR
+        self.metrics.count("listing_navigations")
+        with self.metrics.timer("listing_navigation"):
+            await self.page.evaluate(LISTING_MARK_SCRIPT, selector)
+            if js_click:
+                await element.evaluate("el => el.click()")
+            else:
+                await element.click()
+            for attempt in range(2):
+                try:
+                    await self.page.wait_for_function(LISTING_CHANGED_SCRIPT, arg=selector)
+                    return
+                except PlaywrightTimeoutError:
+                    raise
+                except PlaywrightError as e:
+                    # The click navigated while the condition was being polled
+                    if attempt or 'context was destroyed' not in str(e):
+                        raise
+                    await self.page.wait_for_load_state("domcontentloaded")
+
+    async def listing_pages(self) -> AsyncIterator[Tuple[int, List[Any]]]:
+        """Page through the listing, yielding (page number, extract_table_data())"""
+        page_urls = await self.listing_page_urls()
+        if page_urls is not None:
+            async for entry in self.url_listing_pages(page_urls):
+                yield entry
+            return
+
+        current_page = 1
+        while True:
+            if current_page > self.resume_page:
+                logger.info(f"Processing page {current_page}")
+                items = await self.extract_table_data()
+                logger.info(f"Found {len(items)} listing rows in our date range on page {current_page}")
+                yield current_page, items
+
+                # Dates older than our range (or a known page) end the search
+                if self.pagination_stopped:
+                    return
+
+            if self.MAX_LISTING_PAGES is not None and current_page >= self.MAX_LISTING_PAGES:
+                logger.info(f"Reached maximum page limit ({self.MAX_LISTING_PAGES}). Stopping search.")
+                return
+
+            # Check and navigate to next page if exists
+            if not await self.check_next_page():
+                logger.info("No more pages to process")
+                return
+            current_page += 1
+
+    async def listing_page_urls(self) -> Optional[PageUrls]:
+        """How the open listing's pages are addressed, None when they have to be clicked through"""
+        if not self.NEXT_PAGE_SELECTOR or not self.PAGE_PARAM or self.parallel_listing_pages <= 1:
+            return None
+        try:
+            next_link = await self.page.query_selector(self.NEXT_PAGE_SELECTOR)
+            href = await next_link.get_attribute('href') if next_link else None
+        except PlaywrightError as e:
+            logger.warning(f"Could not read the next page link: {str(e)}")
+            return None
+        if not href:
+            return None
+        page_urls = PageUrls.from_next_link(self.page.url, href, self.PAGE_PARAM)
+        if page_urls is None:
+            logger.info(f"Next page link {href} has no {self.PAGE_PARAM} page number, "
+                        f"paging through the listing")
+        else:
+            logger.info(f"Reading {self.parallel_listing_pages} listing pages at once: {page_urls}")
+        return page_urls
+
+    async def read_listing_page(self, page, url: str) -> Tuple[List[Dict], bool]:
+        """Open a listing page by URL on a pooled page: its LISTING_SCRIPT rows and whether a next page exists"""
+        await self.goto_ready(page, url, self.LISTING_READY_SELECTOR, listing=True)
+        rows = await self.read_listing_rows(page)
+        return rows, await page.query_selector(self.NEXT_PAGE_SELECTOR) is not None
+
+    async def url_listing_pages(self, page_urls: PageUrls) -> AsyncIterator[Tuple[int, List[Any]]]:
+        """Page through a listing by page URL, reading parallel_listing_pages pages ahead"""
+        last_page = self.MAX_LISTING_PAGES
+        reading: Dict[int, asyncio.Task] = {}
+        next_page = max(self.resume_page + 1, 2)
+
+        def read_ahead():
+            nonlocal next_page
+            while len(reading) < self.parallel_listing_pages and (last_page is None or next_page <= last_page):
+                reading[next_page] = asyncio.create_task(
+                    self.detail_pool.run(page_urls.url(next_page), self.read_listing_page)
+                )
+                next_page += 1
+
+        current_page = self.resume_page + 1
+        try:
+            if current_page == 1:
+                read_ahead()
+                logger.info("Processing page 1")
+                items = self.select_listing_items(await self.read_listing_rows())
+                logger.info(f"Found {len(items)} listing rows in our date range on page 1")
+                yield 1, items
+                if self.pagination_stopped:
+                    return
+                current_page = 2
+
+            while True:
+                if last_page is not None and current_page > last_page:
+                    logger.info(f"Reached maximum page limit ({last_page}). Stopping search.")
+                    return
+                read_ahead()
+                try:
+                    rows, has_next = await reading.pop(current_page)
+                except Exception as e:
+                    logger.error(f"Error reading listing page {current_page}: {str(e)}")
+                    self.mark_incomplete(f"could not read listing page {current_page}")
+                    return
+                if not rows:
+                    logger.info(f"Listing page {current_page} is empty, no more pages to process")
+                    return
+
+                logger.info(f"Processing page {current_page}")
+                items = self.select_listing_items(rows)
+                logger.info(f"Found {len(items)} listing rows in our date range on page {current_page}")
+                yield current_page, items
+
+                # Dates older than our range (or a known page) end the search
+                if self.pagination_stopped:
+                    return
+                if not has_next:
+                    logger.info("No more pages to process")
+                    return
+                current_page += 1
+        finally:
+            for task in reading.values():
+                task.cancel()
+            await asyncio.gather(*reading.values(), return_exceptions=True)
+
+    async def pipeline_details(self, listing: AsyncIterator[Tuple[int, List[Any]]],
+                               process: Callable[[Any], Awaitable[Optional[Dict]]],
+                               workers: Optional[int] = None) -> int:
+        """Feed listing pages to a fixed set of detail workers; returns the number of pages read"""
+        workers = workers or self.detail_workers
+        # Bounded, so the listing stays only a few items ahead of the workers
+        queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+        # page -> [items still to process, rows by listing position]
+        pending: Dict[int, list] = {}
+        page_order: List[int] = []
+        release_lock = asyncio.Lock()
+
+        async def release():
+            # Emit the leading pages whose items are all done
+            async with release_lock:
+                while page_order and pending[page_order[0]][0] == 0:
+                    page = page_order.pop(0)
+                    _, rows = pending.pop(page)
+                    await self.emit([row for row in rows if row], page=page)
+
+        async def work():
+            while True:
+                entry = await queue.get()
+                if entry is None:
+                    return
+                page, position, item = entry
+                try:
+                    row = await process(item)
+                except Exception as e:
+                    logger.error(f"Error processing listing item on page {page}: {str(e)}")
+                    row = None
+                state = pending[page]
+                state[1][position] = row
+                state[0] -= 1
+                await release()
+
+        tasks = [asyncio.create_task(work()) for _ in range(workers)]
+        pages_read = 0
+        try:
+            async for page, items in listing:
+                pages_read += 1
+                pending[page] = [len(items), [None] * len(items)]
+                page_order.append(page)
+                for position, item in enumerate(items):
+                    await queue.put((page, position, item))
+                # Pages without items are released straight away
+                await release()
+            for _ in tasks:
+                await queue.put(None)
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return pages_read
+
+    async def read_listing_rows(self, page=None) -> List[Dict]:
+        """Read every row of the current listing page (or page) in a single page.evaluate call"""
+        with self.metrics.timer("listing_extraction"):
+            rows = await (page or self.page).evaluate(self.LISTING_SCRIPT)
+        self.metrics.count("listing_rows", len(rows))
+        return rows
+
+    def select_listing_items(self, rows: List[Dict]) -> List[Any]:
+        """Items to process from a listing page's LISTING_SCRIPT rows (all of them by default)"""
+        return rows
+
+    async def fetch_detail(self, url: str, handler: PageHandler):
+        """Run handler(page, url) on one of the pooled detail pages, within the host's limit"""
+        self.metrics.count("detail_browser_pages")
+        # The slot is taken before a page, so a source held back by its own limit holds no pooled pages
+        slot = (self.host_limits.slot(url, channel="browser") if self.host_limits is not None
+                else self._detail_slots)
+        try:
+            async with slot as held:
+                token = _held_slot.set(held if isinstance(held, LimiterSlot) else slot)
+                try:
+                    return await self.detail_pool.run(url, handler)
+                finally:
+                    _held_slot.reset(token)
+        except Exception:
+            self.metrics.count("detail_errors")
+            raise
+
+    async def fetch_detail_fields(self, url: str, handler: PageHandler) -> Optional[Dict]:
+        """Read a detail page's DETAIL_SELECTORS fields, from static HTML when possible"""
+        if self.http_fetcher is not None:
+            fields = await self.fetch_static_fields(url)
+            if fields is not None:
+                return fields
+            self.metrics.count("detail_http_fallbacks")
+        return await self.fetch_detail(url, handler)
+
+    @property
+    def cache_ttl(self) -> float:
+        """Seconds a cached detail page is used without revalidating it"""
+        return SOURCE_CACHE_TTL_HOURS.get(self.SOURCE_NAME, HTTP_CACHE_TTL_HOURS) * 3600
+
+    @property
+    def detail_fields_key(self) -> str:
+        """Identifies the DETAIL_SELECTORS field set, so cached fields are re-parsed when it changes"""
+        return ",".join(sorted(self.DETAIL_SELECTORS.fields))
+
+    def cached_fields(self, entry: CacheEntry) -> Dict:
+        """The fields of a cached page, re-parsing its body only when the field set changed"""
+        if entry.fields is not None and entry.fields_key == self.detail_fields_key:
+            return dict(entry.fields)
+        with self.metrics.timer("detail_extraction"):
+            fields = self.DETAIL_SELECTORS.parse(entry.body, require_ready=False)
+        self.http_cache.put(entry.url, entry.body, entry.etag, entry.last_modified,
+                            fields, self.detail_fields_key, fetched_at=entry.fetched_at)
+        return fields
+
+    async def fetch_static_fields(self, url: str) -> Optional[Dict]:
+        """DETAIL_SELECTORS fields parsed from the page's static HTML; None when it needs the browser"""
+        # A cached page younger than cache_ttl is used without a request, an older one is revalidated
+        entry = self.http_cache.get(url) if self.use_http_cache else None
+        if entry is not None and entry.is_fresh(self.cache_ttl):
+            self.metrics.count("cache_hits")
+            return self.cached_fields(entry)
+        # No point trying HTTP while the circuit is open, the browser path fails fast
+        if self.retrier.breaker.is_open:
+            return None
+
+        self.metrics.count("detail_http_pages")
+        with self.metrics.timer("detail_http"):
+            page = await self.http_fetcher.fetch_page(url, entry.validators() if entry is not None else None)
+        if page is None:
+            return None
+        if page.not_modified:
+            if entry is None:
+                return None
+            self.metrics.count("cache_revalidated")
+            fields = self.cached_fields(entry)
+            self.http_cache.revalidated(url)
+            return fields
+
+        self.metrics.count("http_bytes", len(page.text))
+        with self.metrics.timer("detail_extraction"):
+            fields = self.DETAIL_SELECTORS.parse(page.text)
+        if fields is None:
+            logger.debug(f"Static HTML for {url} needs JavaScript, falling back to the browser")
+        elif self.use_http_cache:
+            self.http_cache.put(url, page.text, page.etag, page.last_modified, fields, self.detail_fields_key)
+        return fields
+
+    async def read_rendered_fields(self, page) -> Dict:
+        """Parse DETAIL_SELECTORS fields from a page rendered in the browser"""
+        html = await page.content()
+        self.metrics.count("rendered_bytes", len(html))
+        with self.metrics.timer("detail_extraction"):
+            return self.DETAIL_SELECTORS.parse(html, require_ready=False)
+
+    def collect_metrics(self) -> RunMetrics:
+        """The run's metrics, with the totals kept by the retrier, limiters and resource policy"""
+        self.metrics.set("rows_emitted", self.rows_emitted)
+        self.metrics.set("retries", self.retrier.budget.retries)
+        self.metrics.set("circuit_opened", self.retrier.breaker.times_opened)
+        if self.host_limits is not None:
+            self.metrics.set("concurrency_backoffs",
+                             sum(limiter.decreases for limiter in self.host_limits.limiters.values()))
+        if self.resource_policy is not None:
+            self.metrics.set("resources_blocked", sum(self.resource_policy.blocked.values()))
+        return self.metrics
+
+    async def __aenter__(self):
+        """Open the browser on the outermost entry; nested entries reuse it"""
+        if self._session_depth == 0:
+            await self.init_browser()
+        self._session_depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._session_depth -= 1
+        if self._session_depth == 0:
+            await self.close_browser()
 
     @abstractmethod
     async def extract_table_data(self):
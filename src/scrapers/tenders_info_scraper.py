@@ -1,183 +1,96 @@
-
 # src/scrapers/tenders_info_scraper.py
 
-from playwright.async_api import async_playwright
 import asyncio
-from datetime import datetime, timedelta
-import pandas as pd
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional
 from src.scrapers.base_scraper import BaseScraper
-from src.utils.date_utils import normalize_date, format_date_for_site
+from src.utils.html_extract import SelectorMap, labelled_fields
 
 logger = logging.getLogger(__name__)
 
-# Number of concurrent detail page processing
-MAX_CONCURRENT_PAGES = 5
-
 class TendersInfoScraper(BaseScraper):
-    def __init__(self, base_url: str):
-        super().__init__(base_url)
-        # Format today's date and date from a week ago
-        self.today = datetime.now()
-        self.today_str = self.today.strftime("%d %b %Y")  # Format used by TendersInfo: "28 Feb 2025"
-        
-        # Calculate the date from a week ago
-        self.week_ago = self.today - timedelta(days=7)
-        self.week_ago_str = self.week_ago.strftime("%d %b %Y")
-        
-        self.results = []
-        self.semaphore = None  # Will be initialized in scrape_data
-        
-        logger.info(f"TendersInfo scraper initialized")
-        logger.info(f"Date range: {self.week_ago_str} to {self.today_str}")
+    SOURCE_NAME = "TendersInfo"
+    PUBLISH_DATE_FIELD = 'date'
+    COUNTRY_FIELD = 'location'
+    TITLE_FIELD = 'description'
+
+    # Browser settings
+    CONCURRENT_PAGES = 5  # Concurrent detail pages
 
-    async def init_browser(self):
-        """Initialize browser instance"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=False)
-        self.context = await self.browser.new_context()
-        self.context.set_default_timeout(60000)  # 60 seconds timeout
-        self.page = await self.context.new_page()
-        # Create a semaphore to limit concurrent pages
-        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+    LISTING_READY_SELECTOR = "a.tenderBrief"
+    DETAIL_READY_SELECTOR = ".form-horizontal"
 
-    async def close_browser(self):
-        """Close browser instance"""
-        await self.context.close()
-        await self.browser.close()
-        await self.playwright.stop()
+    # Detail page fields: "<label>Tender Date</label><div><p>value</p></div>" form rows
+    DETAIL_SELECTORS = SelectorMap(labelled_fields([
+        ('Tender TI Ref No', 'ref_no'),
+        ('Tender Date', 'date'),
+        ('Tender Description', 'description'),
+        ('Tender Deadline', 'deadline'),
+        ('Tender Project Location', 'location'),
+        ('Tender Sector', 'sector'),
+        ('Tender CPV', 'cpv'),
+        ('Tender Document Type', 'document_type'),
+    ], label="label", sibling="div", inner="p"), ready_selector=".form-horizontal")
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(base_url, **kwargs)
         
-    async def is_date_in_range(self, date_text: str) -> bool:
-        """Check if a date is within our specified range (week_ago to today)"""
-        try:
-            # TendersInfo format is like "28 Feb 2024"
-            date_obj = datetime.strptime(date_text.strip(), "%d %b %Y")
-            return self.week_ago <= date_obj <= self.today
-        except ValueError as e:
-            logger.warning(f"Could not parse date: {date_text}. Error: {str(e)}")
-            return False
-            
-    async def is_date_older_than_range(self, date_text: str) -> bool:
-        """Check if a date is older than our range"""
-        try:
-            date_obj = datetime.strptime(date_text.strip(), "%d %b %Y")
-            return date_obj < self.week_ago
-        except ValueError:
-            return False
+        logger.info("TendersInfo scraper initialized")
     
-    async def extract_table_data(self) -> Tuple[List[Dict], bool]:
+    async def extract_table_data(self) -> List[Dict]:
         """
         Required by BaseScraper - we'll implement it to extract global tenders
         and table with tenders from other countries
-        
-        Returns:
-            Tuple[List[Dict], bool]: (results, should_stop)
         """
         tender_links = await self.extract_tender_links()
         
         if not tender_links:
-            return [], False
+            return []
+            
+        if self.page_is_known([link['href'] for link in tender_links]):
+            return []
             
-        # Process tender links in parallel batches
-        batch_size = MAX_CONCURRENT_PAGES
+        # Process tender links in parallel batches of the source's concurrency
+        batch_size = self.concurrent_pages
         all_results = []
-        should_stop = False
         
         for i in range(0, len(tender_links), batch_size):
             batch = tender_links[i:i+batch_size]
             logger.info(f"Processing batch {i//batch_size + 1} ({len(batch)} tenders)")
             
-            batch_results, batch_should_stop = await self.process_tender_batch(batch)
+            batch_results = await self.process_tender_batch(batch)
             all_results.extend(batch_results)
             
-            if batch_should_stop:
-                should_stop = True
-            
             logger.info(f"Found {len(batch_results)} matching tenders in this batch")
             
-        return all_results, should_stop
+        return all_results
 
     async def extract_tender_details(self, detail_url: str) -> Optional[Dict]:
         """Extract details from a specific tender page"""
-        detail_page = None
         try:
-            # Use semaphore to limit concurrent pages
-            async with self.semaphore:
-                # Create a new page for the detail view to avoid navigation issues
-                detail_page = await self.context.new_page()
-                await detail_page.goto(detail_url)
-                await detail_page.wait_for_load_state("networkidle")
-                
-                # Wait for the form to load
-                await detail_page.wait_for_selector(".form-horizontal", state="visible")
-                
-                # Extract all required fields
-                tender_data = {}
-                
-                # Extract Tender TI Ref No
-                ref_no_elem = await detail_page.query_selector("label:text('Tender TI Ref No') + div p")
-                if ref_no_elem:
-                    tender_data['ref_no'] = await ref_no_elem.inner_text()
-                
-                # Extract Tender Date
-                date_elem = await detail_page.query_selector("label:text('Tender Date') + div p")
-                if date_elem:
-                    tender_data['date'] = await date_elem.inner_text()
-                
-                # Extract Tender Description
-                desc_elem = await detail_page.query_selector("label:text('Tender Description') + div p")
-                if desc_elem:
-                    tender_data['description'] = await desc_elem.inner_text()
-                
-                # Extract Tender Deadline
-                deadline_elem = await detail_page.query_selector("label:text('Tender Deadline') + div p")
-                if deadline_elem:
-                    tender_data['deadline'] = await deadline_elem.inner_text()
-                
-                # Extract Tender Project Location
-                location_elem = await detail_page.query_selector("label:text('Tender Project Location') + div p")
-                if location_elem:
-                    tender_data['location'] = await location_elem.inner_text()
-                
-                # Extract Tender Sector
-                sector_elem = await detail_page.query_selector("label:text('Tender Sector') + div p")
-                if sector_elem:
-                    tender_data['sector'] = await sector_elem.inner_text()
-                
-                # Extract Tender CPV
-                cpv_elem = await detail_page.query_selector("label:text('Tender CPV') + div p")
-                if cpv_elem:
-                    tender_data['cpv'] = await cpv_elem.inner_text()
-                
-                # Extract Tender Document Type
-                doc_type_elem = await detail_page.query_selector("label:text('Tender Document Type') + div p")
-                if doc_type_elem:
-                    tender_data['document_type'] = await doc_type_elem.inner_text()
-                
-                # Add original URL
-                tender_data['url'] = detail_url
-                
-                # Check if date is in our range
-                if 'date' in tender_data:
-                    date_text = tender_data['date'].strip()
-                    
-                    # Check if date is older than our range
-                    if await self.is_date_older_than_range(date_text):
-                        return "STOP_SEARCH"
-                        
-                    # Check if date is in our range
-                    if await self.is_date_in_range(date_text):
-                        return tender_data
-                
+            tender_data = await self.fetch_detail_fields(detail_url, self.read_tender_details)
+            if tender_data is None:
                 return None
-                
+
+            # Add original URL
+            tender_data['url'] = detail_url
+
+            # Check if date is in our range (an older date stops pagination)
+            if 'date' in tender_data and self.check_date(tender_data['date']):
+                return tender_data
+
+            return None
+
         except Exception as e:
             logger.error(f"Error extracting tender details from {detail_url}: {str(e)}")
             return None
-        finally:
-            if detail_page:
-                await detail_page.close()
+
+    async def read_tender_details(self, detail_page, detail_url: str) -> Optional[Dict]:
+        """Read tender fields on a pooled detail worker page"""
+        # Wait for the form to load
+        await self.open_detail(detail_page, detail_url)
+
+        return await self.read_rendered_fields(detail_page)
 
     async def extract_tender_links(self) -> List[Dict]:
         """Extract all tender links from Global Tenders and the country-specific tenders table"""
@@ -254,34 +167,29 @@ class TendersInfoScraper(BaseScraper):
             
         except Exception as e:
             logger.error(f"Error extracting tender links: {str(e)}")
+            self.mark_incomplete("could not read a listing page")
             return []
 
-    async def process_tender_batch(self, tender_links) -> Tuple[List[Dict], bool]:
+    async def process_tender_batch(self, tender_links) -> List[Dict]:
         """Process a batch of tender links in parallel"""
         tasks = []
         for link_data in tender_links:
-            title = link_data['title']
             href = link_data['href']
             
             if not href:
                 continue
                 
+            # Skip tenders already scraped by an earlier run
+            if self.is_known_notice(href):
+                continue
+                
             tasks.append(self.extract_tender_details(href))
         
         # Wait for all tasks to complete
         results = await asyncio.gather(*tasks)
         
-        # Check if any result is the stop signal
-        should_stop = False
-        filtered_results = []
-        
-        for result in results:
-            if result == "STOP_SEARCH":
-                should_stop = True
-            elif result is not None:
-                filtered_results.append(result)
-        
-        return filtered_results, should_stop
+        # Filter out None results
+        return [r for r in results if r]
 
     async def check_next_page(self) -> bool:
         """Required by BaseScraper - check if there's a next page and navigate to it"""
@@ -296,10 +204,8 @@ class TendersInfoScraper(BaseScraper):
                 
                 if is_visible and not is_disabled:
                     logger.info("Found 'Load More' button, clicking it")
-                    await load_more_button.click()
-                    await self.page.wait_for_load_state("networkidle")
                     # Wait for new tenders to be added to the DOM
-                    await self.page.wait_for_timeout(2000)  # Short delay to ensure new content is loaded
+                    await self.click_and_wait(load_more_button)
                     return True
             
             # Alternative: Check for numbered pagination
@@ -322,8 +228,7 @@ class TendersInfoScraper(BaseScraper):
                     
                     if next_page:
                         logger.info(f"Found next page link: {next_page}")
-                        await self.page.goto(next_page)
-                        await self.page.wait_for_load_state("networkidle")
+                        await self.open_listing(next_page)
                         return True
             
             logger.info("No next page found")
@@ -331,52 +236,48 @@ class TendersInfoScraper(BaseScraper):
                 
         except Exception as e:
             logger.error(f"Error checking next page: {str(e)}")
+            self.mark_incomplete("could not move to the next listing page")
             return False
 
     async def scrape_data(self):
         """Main scraping function"""
         try:
-            await self.init_browser()
-            await self.page.goto(self.base_url)
-            await self.page.wait_for_load_state("networkidle")
+            self.reset_results()
+            async with self:
+                await self.open_listing()
             
-            current_page = 1
-            stop_search = False
+                current_page = 1
             
-            while not stop_search:
-                logger.info(f"Processing page {current_page}")
+                while True:
+                    # Pages finished by the checkpointed run are only paged through
+                    if current_page <= self.resume_page:
+                        if not await self.check_next_page():
+                            break
+                        current_page += 1
+                        continue
+
+                    logger.info(f"Processing page {current_page}")
                 
-                # Extract data from current page
-                page_data, should_stop = await self.extract_table_data()
-                self.results.extend(page_data)
+                    # Extract data from current page
+                    page_data = await self.extract_table_data()
+                    await self.emit(page_data, page=current_page)
                 
-                logger.info(f"Found {len(page_data)} matching tenders on page {current_page}")
+                    logger.info(f"Found {len(page_data)} matching tenders on page {current_page}")
                 
-                # If we should stop searching further pages, break here
-                if should_stop:
-                    logger.info("Found dates older than our range, stopping search")
-                    break
+                    # Dates older than our range (or a known page) end the search
+                    if self.pagination_stopped:
+                        break
                 
-                # Check and navigate to next page if exists
-                has_next = await self.check_next_page()
-                if not has_next:
-                    logger.info("No more pages to process")
-                    break
+                    # Check and navigate to next page if exists
+                    has_next = await self.check_next_page()
+                    if not has_next:
+                        logger.info("No more pages to process")
+                        break
                     
-                current_page += 1
+                    current_page += 1
             
-            # Convert results to DataFrame
-            df = pd.DataFrame(self.results)
-            
-            if not df.empty:
-                logger.info(f"Total tenders collected: {len(df)}")
-            else:
-                logger.info("No matching tenders found")
-                
-            return df
+                return self.results_frame()
             
         except Exception as e:
             logger.error(f"Error during scraping: {str(e)}")
-            raise
-        finally:
-            await self.close_browser()
\ No newline at end of file
+            raise
\ No newline at end of file
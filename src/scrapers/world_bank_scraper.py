@@ -1,206 +1,302 @@
-
 # src/scrapers/world_bank_scraper.py
 
-from playwright.async_api import async_playwright, TimeoutError
-import asyncio
-from datetime import datetime, timedelta
+from playwright.async_api import TimeoutError
 import pandas as pd
+import asyncio
 import logging
-from typing import List, Dict, Tuple, Optional
+from typing import Any, AsyncIterator, List, Dict, Optional, Tuple
+from src.config.settings import (
+    WORLD_BANK_API, WORLD_BANK_API_PAGE_SIZE, WORLD_BANK_NOTICES_API, WORLD_BANK_PROJECTS_API
+)
 from src.scrapers.base_scraper import BaseScraper
-from src.utils.date_utils import normalize_date
+from src.utils.date_utils import parse_date
+from src.utils.html_extract import SelectorMap, labelled_fields
+from src.utils.http_fetcher import HttpFetcher
 
 logger = logging.getLogger(__name__)
 
-# Number of concurrent detail page processing
-MAX_CONCURRENT_PAGES = 5
-
 class WorldBankScraper(BaseScraper):
-    def __init__(self, base_url: str):
-        super().__init__(base_url)
-        # Format today's date and date from a week ago
-        self.today = datetime.now()
-        self.today_str = self.today.strftime("%B %d, %Y")  # Format: "April 30, 2025"
-        
-        # Calculate the date from a week ago
-        self.week_ago = self.today - timedelta(days=7)
-        self.week_ago_str = self.week_ago.strftime("%B %d, %Y")
-        
-        self.results = []
-        self.semaphore = None  # Will be initialized in scrape_data
+    SOURCE_NAME = "WorldBank"
+    NOTICE_URL_FIELD = 'description_link'
+    TITLE_FIELD = 'description'
+
+    # Browser settings
+    LAUNCH_ARGS = ['--disable-http2']  # This can help with connection issues
+    CONTEXT_OPTIONS = {
+        'viewport': {'width': 1280, 'height': 800},
+        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    DEFAULT_TIMEOUT = 180000  # 3 minutes timeout
+    CONCURRENT_PAGES = 5  # Concurrent detail pages
+    MAX_LISTING_PAGES = 100  # Very high limit - effectively unlimited
+
+    LISTING_READY_SELECTOR = "table.project-opt-table"
+    DETAIL_READY_SELECTOR = ".detail-download-section"
+
+    # Project detail fields: "<label>Team Leader</label><p class='document-info'>value</p>"
+    DETAIL_SELECTORS = SelectorMap(labelled_fields([
+        ('Project ID', 'project_id'),
+        ('Status', 'status'),
+        ('Team Leader', 'team_leader'),
+        ('Borrower', 'borrower'),
+        ('Disclosure Date', 'disclosure_date'),
+        ('Approval Date', 'approval_date'),
+        ('Effective Date', 'effective_date'),
+        ('Total Project Cost', 'total_project_cost'),
+        ('Implementing Agency', 'implementing_agency'),
+        ('Region', 'region'),
+        ('Fiscal Year', 'fiscal_year'),
+        ('Commitment Amount', 'commitment_amount'),
+        ('Environmental Category', 'environmental_category'),
+        ('Environmental and Social Risk', 'environmental_social_risk'),
+        ('Closing Date', 'closing_date'),
+        ('Last Update Date', 'last_update_date')
+    ], label="label", sibling="p.document-info"), ready_selector=".detail-download-section")
+
+    # Whole procurement table as plain rows
+    LISTING_SCRIPT = """
+        () => Array.from(document.querySelectorAll('table.project-opt-table tbody tr')).map(row => {
+            const cells = Array.from(row.querySelectorAll('td'));
+            if (cells.length < 6) return null;
+            const descLink = cells[0].querySelector('a');
+            const projLink = cells[2].querySelector('a');
+            return {
+                description: descLink ? descLink.innerText : cells[0].innerText,
+                description_link: descLink ? descLink.getAttribute('href') : null,
+                country: cells[1].innerText,
+                project_title: cells[2].innerText,
+                notice_type: cells[3].innerText,
+                language: cells[4].innerText,
+                publish_date: cells[5].innerText.trim(),
+                project_link: projLink ? projLink.getAttribute('href') : null
+            };
+        }).filter(row => row !== null)
+    """
+
+    # Pages the API records link to, the same URLs as the table's links
+    NOTICE_URL = "https://projects.worldbank.org/en/projects-operations/procurement-detail/{}"
+    PROJECT_URL = "https://projects.worldbank.org/en/projects-operations/project-detail/{}"
+    TABLE_DATE_FORMAT = "%B %d, %Y"
+
+    # Procurement notices API fields read into the table's columns
+    API_NOTICE_FIELDS = ['id', 'bid_description', 'project_ctry_name', 'project_name', 'project_id',
+                         'notice_type', 'notice_lang_name', 'noticedate']
+    # Projects API field -> project detail column (the DETAIL_SELECTORS fields)
+    API_PROJECT_FIELDS = {
+        'id': 'project_id',
+        'status': 'status',
+        'teamleadname': 'team_leader',
+        'borrower': 'borrower',
+        'public_disclosure_date': 'disclosure_date',
+        'boardapprovaldate': 'approval_date',
+        'effective_date': 'effective_date',
+        'curr_project_cost': 'total_project_cost',
+        'impagency': 'implementing_agency',
+        'regionname': 'region',
+        'fiscalyear': 'fiscal_year',
+        'curr_total_commitment': 'commitment_amount',
+        'envassesmentcategorycode': 'environmental_category',
+        'esrc_ovrl_risk_rate': 'environmental_social_risk',
+        'closingdate': 'closing_date',
+        'p2a_updated_date': 'last_update_date',
+    }
+
+    def __init__(self, base_url: str, use_api: bool = WORLD_BANK_API,
+                 notices_api: str = WORLD_BANK_NOTICES_API, projects_api: str = WORLD_BANK_PROJECTS_API,
+                 **kwargs):
+        super().__init__(base_url, **kwargs)
+        # Read the listing and project details as JSON from the search API behind the site
+        self.use_api = use_api
+        self.notices_api = notices_api
+        self.projects_api = projects_api
+        self.api_fetcher: Optional[HttpFetcher] = None
+        # Project details requested from the API this run (many notices share a project)
+        self._api_projects: Dict[str, asyncio.Future] = {}
         
-        logger.info(f"World Bank scraper initialized")
-        logger.info(f"Date range: {self.week_ago_str} to {self.today_str}")
-
-    async def init_browser(self):
-        """Initialize browser instance"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=False,
-            args=['--disable-http2']  # This can help with connection issues
-        )
-        self.context = await self.browser.new_context(
-            viewport={'width': 1280, 'height': 800},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        )
-        self.context.set_default_timeout(180000)  # 3 minutes timeout
-        self.page = await self.context.new_page()
-        # Create a semaphore to limit concurrent pages
-        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
-
-    async def close_browser(self):
-        """Close browser instance"""
-        await self.context.close()
-        await self.browser.close()
-        await self.playwright.stop()
-
-    async def is_date_in_range(self, date_text: str) -> bool:
-        """Check if a date is within our specified range (week_ago to today)"""
-        try:
-            # World Bank format is like "April 28, 2025"
-            date_obj = datetime.strptime(date_text.strip(), "%B %d, %Y")
-            return self.week_ago <= date_obj <= self.today
-        except ValueError:
-            logger.warning(f"Could not parse date: {date_text}")
-            return False
-            
-    async def is_date_older_than_range(self, date_text: str) -> bool:
-        """Check if a date is older than our range"""
+        logger.info(f"World Bank scraper initialized ({'search API' if use_api else 'procurement table'})")
+
+    @staticmethod
+    def api_value(value: Any) -> str:
+        """An API field as the text the site shows: lists joined, missing values empty"""
+        if value is None:
+            return ''
+        if isinstance(value, list):
+            return "; ".join(str(item) for item in value if item not in (None, ''))
+        return str(value).strip()
+
+    def api_date(self, value: Any) -> str:
+        """An API date ("2025-02-24T00:00:00Z", "24-Feb-2025") in the table's "February 24, 2025" format"""
+        text = self.api_value(value)
+        date_obj = parse_date(text)
+        return date_obj.strftime(self.TABLE_DATE_FORMAT) if date_obj else text
+
+    def notice_row(self, notice: Dict) -> Dict:
+        """A procurement notices API record as a listing row, with the table's columns"""
+        notice_id = self.api_value(notice.get('id'))
+        project_id = self.api_value(notice.get('project_id'))
+        return {
+            'description': self.api_value(notice.get('bid_description')) or self.api_value(notice.get('project_name')),
+            'description_link': self.NOTICE_URL.format(notice_id) if notice_id else None,
+            'country': self.api_value(notice.get('project_ctry_name')),
+            'project_title': self.api_value(notice.get('project_name')),
+            'notice_type': self.api_value(notice.get('notice_type')),
+            'language': self.api_value(notice.get('notice_lang_name')),
+            'publish_date': self.api_date(notice.get('noticedate')),
+            'project_link': self.PROJECT_URL.format(project_id) if project_id else None
+        }
+
+    async def api_listing_pages(self) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """Page through the procurement notices API, yielding (page number, rows in our date range)"""
+        page_size = WORLD_BANK_API_PAGE_SIZE
+        current_page = self.resume_page + 1
+        while True:
+            params = {
+                'format': 'json',
+                'apilang': 'en',
+                'fl': ",".join(self.API_NOTICE_FIELDS),
+                'srt': 'noticedate',
+                'order': 'desc',
+                'strdate': self.date_window.since.isoformat(),
+                'enddate': self.date_window.until.isoformat(),
+                'rows': page_size,
+                'os': (current_page - 1) * page_size
+            }
+            logger.info(f"Requesting notices API page {current_page}")
+            self.metrics.count("listing_navigations")
+            with self.metrics.timer("listing_navigation"):
+                response = await self.api_fetcher.fetch_json(self.notices_api, params)
+            # A failed first page yields nothing, so scrape_data falls back to the table
+            if not isinstance(response, dict):
+                logger.error(f"World Bank notices API request failed for page {current_page}")
+                if current_page > self.resume_page + 1:
+                    # Later pages are not read from the table, the listing stops short
+                    self.mark_incomplete(f"notices API page {current_page} failed")
+                return
+
+            with self.metrics.timer("listing_extraction"):
+                notices = response.get('procnotices') or []
+                if isinstance(notices, dict):
+                    notices = list(notices.values())
+                rows = [self.notice_row(notice) for notice in notices if isinstance(notice, dict)]
+            self.metrics.count("listing_rows", len(rows))
+            logger.info(f"Found {len(rows)} notices in the API response")
+
+            rows = self.rows_in_window(rows, 'publish_date')
+            if self.page_is_known([row['description_link'] for row in rows]):
+                rows = []
+            logger.info(f"Found {len(rows)} listing rows in our date range on page {current_page}")
+            yield current_page, rows
+
+            if self.pagination_stopped:
+                return
+            try:
+                total = int(response.get('total') or 0)
+            except (TypeError, ValueError):
+                total = 0
+            if len(notices) < page_size or current_page * page_size >= total:
+                logger.info("No more pages to process")
+                return
+            if self.MAX_LISTING_PAGES is not None and current_page >= self.MAX_LISTING_PAGES:
+                logger.info(f"Reached maximum page limit ({self.MAX_LISTING_PAGES}). Stopping search.")
+                return
+            current_page += 1
+
+    async def request_api_project(self, project_id: str) -> Optional[Dict]:
+        """Project detail fields from the projects API, None when it has no usable record"""
+        params = {
+            'format': 'json',
+            'apilang': 'en',
+            'fl': ",".join(self.API_PROJECT_FIELDS),
+            'id': project_id
+        }
+        self.metrics.count("detail_api_requests")
+        with self.metrics.timer("detail_http"):
+            response = await self.api_fetcher.fetch_json(self.projects_api, params)
+        projects = response.get('projects') if isinstance(response, dict) else None
+        project = projects.get(project_id) if isinstance(projects, dict) else None
+        if not isinstance(project, dict):
+            return None
+        details = {}
+        for field, column in self.API_PROJECT_FIELDS.items():
+            value = project.get(field)
+            if value in (None, '', []):
+                continue
+            details[column] = self.api_date(value) if column.endswith('_date') else self.api_value(value)
+        return details or None
+
+    async def api_project_details(self, project_url: str) -> Optional[Dict]:
+        """Project details of a project link from the API, requested once per project and run"""
+        project_id = project_url.rstrip('/').rsplit('/', 1)[-1]
+        if project_id not in self._api_projects:
+            self._api_projects[project_id] = asyncio.ensure_future(self.request_api_project(project_id))
         try:
-            date_obj = datetime.strptime(date_text.strip(), "%B %d, %Y")
-            return date_obj < self.week_ago
-        except ValueError:
-            return False
+            # Shielded: other rows of the same project await this request too
+            return await asyncio.shield(self._api_projects[project_id])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"World Bank projects API request for {project_id} failed: {str(e)}")
+            return None
+
+    async def cancel_api_projects(self):
+        """Cancel project requests no row is waiting for any more"""
+        pending = [task for task in self._api_projects.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._api_projects = {}
 
     async def extract_project_details(self, project_url: str) -> Optional[Dict]:
         """Extract additional project details from the project page"""
-        detail_page = None
         try:
-            # Use semaphore to limit concurrent pages
-            async with self.semaphore:
-                # Create a new page for the project detail
-                detail_page = await self.context.new_page()
-                
-                # Try to load the page with multiple retry options
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        await detail_page.goto(project_url, timeout=60000)  # 60 seconds
-                        break
-                    except TimeoutError:
-                        if attempt < max_retries - 1:
-                            logger.warning(f"Attempt {attempt+1} timed out, retrying...")
-                            await asyncio.sleep(2)  # Wait 2 seconds before retrying
-                        else:
-                            logger.error(f"Failed to load project details after {max_retries} attempts")
-                            return None
-                
-                # Wait for page to load with more flexible options
-                try:
-                    await detail_page.wait_for_load_state("domcontentloaded", timeout=30000)
-                    
-                    # Wait for the project details container
-                    await detail_page.wait_for_selector(".detail-download-section", 
-                                                       state="visible", 
-                                                       timeout=30000)
-                except TimeoutError:
-                    logger.warning("Timeout waiting for project details, proceeding with partial content")
-                
-                # Initialize project details dictionary
-                project_details = {}
-                
-                # Extract Project ID (with timeout handling)
-                try:
-                    project_id_elem = await detail_page.query_selector("label:text('Project ID') + p.document-info")
-                    if project_id_elem:
-                        project_details['project_id'] = await project_id_elem.inner_text()
-                except Exception as e:
-                    logger.warning(f"Error extracting Project ID: {str(e)}")
-                
-                # Extract key fields with error handling
-                fields_to_extract = [
-                    ('Status', 'status'),
-                    ('Team Leader', 'team_leader'),
-                    ('Borrower', 'borrower'),
-                    ('Disclosure Date', 'disclosure_date'),
-                    ('Approval Date', 'approval_date'),
-                    ('Effective Date', 'effective_date'),
-                    ('Total Project Cost', 'total_project_cost'),
-                    ('Implementing Agency', 'implementing_agency'),
-                    ('Region', 'region'),
-                    ('Fiscal Year', 'fiscal_year'),
-                    ('Commitment Amount', 'commitment_amount'),
-                    ('Environmental Category', 'environmental_category'),
-                    ('Environmental and Social Risk', 'environmental_social_risk'),
-                    ('Closing Date', 'closing_date'),
-                    ('Last Update Date', 'last_update_date')
-                ]
-                
-                for label, key in fields_to_extract:
-                    try:
-                        elem = await detail_page.query_selector(f"label:text('{label}') + p.document-info")
-                        if elem:
-                            project_details[key] = await elem.inner_text()
-                    except Exception:
-                        continue
-                
-                return project_details
-                
+            return await self.fetch_detail_fields(project_url, self.read_project_details)
         except Exception as e:
             logger.error(f"Error extracting project details from {project_url}: {str(e)}")
             return None
-        finally:
-            if detail_page:
-                await detail_page.close()
 
-    async def process_row(self, row) -> Optional[Dict]:
-        """Process a single row from the table"""
+    async def read_project_details(self, detail_page, project_url: str) -> Optional[Dict]:
+        """Read project fields on a pooled detail worker page"""
+        await self.goto_ready(detail_page, project_url, timeout=60000)
+
+        await self.wait_ready(detail_page, self.DETAIL_READY_SELECTOR, timeout=30000)
+
+        return await self.read_rendered_fields(detail_page)
+
+    async def process_row(self, row: Dict) -> Optional[Dict]:
+        """Process a single row read from the table (already known to be in our date range)"""
         try:
-            cells = await row.query_selector_all("td")
-            if not cells or len(cells) < 6:
-                return None
-                
-            # Extract published date from the last column
-            date_text = await cells[5].inner_text()
-            date_text = date_text.strip()
+            # Published date comes from the last column
+            date_text = row['publish_date']
             
-            # Check if date is older than our range (signal to stop searching further pages)
-            if await self.is_date_older_than_range(date_text):
-                return "STOP_SEARCH"
-                
-            # Check if date is in our range
-            if not await self.is_date_in_range(date_text):
+            # Skip notices already scraped by an earlier run
+            if self.is_known_notice(row['description_link']):
                 return None
             
             # If we're here, the date is in our range
-            row_data = {}
-            
-            # Extract description and its link
-            desc_cell = cells[0]
-            desc_link = await desc_cell.query_selector("a")
-            if desc_link:
-                row_data['description'] = await desc_link.inner_text()
-                row_data['description_link'] = await desc_link.get_attribute('href')
-            else:
-                row_data['description'] = await desc_cell.inner_text()
+            row_data = {'description': row['description']}
+            if row['description_link']:
+                row_data['description_link'] = row['description_link']
 
             # Get basic info from the row
             row_data.update({
-                'country': await cells[1].inner_text(),
-                'project_title': await cells[2].inner_text(),
-                'notice_type': await cells[3].inner_text(),
-                'language': await cells[4].inner_text(),
+                'country': row['country'],
+                'project_title': row['project_title'],
+                'notice_type': row['notice_type'],
+                'language': row['language'],
                 'publish_date': date_text
             })
 
             # Get project link if exists
-            proj_link = await cells[2].query_selector("a")
-            if proj_link:
-                project_url = await proj_link.get_attribute('href')
+            project_url = row['project_link']
+            if project_url:
                 row_data['project_link'] = project_url
                 
-                # Extract additional project details
-                project_details = await self.extract_project_details(project_url)
+                # Extract additional project details (the project page when the API has none)
+                project_details = None
+                if self.api_fetcher is not None:
+                    project_details = await self.api_project_details(project_url)
+                if project_details is None:
+                    project_details = await self.extract_project_details(project_url)
                 if project_details:
                     row_data.update(project_details)
 
@@ -211,104 +307,27 @@ class WorldBankScraper(BaseScraper):
             logger.error(f"Error processing row: {str(e)}")
             return None
 
-    async def process_rows_batch(self, rows) -> Tuple[List[Dict], bool]:
-        """Process a batch of table rows in parallel"""
-        tasks = []
-        for row in rows:
-            tasks.append(self.process_row(row))
-        
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks)
-        
-        # Check if any result is the stop signal
-        should_stop = False
-        filtered_results = []
-        
-        for result in results:
-            if result == "STOP_SEARCH":
-                should_stop = True
-            elif result is not None:
-                filtered_results.append(result)
-        
-        return filtered_results, should_stop
-
-    async def check_page_for_date_range(self) -> Tuple[bool, bool]:
-        """
-        Check if current page has any rows with dates in our range.
-        Also checks if we should stop searching because we've found older dates.
-        
-        Returns:
-            Tuple[bool, bool]: (has_matches, should_stop_searching)
-        """
-        try:
-            rows = await self.page.query_selector_all("table.project-opt-table tbody tr")
-            has_matches = False
-            should_stop_searching = False
-            all_dates_newer = True  # Track if all dates on page are newer than range
-            
-            for row in rows:
-                cells = await row.query_selector_all("td")
-                if cells and len(cells) >= 6:
-                    date_text = await cells[5].inner_text()
-                    date_text = date_text.strip()
-                    
-                    # Check if date is in our range
-                    if await self.is_date_in_range(date_text):
-                        has_matches = True
-                        all_dates_newer = False
-                    
-                    # Check if date is older than our range
-                    if await self.is_date_older_than_range(date_text):
-                        should_stop_searching = True
-                        all_dates_newer = False
-            
-            # If all dates are newer and none are in range, we should keep going
-            if all_dates_newer and not has_matches:
-                logger.info("All dates on this page are newer than our range, continuing to next page")
-            
-            return (has_matches, should_stop_searching)
-        except Exception as e:
-            logger.error(f"Error checking page for date range: {str(e)}")
-            return (False, False)
-
-    async def extract_table_data(self) -> Tuple[List[Dict], bool]:
-        """
-        Extract matching rows from the current page
-        
-        Returns:
-            Tuple[List[Dict], bool]: (results, should_stop)
-        """
+    async def extract_table_data(self) -> List[Dict]:
+        """Read the current page's rows in our date range"""
         try:
-            # Get all rows from the table
-            rows = await self.page.query_selector_all("table.project-opt-table tbody tr")
+            # Read all rows from the table
+            rows = await self.read_listing_rows()
             logger.info(f"Found {len(rows)} rows in the table")
             
             if not rows:
-                return [], False
+                return []
             
-            # Process rows in parallel batches
-            batch_size = MAX_CONCURRENT_PAGES
-            all_results = []
-            should_stop = False
+            rows = self.rows_in_window(rows, 'publish_date')
             
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i:i+batch_size]
-                logger.info(f"Processing batch {i//batch_size + 1} ({len(batch)} rows)")
-                
-                batch_results, batch_should_stop = await self.process_rows_batch(batch)
-                all_results.extend(batch_results)
-                
-                if batch_should_stop:
-                    should_stop = True
-                    break
-                
-                logger.info(f"Found {len(batch_results)} matching rows in this batch")
+            if self.page_is_known([row['description_link'] for row in rows]):
+                return []
             
-            return all_results, should_stop
+            return rows
             
         except Exception as e:
             logger.error(f"Error extracting table data: {str(e)}")
-            return [], False
+            self.mark_incomplete("could not read a listing page")
+            return []
 
     async def check_next_page(self) -> bool:
         """Check if there's a next page and navigate to it if exists"""
@@ -317,23 +336,13 @@ class WorldBankScraper(BaseScraper):
             next_button = await self.page.query_selector("li:not(.disabled) a i.fa.fa-angle-right:not(.fa-angle-right + i)")
             if next_button:
                 # Find the parent <a> element to get the href
-                next_link = await next_button.evaluate("el => el.closest('a')")
+                next_link = await next_button.evaluate_handle("el => el.closest('a')")
                 logger.info("Found next page link")
                 
-                # Click the next button
-                await next_button.evaluate("el => el.closest('a').click()")
-                
-                # Wait for navigation with more flexible timeout
+                # Click the next button and wait until the table shows the next page
                 try:
-                    await self.page.wait_for_load_state("domcontentloaded", timeout=60000)
-                    # Wait for table to appear on the next page
-                    await self.page.wait_for_selector("table.project-opt-table", 
-                                                   state="visible", 
-                                                   timeout=60000)
+                    await self.click_and_wait(next_link, js_click=True)
                     logger.info("Successfully navigated to next page")
-                    
-                    # Add a short sleep to let the page stabilize
-                    await asyncio.sleep(2)
                     return True
                 except TimeoutError:
                     logger.warning("Timeout navigating to next page, trying to continue anyway")
@@ -344,6 +353,7 @@ class WorldBankScraper(BaseScraper):
                         return True
                     else:
                         logger.error("Table not found after navigation - cannot continue")
+                        self.mark_incomplete("the next listing page did not render")
                         return False
             else:
                 logger.info("No next page button found - reached the end of pagination")
@@ -362,110 +372,57 @@ class WorldBankScraper(BaseScraper):
                     return True
                 else:
                     logger.error("Navigation failed, cannot determine current page")
+                    self.mark_incomplete("could not move to the next listing page")
                     return False
             except Exception:
                 logger.error("Failed to verify current page, stopping pagination")
+                self.mark_incomplete("could not move to the next listing page")
                 return False
 
     async def scrape_data(self):
         """Main scraping function"""
         try:
-            await self.init_browser()
-            
-            # Go to the page with more robust handling
-            logger.info(f"Navigating to {self.base_url}...")
-            
-            # Try with multiple loading states and retry
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    await self.page.goto(self.base_url, timeout=120000, wait_until="domcontentloaded")
-                    logger.info("Page loaded (DOM content)")
-                    
-                    # Try to wait for the table to appear
-                    try:
-                        await self.page.wait_for_selector("table.project-opt-table", 
-                                                        state="visible", 
-                                                        timeout=60000)
-                        logger.info("Table found")
-                        break
-                    except TimeoutError:
-                        logger.warning("Table not found after timeout, will try alternative approach")
-                        
-                        # Alternative: wait for any table
-                        await self.page.wait_for_selector("table", state="visible", timeout=30000)
-                        logger.info("Found a table element, proceeding")
-                        break
-                except TimeoutError:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Attempt {attempt+1} timed out, retrying...")
-                        await asyncio.sleep(5)  # Wait 5 seconds before retrying
-                    else:
-                        logger.error(f"Failed to load page after {max_retries} attempts")
-                        # Try one last approach - just wait for any content
-                        await self.page.goto(self.base_url, timeout=120000, wait_until="commit")
-                        await asyncio.sleep(10)  # Wait 10 seconds for any content to load
+            self.reset_results()
+            async with self:
+                if self.use_api and await self.scrape_api():
+                    return self.results_frame()
             
-            # If we get here, check if we have the table
-            table_exists = await self.page.query_selector("table.project-opt-table")
-            if not table_exists:
-                logger.error("The World Bank table is not visible. Cannot proceed.")
-                return pd.DataFrame()  # Return empty DataFrame
+                # Go to the page with more robust handling
+                logger.info(f"Navigating to {self.base_url}...")
             
-            current_page = 1
-            MAX_PAGES = 100  # Very high limit - effectively unlimited
-            found_older_date = False
-            no_more_pages = False
+                # A table that never renders is handled below
+                if await self.goto_ready(self.page, self.base_url, self.LISTING_READY_SELECTOR,
+                                         ready_timeout=60000, timeout=120000):
+                    logger.info("Table found")
             
-            while current_page <= MAX_PAGES and not no_more_pages:
-                logger.info(f"Processing page {current_page}")
-                
-                # First check if this page has any matching dates in our range
-                has_matches, should_stop_searching = await self.check_page_for_date_range()
-                
-                if has_matches:
-                    logger.info(f"Found dates in our range on page {current_page}, extracting data")
-                    # Extract data from current page
-                    page_data, should_stop = await self.extract_table_data()
-                    self.results.extend(page_data)
-                    
-                    logger.info(f"Found {len(page_data)} matching rows on page {current_page}")
-                    
-                    # If we should stop searching further pages, break here
-                    if should_stop or should_stop_searching:
-                        logger.info("Found dates older than our range, stopping search")
-                        found_older_date = True
-                        break
-                elif should_stop_searching:
-                    logger.info(f"Found dates older than our range on page {current_page}, stopping search")
-                    found_older_date = True
-                    break
-                else:
-                    logger.info(f"No matching dates found on page {current_page}, checking next page")
-                
-                # Check and navigate to next page if exists
-                has_next = await self.check_next_page()
-                if not has_next:
-                    logger.info("No more pages to process")
-                    break
-                    
-                current_page += 1
-                
-            if current_page >= MAX_PAGES:
-                logger.info(f"Reached maximum page limit ({MAX_PAGES}). Stopping search.")
+                # If we get here, check if we have the table
+                table_exists = await self.page.query_selector("table.project-opt-table")
+                if not table_exists:
+                    logger.error("The World Bank table is not visible. Cannot proceed.")
+                    self.mark_incomplete("the procurement table never rendered")
+                    return pd.DataFrame()  # Return empty DataFrame
             
-            # Convert results to DataFrame
-            df = pd.DataFrame(self.results)
+                # Page through the listing while detail workers fetch the project pages
+                await self.pipeline_details(self.listing_pages(), self.process_row)
             
-            if not df.empty:
-                logger.info(f"Total rows collected: {len(df)}")
-            else:
-                logger.info("No matching rows found")
-                
-            return df
+                return self.results_frame()
             
         except Exception as e:
             logger.error(f"Error during scraping: {str(e)}")
             raise
+
+    async def scrape_api(self) -> bool:
+        """Collect the listing from the search API; False when it is unavailable and the table is needed"""
+        owns_fetcher = self.http_fetcher is None
+        self.api_fetcher = self.http_fetcher or HttpFetcher(limiters=self.host_limits, archive=self.traffic)
+        self._api_projects = {}
+        try:
+            pages = await self.pipeline_details(self.api_listing_pages(), self.process_row)
         finally:
-            await self.close_browser()
\ No newline at end of file
+            await self.cancel_api_projects()
+            if owns_fetcher:
+                await self.api_fetcher.close()
+            self.api_fetcher = None
+        if not pages:
+            logger.warning("World Bank search API unavailable, falling back to the procurement table")
+        return pages > 0
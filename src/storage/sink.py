@@ -0,0 +1,68 @@
+# src/storage/sink.py
+
+import logging
+from typing import AsyncIterator, Dict, List
+import pandas as pd
+from src.config.settings import SINK_BATCH_SIZE
+from src.storage.writers import ResultWriter
+
+logger = logging.getLogger(__name__)
+
+
+class ResultSink:
+    """
+    Batches a scraper's streamed rows and flushes them to the output writers.
+
+    Every flush also records its rows in the seen index and checkpoints the
+    pages they complete. Whatever is buffered is flushed even when the crawl
+    fails, so the pages completed before an error are kept and a resumed run
+    continues after them.
+    """
+
+    def __init__(self, scraper, writers: List[ResultWriter], batch_size: int = SINK_BATCH_SIZE):
+        self.scraper = scraper
+        self.writers = writers
+        self.batch_size = batch_size
+        self.buffer: List[Dict] = []
+        self.written = 0
+        # Set when a writer raised; a batch some writers may already have is never written again
+        self.failed = False
+
+    def flush(self):
+        """Write the buffered rows to every writer"""
+        if not self.buffer:
+            self.scraper.commit_progress(self.written)
+            return
+        rows, self.buffer = self.buffer, []
+        try:
+            with self.scraper.metrics.timer("output"):
+                df = self.scraper.normalize_frame(pd.DataFrame(rows))
+                for writer in self.writers:
+                    writer.write(self.scraper, df)
+        except Exception:
+            self.failed = True
+            raise
+        # Only index notices once they are safely on disk
+        self.scraper.remember_notices(rows)
+        self.written += len(rows)
+        logger.debug(f"{self.scraper.SOURCE_NAME}: flushed {len(rows)} rows ({self.written} total)")
+        self.scraper.commit_progress(self.written)
+
+    async def consume(self, rows: AsyncIterator[Dict]) -> int:
+        """Drain an iter_rows() stream, flushing every batch_size rows; returns rows written"""
+        try:
+            async for row in rows:
+                self.buffer.append(row)
+                if len(self.buffer) >= self.batch_size:
+                    self.flush()
+        except BaseException:
+            # Keep the rows read before a crawl error, without hiding the error behind a write failure
+            if not self.failed:
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error(f"{self.scraper.SOURCE_NAME}: could not flush rows after a failed crawl: {str(e)}")
+            raise
+        self.flush()
+        self.scraper.finish_checkpoint()
+        return self.written
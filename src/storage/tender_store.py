@@ -0,0 +1,145 @@
+# src/storage/tender_store.py
+
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+import pandas as pd
+from src.config.settings import TENDER_STORE_PATH
+
+logger = logging.getLogger(__name__)
+
+# Columns promoted out of the row JSON so they can be indexed and filtered
+STORE_COLUMNS = ['source', 'notice_id', 'publish_date', 'country', 'title', 'url',
+                 'first_seen', 'last_seen']
+
+
+class TenderStore:
+    """
+    Consolidated, append-only store of every notice scraped from every source.
+
+    Rows are upserted by (source, notice_id): a notice scraped again keeps its
+    first_seen time and gets its data and last_seen refreshed, so the table
+    holds exactly one row per notice however many runs have seen it. The full
+    scraped row is kept as JSON next to the indexed columns.
+    """
+
+    def __init__(self, path: Path = TENDER_STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tenders (
+                source TEXT NOT NULL,
+                notice_id TEXT NOT NULL,
+                publish_date TEXT,
+                country TEXT,
+                title TEXT,
+                url TEXT,
+                data TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                PRIMARY KEY (source, notice_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_tenders_publish_date ON tenders (publish_date);
+            CREATE INDEX IF NOT EXISTS idx_tenders_country ON tenders (country);
+            CREATE INDEX IF NOT EXISTS idx_tenders_source_date ON tenders (source, publish_date);
+        """)
+        self.conn.commit()
+
+    def upsert(self, records: Iterable[Dict]) -> int:
+        """
+        Insert or refresh records built by BaseScraper.to_store_record.
+
+        Each record needs source, notice_id and data; publish_date (ISO),
+        country, title and url are optional.
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        params = [(
+            record['source'],
+            record['notice_id'],
+            record.get('publish_date'),
+            record.get('country'),
+            record.get('title'),
+            record.get('url'),
+            json.dumps(record['data'], default=str, ensure_ascii=False),
+            now,
+            now
+        ) for record in records]
+
+        self.conn.executemany("""
+            INSERT INTO tenders (source, notice_id, publish_date, country, title, url, data,
+                                 first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (source, notice_id) DO UPDATE SET
+                publish_date = excluded.publish_date,
+                country = excluded.country,
+                title = excluded.title,
+                url = excluded.url,
+                data = excluded.data,
+                last_seen = excluded.last_seen
+        """, params)
+        self.conn.commit()
+        return len(params)
+
+    def query(self, source: Union[str, Sequence[str], None] = None,
+              country: Union[str, Sequence[str], None] = None,
+              published_from: Optional[str] = None, published_to: Optional[str] = None,
+              search: Optional[str] = None, limit: Optional[int] = None,
+              expand: bool = True) -> pd.DataFrame:
+        """
+        Query stored notices, newest publish date first.
+
+        source and country accept one value or a list; published_from and
+        published_to are inclusive ISO dates; search is a case-insensitive
+        substring of the title. With expand the scraped row's own columns are
+        added next to the store columns.
+        """
+        clauses: List[str] = []
+        params: List = []
+
+        for column, value in (('source', source), ('country', country)):
+            if value is None:
+                continue
+            values = [value] if isinstance(value, str) else list(value)
+            clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+            params.extend(values)
+        if published_from:
+            clauses.append("publish_date >= ?")
+            params.append(published_from)
+        if published_to:
+            clauses.append("publish_date <= ?")
+            params.append(published_to)
+        if search:
+            clauses.append("title LIKE ?")
+            params.append(f"%{search}%")
+
+        sql = f"SELECT {', '.join(STORE_COLUMNS)}, data FROM tenders"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY publish_date DESC, source, notice_id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        df = pd.read_sql_query(sql, self.conn, params=params)
+        if not expand or df.empty:
+            return df.drop(columns=['data'])
+
+        scraped = pd.DataFrame([json.loads(data) for data in df.pop('data')], index=df.index)
+        # Store columns win over scraped columns with the same name
+        scraped = scraped.drop(columns=[c for c in scraped.columns if c in df.columns])
+        return pd.concat([df, scraped], axis=1)
+
+    def count(self, source: Optional[str] = None) -> int:
+        """Number of stored notices, optionally for one source"""
+        if source is None:
+            return self.conn.execute("SELECT COUNT(*) FROM tenders").fetchone()[0]
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM tenders WHERE source = ?", (source,)
+        ).fetchone()[0]
+
+    def close(self):
+        self.conn.close()
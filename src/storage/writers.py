@@ -0,0 +1,179 @@
+# src/storage/writers.py
+
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+import pandas as pd
+from src.config.settings import OUTPUT_DIR, PARQUET_DIR, PUBLISHED_ON_COLUMN
+from src.storage.tender_store import TenderStore
+
+logger = logging.getLogger(__name__)
+
+
+class ResultWriter(ABC):
+    """Destination for one source's scraped rows, selected by name in OUTPUT_WRITERS"""
+
+    name = ""
+
+    @abstractmethod
+    def write(self, scraper, df: pd.DataFrame) -> int:
+        """Write a scraper's rows and return how many were written"""
+
+    def close(self):
+        pass
+
+
+class StoreWriter(ResultWriter):
+    """Upserts rows into the consolidated tender store"""
+
+    name = "store"
+
+    def __init__(self, store: Optional[TenderStore] = None):
+        self.store = store or TenderStore()
+        self._owns_store = store is None
+
+    def write(self, scraper, df: pd.DataFrame) -> int:
+        stored = self.store.upsert(scraper.to_store_record(row) for row in df.to_dict('records'))
+        logger.info(f"{scraper.SOURCE_NAME}: {stored} notices upserted into {self.store.path}")
+        return stored
+
+    def close(self):
+        if self._owns_store:
+            self.store.close()
+
+
+class CsvWriter(ResultWriter):
+    """
+    The original output: one timestamped CSV per source and run.
+
+    Later batches of the same source are appended to that run's file. A
+    batch with columns the file does not have yet (e.g. detail fields only
+    some notices carry) rewrites it with the union of both headers.
+    """
+
+    name = "csv"
+
+    def __init__(self, output_dir: Path = OUTPUT_DIR):
+        self.output_dir = Path(output_dir)
+        self.files: Dict[str, Tuple[Path, List[str]]] = {}
+
+    def write(self, scraper, df: pd.DataFrame) -> int:
+        source = scraper.SOURCE_NAME
+        if source in self.files:
+            output_path, columns = self.files[source]
+            new_columns = [c for c in df.columns if c not in columns]
+            if new_columns:
+                # Read back as text so the rows already written are rewritten unchanged
+                written = pd.read_csv(output_path, dtype=str, keep_default_na=False)
+                columns = columns + new_columns
+                pd.concat([written, df], ignore_index=True).reindex(columns=columns).to_csv(output_path, index=False)
+                self.files[source] = (output_path, columns)
+                logger.info(f"{source}: {len(df)} rows added to {output_path}, "
+                            f"new columns {', '.join(new_columns)}")
+                return len(df)
+            df.reindex(columns=columns).to_csv(output_path, mode='a', header=False, index=False)
+            logger.info(f"{source}: {len(df)} rows appended to {output_path}")
+            return len(df)
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = self.output_dir / f"{source}_data_{timestamp}.csv"
+        df.to_csv(output_path, index=False)
+        self.files[source] = (output_path, list(df.columns))
+        logger.info(f"{source} data saved to {output_path}")
+        return len(df)
+
+
+class ParquetWriter(ResultWriter):
+    """
+    Typed Parquet dataset partitioned as source=<name>/publish_month=<YYYY-MM>.
+
+    List columns (e.g. AFD document_links) are stored as list<string> and the
+    canonical published_on column as date32, so the dataset loads with
+    pd.read_parquet(PARQUET_DIR) without re-parsing. Rows whose date cannot
+    be parsed land in publish_month=unknown.
+    """
+
+    name = "parquet"
+
+    def __init__(self, root: Path = PARQUET_DIR):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("The parquet writer needs pyarrow (pip install pyarrow)") from e
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.root = Path(root)
+
+    @staticmethod
+    def list_columns(scraper, df: pd.DataFrame) -> Set[str]:
+        """Columns declared as many-valued detail fields, plus any column holding a list"""
+        declared = set()
+        if scraper.DETAIL_SELECTORS is not None:
+            declared = {key for key, field in scraper.DETAIL_SELECTORS.fields.items()
+                        if getattr(field, 'many', False)}
+        found = {c for c in df.columns
+                 if df[c].map(lambda v: isinstance(v, (list, tuple))).any()}
+        return (declared & set(df.columns)) | found
+
+    @staticmethod
+    def clean(value, is_list: bool):
+        if isinstance(value, (list, tuple)):
+            return [str(v) for v in value]
+        if value is None or pd.isna(value):
+            return None
+        return [str(value)] if is_list else str(value)
+
+    def to_table(self, part: pd.DataFrame, list_columns: Set[str]):
+        rows = part.to_dict('records')
+        arrays, fields = [], []
+        for column in part.columns:
+            if column == PUBLISHED_ON_COLUMN:
+                dates = [None if pd.isna(v) else v.date() for v in part[column]]
+                arrays.append(self.pa.array(dates, type=self.pa.date32()))
+                fields.append(self.pa.field(column, self.pa.date32()))
+                continue
+            is_list = column in list_columns
+            col_type = self.pa.list_(self.pa.string()) if is_list else self.pa.string()
+            values = [self.clean(row.get(column), is_list) for row in rows]
+            arrays.append(self.pa.array(values, type=col_type))
+            fields.append(self.pa.field(column, col_type))
+        return self.pa.Table.from_arrays(arrays, schema=self.pa.schema(fields))
+
+    def write(self, scraper, df: pd.DataFrame) -> int:
+        df = scraper.normalize_frame(df)
+        # Types are decided once per write so every partition shares one schema
+        list_columns = self.list_columns(scraper, df)
+        months = df[PUBLISHED_ON_COLUMN].dt.strftime('%Y-%m').fillna("unknown")
+
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        partitions = df.groupby(months, sort=False)
+        for month, part in partitions:
+            table = self.to_table(part, list_columns)
+            part_dir = self.root / f"source={scraper.SOURCE_NAME}" / f"publish_month={month}"
+            part_dir.mkdir(parents=True, exist_ok=True)
+            self.pq.write_table(table, part_dir / f"part-{run_id}.parquet")
+
+        logger.info(f"{scraper.SOURCE_NAME}: {len(df)} rows written to {partitions.ngroups} "
+                    f"Parquet partitions under {self.root}")
+        return len(df)
+
+
+WRITERS = {writer.name: writer for writer in (StoreWriter, CsvWriter, ParquetWriter)}
+
+
+def make_writers(names: List[str], tender_store: Optional[TenderStore] = None) -> List[ResultWriter]:
+    """Build the writers named in OUTPUT_WRITERS, sharing tender_store when given"""
+    writers = []
+    for name in names:
+        if name not in WRITERS:
+            raise ValueError(f"Unknown output writer {name!r}, expected one of {sorted(WRITERS)}")
+        if name == StoreWriter.name:
+            writers.append(StoreWriter(tender_store))
+        else:
+            writers.append(WRITERS[name]())
+    return writers
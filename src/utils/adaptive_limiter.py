@@ -0,0 +1,178 @@
+# src/utils/adaptive_limiter.py
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from src.config.settings import (
+    ADAPTIVE_LATENCY_FACTOR, ADAPTIVE_MAX_CONCURRENCY, ADAPTIVE_MIN_CONCURRENCY
+)
+
+logger = logging.getLogger(__name__)
+
+
+def is_throttle_status(status: Optional[int]) -> bool:
+    """429 and 5xx responses mean the server wants fewer concurrent requests"""
+    return status is not None and (status == 429 or status >= 500)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for the requests to one host.
+
+    The limit grows by about one request per round of healthy responses
+    while it is actually in use (additive increase) and is multiplied by
+    backoff on a timeout, a 429/5xx response or a latency far above the
+    host's baseline (multiplicative decrease). Decreases are spaced by the
+    current latency, so one burst of failures only counts once.
+    """
+
+    def __init__(self, host: str, initial: float, min_limit: int = ADAPTIVE_MIN_CONCURRENCY,
+                 max_limit: int = ADAPTIVE_MAX_CONCURRENCY,
+                 latency_factor: float = ADAPTIVE_LATENCY_FACTOR, backoff: float = 0.5):
+        self.host = host
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.limit = float(min(max(initial, min_limit), self.max_limit))
+        self.latency_factor = latency_factor
+        self.backoff = backoff
+        self.in_flight = 0
+        self.condition = asyncio.Condition()
+
+        # Latency EWMA and the host's uncongested baseline: its lowest value, drifting up
+        # slowly so a host that is simply slower later in the run is not held at the minimum
+        self.latency: Optional[float] = None
+        self.baseline: Optional[float] = None
+        self.last_decrease = 0.0
+
+        self.requests = 0
+        self.decreases = 0
+        self.peak = self.limit
+        self._limit_sum = 0.0
+
+    @property
+    def current(self) -> int:
+        """Requests allowed in flight right now"""
+        return max(self.min_limit, int(self.limit))
+
+    def slot(self) -> "LimiterSlot":
+        """Context manager holding one request slot and recording its outcome"""
+        return LimiterSlot(self)
+
+    async def acquire(self) -> bool:
+        """Wait for a free slot; True when the limit was fully used when it was taken"""
+        async with self.condition:
+            while self.in_flight >= self.current:
+                await self.condition.wait()
+            self.in_flight += 1
+            return self.in_flight >= self.current
+
+    async def release(self):
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def on_success(self, latency: float, saturated: bool):
+        """A request finished normally after latency seconds"""
+        self.requests += 1
+        self._limit_sum += self.limit
+        self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+        self.baseline = self.latency if self.baseline is None else min(self.baseline * 1.01, self.latency)
+
+        if self.requests >= 5 and self.latency > self.baseline * self.latency_factor:
+            self.on_overload(f"latency {self.latency:.2f}s against a {self.baseline:.2f}s baseline")
+        elif saturated and self.limit < self.max_limit:
+            # Only grow a limit that is actually the bottleneck
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.peak = max(self.peak, self.limit)
+
+    def on_overload(self, reason: str):
+        """The host is struggling: timeouts, 429/5xx or rising latency"""
+        now = time.monotonic()
+        if now - self.last_decrease < max(self.latency or 0.0, 1.0):
+            return
+        self.last_decrease = now
+        previous = self.current
+        self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        self.decreases += 1
+        logger.info(f"{self.host}: {reason}, concurrency {previous} -> {self.current}")
+
+    def summary(self) -> str:
+        average = self._limit_sum / self.requests if self.requests else self.limit
+        return (f"{self.host}: settled at {self.current} concurrent requests "
+                f"(average {average:.1f}, peak {int(self.peak)}, {self.decreases} backoffs, "
+                f"{self.requests} requests)")
+
+
+class LimiterSlot:
+    """One request's slot: times the request and feeds its outcome back to the limiter"""
+
+    def __init__(self, limiter: AdaptiveLimiter):
+        self.limiter = limiter
+        self.saturated = False
+        self.overloaded = False
+        self.started = 0.0
+
+    def overload(self, reason: str):
+        """Mark this request as throttled (e.g. a 429 or 5xx response)"""
+        self.overloaded = True
+        self.limiter.on_overload(reason)
+
+    async def pause(self, seconds: float):
+        """Give the slot back for seconds (e.g. a retry back-off) and take it again"""
+        await self.limiter.release()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.saturated = await self.limiter.acquire()
+            self.started = time.monotonic()
+
+    async def __aenter__(self):
+        self.saturated = await self.limiter.acquire()
+        self.started = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is not None:
+                if issubclass(exc_type, asyncio.TimeoutError) or 'Timeout' in exc_type.__name__:
+                    self.limiter.on_overload("timeout")
+            elif not self.overloaded:
+                self.limiter.on_success(time.monotonic() - self.started, self.saturated)
+        finally:
+            await self.limiter.release()
+        return False
+
+
+class HostLimiters:
+    """
+    One AdaptiveLimiter per host and channel, all starting at the same concurrency.
+
+    Plain HTTP fetches and browser renders of a host are limited separately,
+    their latencies are too different to share one baseline.
+    """
+
+    def __init__(self, initial: int, min_limit: int = ADAPTIVE_MIN_CONCURRENCY,
+                 max_limit: int = ADAPTIVE_MAX_CONCURRENCY):
+        self.initial = initial
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, initial)
+        self.limiters: Dict[str, AdaptiveLimiter] = {}
+
+    def for_url(self, url: str, channel: str = "http") -> AdaptiveLimiter:
+        key = f"{(urlsplit(url).hostname or '').lower()} ({channel})"
+        if key not in self.limiters:
+            self.limiters[key] = AdaptiveLimiter(key, self.initial, self.min_limit, self.max_limit)
+        return self.limiters[key]
+
+    def slot(self, url: str, channel: str = "http") -> LimiterSlot:
+        return self.for_url(url, channel).slot()
+
+    def report_status(self, url: str, status: Optional[int], channel: str = "browser"):
+        """Back off a host whose response was throttled, for statuses seen outside a slot"""
+        if is_throttle_status(status):
+            self.for_url(url, channel).on_overload(f"HTTP {status}")
+
+    def summary(self) -> str:
+        return "; ".join(limiter.summary() for limiter in self.limiters.values()) or "no requests"
@@ -0,0 +1,125 @@
+# src/utils/browser_pool.py
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+from playwright.async_api import async_playwright, Browser, BrowserContext
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    One Playwright instance shared by every scraper in a run.
+
+    Browsers are launched lazily (up to max_browsers per set of launch args)
+    and handed out as isolated contexts, at most max_contexts_per_browser per
+    browser. Sources with their own LAUNCH_ARGS get contexts on browsers
+    launched with them. A global page semaphore caps the number of detail
+    pages open across all sources.
+    """
+
+    def __init__(self, max_browsers: int = 1, max_contexts_per_browser: int = 4,
+                 max_pages: int = 20, headless: bool = False,
+                 launch_args: Optional[List[str]] = None):
+        self.max_browsers = max_browsers
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self.max_pages = max_pages
+        self.headless = headless
+        self.launch_args = launch_args or []
+
+        self.playwright = None
+        self.browsers: List[Browser] = []
+        self.context_counts: Dict[Browser, int] = {}
+        self.browser_args: Dict[Browser, Tuple[str, ...]] = {}
+        self.context_owners: Dict[BrowserContext, Browser] = {}
+
+        self.context_semaphore = asyncio.Semaphore(max_browsers * max_contexts_per_browser)
+        self.page_semaphore = asyncio.Semaphore(max_pages)
+        self.lock = asyncio.Lock()
+
+    async def start(self):
+        """Start the shared Playwright instance"""
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+            logger.info(f"Browser pool started (browsers: {self.max_browsers}, "
+                        f"contexts per browser: {self.max_contexts_per_browser}, pages: {self.max_pages})")
+
+    async def stop(self):
+        """Close every browser and stop Playwright"""
+        for browser in self.browsers:
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled browser: {str(e)}")
+        self.browsers = []
+        self.context_counts = {}
+        self.browser_args = {}
+        self.context_owners = {}
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+        logger.info("Browser pool stopped")
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def _pick_browser(self, args: Tuple[str, ...]) -> Browser:
+        """Return the least loaded browser launched with args, launching a new one while below the limit"""
+        async with self.lock:
+            browsers = [b for b in self.browsers if self.browser_args[b] == args]
+            if browsers:
+                browser = min(browsers, key=lambda b: self.context_counts[b])
+                if self.context_counts[browser] == 0 or len(browsers) >= self.max_browsers:
+                    self.context_counts[browser] += 1
+                    return browser
+
+            browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=list(args)
+            )
+            self.browsers.append(browser)
+            self.context_counts[browser] = 1
+            self.browser_args[browser] = args
+            logger.info(f"Launched pooled browser {len(browsers) + 1}/{self.max_browsers}"
+                        + (f" with {' '.join(args)}" if args else ""))
+            return browser
+
+    async def new_context(self, launch_args: Optional[List[str]] = None, **context_options) -> BrowserContext:
+        """
+        Acquire a fresh browser context from the pool (waits while the pool is full).
+
+        launch_args are added to the pool's own for the browser the context runs in.
+        """
+        if self.playwright is None:
+            await self.start()
+
+        args = tuple(dict.fromkeys([*self.launch_args, *(launch_args or [])]))
+        await self.context_semaphore.acquire()
+        try:
+            browser = await self._pick_browser(args)
+            try:
+                context = await browser.new_context(**context_options)
+            except BaseException:
+                self.context_counts[browser] -= 1
+                raise
+        except BaseException:
+            self.context_semaphore.release()
+            raise
+
+        self.context_owners[context] = browser
+        return context
+
+    async def release_context(self, context: BrowserContext):
+        """Close a context obtained from new_context and free its slot"""
+        browser = self.context_owners.pop(context, None)
+        try:
+            await context.close()
+        finally:
+            if browser is not None:
+                self.context_counts[browser] -= 1
+                self.context_semaphore.release()
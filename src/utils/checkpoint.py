@@ -0,0 +1,71 @@
+# src/utils/checkpoint.py
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+from src.config.settings import CHECKPOINT_DIR, CHECKPOINT_MAX_AGE_HOURS
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """
+    Progress of one source's crawl, saved as JSON so a failed run can resume.
+
+    page is the last listing page whose rows are on disk, pending the detail
+    URLs of the next page not yet scraped (sources that scrape a page in
+    several batches), and rows_emitted the rows written so far.
+    """
+
+    def __init__(self, source: str, directory: Path = CHECKPOINT_DIR):
+        self.source = source
+        self.path = Path(directory) / f"{source}.json"
+        self.page = 0
+        self.pending: List[str] = []
+        self.rows_emitted = 0
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+
+    def load(self, max_age_hours: float = CHECKPOINT_MAX_AGE_HOURS) -> bool:
+        """Load a saved checkpoint; False when there is none or it is too old to trust"""
+        if not self.path.exists():
+            return False
+        try:
+            state = json.loads(self.path.read_text(encoding='utf-8'))
+            updated_at = datetime.fromisoformat(state['updated_at'])
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.path}: {str(e)}")
+            return False
+
+        # Listings shift as notices are published, so old page numbers point at the wrong rows
+        if datetime.now() - updated_at > timedelta(hours=max_age_hours):
+            logger.info(f"Ignoring {self.source} checkpoint from {state['updated_at']}, it is too old")
+            return False
+
+        self.page = state.get('page', 0)
+        self.pending = state.get('pending', [])
+        self.rows_emitted = state.get('rows_emitted', 0)
+        self.started_at = state.get('started_at', self.started_at)
+        return True
+
+    def save(self):
+        """Write the checkpoint atomically so a crash never leaves half a file"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            'source': self.source,
+            'page': self.page,
+            'pending': self.pending,
+            'rows_emitted': self.rows_emitted,
+            'started_at': self.started_at,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """Remove the checkpoint once the crawl has finished"""
+        if self.path.exists():
+            self.path.unlink()
@@ -1,69 +1,97 @@
 # src/utils/date_utils.py
 
-from datetime import datetime
+import calendar
+from datetime import date
+from functools import lru_cache
 import logging
+import re
+from typing import Optional, Tuple
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# One pass over every date format used by the supported sites
+DATE_PATTERN = re.compile(r"""
+    ^\s*(?:
+        (?P<day1>\d{1,2})(?P<sep1>[\s-])+(?P<month1>[A-Za-z]{3,9})\.?[\s-]+(?P<year1>\d{4})  # 20 Feb 2025, 28-Feb-2025, 28 December 2022
+      | (?P<month2>[A-Za-z]{3,9})\.?\s+(?P<day2>\d{1,2}),?\s+(?P<year2>\d{4})              # February 24, 2025, Feb 28, 2025
+      | (?P<month3>\d{1,2})/(?P<day3>\d{1,2})/(?P<year3>\d{4})                             # 02/24/2025
+      | (?P<year4>\d{4})-(?P<month4>\d{1,2})-(?P<day4>\d{1,2})                             # 2025-02-24
+    )(?!\d)
+""", re.VERBOSE)
+
+MONTHS = {}
+for number, name in enumerate(calendar.month_name[1:], start=1):
+    MONTHS[name.lower()] = number
+    MONTHS[name[:3].lower()] = number
+MONTHS['sept'] = 9
+
+@lru_cache(maxsize=8192)
+def match_date(date_str: str) -> Optional[Tuple[date, str]]:
+    """
+    Parse a site date string into (date, site strftime format), or None.
+
+    Memoized by string, so the same listing date checked against the range,
+    the stop condition and the output costs a single regex match.
+    """
+    m = DATE_PATTERN.match(date_str)
+    if m is None:
+        return None
+    try:
+        if m.group('day1'):
+            month_name = m.group('month1')
+            month = MONTHS.get(month_name.lower())
+            if month is None:
+                return None
+            if m.group('sep1') == '-':
+                fmt = "%d-%b-%Y"
+            else:
+                fmt = "%d %b %Y" if len(month_name) == 3 else "%d %B %Y"
+            return date(int(m.group('year1')), month, int(m.group('day1'))), fmt
+        if m.group('month2'):
+            month_name = m.group('month2')
+            month = MONTHS.get(month_name.lower())
+            if month is None:
+                return None
+            fmt = "%b %d, %Y" if len(month_name) == 3 else "%B %d, %Y"
+            return date(int(m.group('year2')), month, int(m.group('day2'))), fmt
+        if m.group('month3'):
+            return date(int(m.group('year3')), int(m.group('month3')), int(m.group('day3'))), "%B %d, %Y"
+        return date(int(m.group('year4')), int(m.group('month4')), int(m.group('day4'))), "%B %d, %Y"
+    except ValueError:
+        # Matched the shape of a date but is not one (e.g. 31 Feb)
+        return None
+
+def parse_date(date_str) -> Optional[date]:
+    """Parse any supported site date string into a date, or None if it cannot be parsed"""
+    if not isinstance(date_str, str):
+        return None
+    matched = match_date(date_str.strip())
+    return matched[0] if matched else None
+
 def normalize_date(date_str: str) -> str:
     """Normalize date string to match required format"""
-    try:
-        # Handle various input date formats
-        date_str = date_str.strip()
-        
-        # First try the "February 24, 2025" format (World Bank)
-        try:
-            date_obj = datetime.strptime(date_str, "%B %d, %Y")
-            return date_obj.strftime("%B %d, %Y")
-        except ValueError:
-            pass
-            
-        # Try "DD MMM YYYY" format (EBRD format: 20 Feb 2025)
-        try:
-            date_obj = datetime.strptime(date_str, "%d %b %Y")
-            return date_obj.strftime("%d %b %Y")
-        except ValueError:
-            pass
-            
-        # Try "DD-MMM-YYYY" format (AfDB format: 28-Feb-2025)
-        try:
-            date_obj = datetime.strptime(date_str, "%d-%b-%Y")
-            return date_obj.strftime("%d-%b-%Y")
-        except ValueError:
-            pass
-            
-        # Try "DD Month YYYY" format (ISDB format: 28 December 2022)
-        try:
-            date_obj = datetime.strptime(date_str, "%d %B %Y")
-            return date_obj.strftime("%d %B %Y")
-        except ValueError:
-            pass
-            
-        # Try "MMM DD, YYYY" format (AIIB/AFD format: Feb 28, 2025)
-        try:
-            date_obj = datetime.strptime(date_str, "%b %d, %Y")
-            return date_obj.strftime("%b %d, %Y")
-        except ValueError:
-            pass
-            
-        # Try mm/dd/yyyy format
-        try:
-            date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-            return date_obj.strftime("%B %d, %Y")  # Return in World Bank format by default
-        except ValueError:
-            pass
-            
-        # Try yyyy-mm-dd format
-        try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            return date_obj.strftime("%B %d, %Y")  # Return in World Bank format by default
-        except ValueError:
-            # Add more formats if needed
-            raise ValueError(f"Unsupported date format: {date_str}")
-    
-    except Exception as e:
-        logger.error(f"Error parsing date {date_str}: {str(e)}")
+    matched = match_date(date_str.strip()) if isinstance(date_str, str) else None
+    if matched is None:
+        logger.error(f"Error parsing date {date_str}: Unsupported date format")
         return date_str
+    date_obj, fmt = matched
+    return date_obj.strftime(fmt)
+
+def to_iso_date(date_str) -> Optional[str]:
+    """Convert a site date string to ISO format (2025-02-24), or None if it cannot be parsed"""
+    date_obj = parse_date(date_str)
+    return date_obj.isoformat() if date_obj else None
+
+def normalize_dates(values: pd.Series) -> pd.Series:
+    """
+    Convert a column of site date strings (any mix of formats) to datetime64.
+
+    Each distinct string is parsed once and the results are mapped back over
+    the whole column; values that cannot be parsed become NaT.
+    """
+    lookup = {value: parse_date(value) for value in values.dropna().unique()}
+    return pd.to_datetime(values.map(lookup), errors='coerce')
 
 def format_date_for_site(date_obj, site_type):
     """Format a date object for the specific site format required"""
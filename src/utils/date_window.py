@@ -0,0 +1,112 @@
+# src/utils/date_window.py
+
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional, Union
+from src.config.settings import (
+    DATE_SINCE, DATE_UNTIL, DATE_WINDOW_DAYS, LAST_RUNS_PATH, SINCE_LAST_RUN
+)
+
+logger = logging.getLogger(__name__)
+
+# Where a publish date falls relative to a window
+IN_RANGE = 'in_range'
+NEWER = 'newer'
+OLDER = 'older'
+
+
+def to_date(value: Union[str, date, None]) -> Optional[date]:
+    """Accept a date, a datetime or an ISO "YYYY-MM-DD" string"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value).strip())
+
+
+def last_successful_run(source: str, path: Path = LAST_RUNS_PATH) -> Optional[date]:
+    """Day of the source's last crawl that completed, None when it never did"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        runs = json.loads(path.read_text(encoding='utf-8'))
+        return to_date(runs[source][:10]) if source in runs else None
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable run log {path}: {str(e)}")
+        return None
+
+
+def record_successful_run(source: str, when: Union[date, datetime, None] = None, path: Path = LAST_RUNS_PATH):
+    """Remember that the source's crawl completed up to `when` (now by default), for --since-last-run windows"""
+    path = Path(path)
+    runs = {}
+    if path.exists():
+        try:
+            runs = json.loads(path.read_text(encoding='utf-8'))
+        except ValueError:
+            runs = {}
+    when = when or datetime.now()
+    runs[source] = when.isoformat(timespec='seconds') if isinstance(when, datetime) else when.isoformat()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(runs, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+class DateWindow:
+    """
+    Inclusive range of publish dates a crawl collects.
+
+    Listings are ordered newest first, so a notice OLDER than the window
+    means every later page is out of range too and pagination can stop.
+    """
+
+    def __init__(self, since: Union[str, date], until: Union[str, date, None] = None):
+        self.until = to_date(until) or date.today()
+        self.since = to_date(since)
+        if self.since > self.until:
+            raise ValueError(f"Date window starts after it ends: {self.since} > {self.until}")
+
+    @classmethod
+    def from_settings(cls, source: Optional[str] = None, days: int = DATE_WINDOW_DAYS,
+                      since: Union[str, date, None] = DATE_SINCE,
+                      until: Union[str, date, None] = DATE_UNTIL,
+                      since_last_run: bool = SINCE_LAST_RUN,
+                      last_runs_path: Path = LAST_RUNS_PATH) -> "DateWindow":
+        """
+        Window from explicit bounds, falling back to the source's last
+        successful run (when since_last_run) and then to the last `days` days.
+        """
+        until_date = to_date(until) or date.today()
+        since_date = to_date(since)
+        if since_date is None and since_last_run and source:
+            # The day of the last run is scraped again, notices published later that day are new
+            since_date = last_successful_run(source, last_runs_path)
+            if since_date is None:
+                logger.info(f"No successful {source} run recorded, using the last {days} days")
+        if since_date is None:
+            since_date = until_date - timedelta(days=days)
+        return cls(since_date, until_date)
+
+    def classify(self, day: date) -> str:
+        """IN_RANGE, NEWER (after until) or OLDER (before since)"""
+        if day < self.since:
+            return OLDER
+        if day > self.until:
+            return NEWER
+        return IN_RANGE
+
+    def __contains__(self, day: date) -> bool:
+        return self.classify(day) == IN_RANGE
+
+    def __str__(self) -> str:
+        return f"{self.since.isoformat()} to {self.until.isoformat()}"
+
+    def __repr__(self) -> str:
+        return f"DateWindow({self.since.isoformat()!r}, {self.until.isoformat()!r})"
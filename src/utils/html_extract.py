@@ -0,0 +1,125 @@
+# src/utils/html_extract.py
+
+import logging
+from typing import Dict, List, Optional
+from bs4 import BeautifulSoup
+import soupsieve
+
+logger = logging.getLogger(__name__)
+
+# Prefer lxml when it is installed, it parses several times faster than html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+def element_text(elem) -> str:
+    """Visible text of an element with whitespace collapsed"""
+    return " ".join(elem.get_text(" ").split())
+
+
+class Field:
+    """A CSS-selected value: text (or an attribute) of the first match, or of every match"""
+
+    def __init__(self, selector: str, attr: Optional[str] = None, many: bool = False):
+        self.selector = soupsieve.compile(selector)
+        self.attr = attr
+        self.many = many
+
+    def value(self, elem):
+        if self.attr:
+            return elem.get(self.attr)
+        return element_text(elem)
+
+    def extract(self, soup):
+        if self.many:
+            return [v for v in (self.value(e) for e in self.selector.select(soup)) if v is not None]
+        elem = self.selector.select_one(soup)
+        return self.value(elem) if elem is not None else None
+
+
+class LabelledField:
+    """
+    A value located by the text of its label, the static-HTML equivalent of
+    Playwright selectors like "label:text('Team Leader') + p.document-info".
+
+    The value is either the label's next sibling (when it matches sibling),
+    or, when scope is given, the first match of value inside the label's
+    closest ancestor matching scope.
+    """
+
+    def __init__(self, label_text: str, label: str, sibling: Optional[str] = None,
+                 inner: Optional[str] = None, scope: Optional[str] = None):
+        self.label_text = label_text.strip().lower()
+        self.label = soupsieve.compile(label)
+        self.sibling = soupsieve.compile(sibling) if sibling else None
+        self.inner = soupsieve.compile(inner) if inner else None
+        self.scope = soupsieve.compile(scope) if scope else None
+
+    def find_label(self, soup):
+        candidates = self.label.select(soup)
+        # Exact match first, then substring match like Playwright's :text()
+        for elem in candidates:
+            if element_text(elem).lower() == self.label_text:
+                return elem
+        for elem in candidates:
+            if self.label_text in element_text(elem).lower():
+                return elem
+        return None
+
+    def extract(self, soup):
+        label = self.find_label(soup)
+        if label is None:
+            return None
+
+        if self.scope is not None:
+            container = next((p for p in label.parents if self.scope.match(p)), None)
+        else:
+            container = label.find_next_sibling()
+            if container is not None and self.sibling is not None and not self.sibling.match(container):
+                container = None
+        if container is None:
+            return None
+
+        if self.inner is not None:
+            container = self.inner.select_one(container)
+            if container is None:
+                return None
+        return element_text(container)
+
+
+class SelectorMap:
+    """
+    Precompiled field selectors for one kind of detail page.
+
+    ready_selector marks server-rendered content: when it is missing from
+    the HTML the page needs JavaScript and parse() returns None.
+    """
+
+    def __init__(self, fields: Dict[str, object], ready_selector: Optional[str] = None):
+        self.fields = fields
+        self.ready_selector = soupsieve.compile(ready_selector) if ready_selector else None
+
+    def parse(self, html: str, require_ready: bool = True) -> Optional[Dict]:
+        """Extract every field found in the HTML (missing fields are left out)"""
+        soup = BeautifulSoup(html, HTML_PARSER)
+        if require_ready and self.ready_selector is not None and self.ready_selector.select_one(soup) is None:
+            return None
+
+        data = {}
+        for key, field in self.fields.items():
+            try:
+                value = field.extract(soup)
+            except Exception as e:
+                logger.warning(f"Error extracting {key}: {str(e)}")
+                continue
+            if value is not None:
+                data[key] = value
+        return data
+
+
+def labelled_fields(labels: List[tuple], **kwargs) -> Dict[str, LabelledField]:
+    """Build LabelledFields for (label text, key) pairs sharing the same structure"""
+    return {key: LabelledField(label_text, **kwargs) for label_text, key in labels}
\ No newline at end of file
@@ -0,0 +1,100 @@
+# src/utils/http_cache.py
+
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from src.config.settings import HTTP_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry:
+    """One cached detail page: body, validators, fetch time and the fields parsed from it"""
+
+    def __init__(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str],
+                 fetched_at: float, fields: Optional[Dict], fields_key: Optional[str]):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+        self.fields = fields
+        self.fields_key = fields_key
+
+    @property
+    def age(self) -> float:
+        """Seconds since the body was fetched or last revalidated"""
+        return time.time() - self.fetched_at
+
+    def is_fresh(self, ttl: float) -> bool:
+        return self.age < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers that let the server answer 304 Not Modified"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    On-disk cache of detail page responses, keyed by URL.
+
+    Besides the body and its ETag / Last-Modified validators it keeps the
+    fields parsed from the body, tagged with the parser's field set
+    (fields_key), so a fresh entry or a 304 revalidation skips both the
+    download and the parse.
+    """
+
+    def __init__(self, path: Path = HTTP_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                fields TEXT,
+                fields_key TEXT
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        row = self.conn.execute(
+            "SELECT body, etag, last_modified, fetched_at, fields, fields_key FROM http_cache WHERE url = ?",
+            (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, fetched_at, fields, fields_key = row
+        return CacheEntry(url, body, etag, last_modified, fetched_at,
+                          json.loads(fields) if fields else None, fields_key)
+
+    def put(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str],
+            fields: Optional[Dict] = None, fields_key: Optional[str] = None,
+            fetched_at: Optional[float] = None):
+        """Store a downloaded body (fetched now unless fetched_at is given) and the fields parsed from it"""
+        self.conn.execute("""
+            INSERT OR REPLACE INTO http_cache (url, body, etag, last_modified, fetched_at, fields, fields_key)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (url, body, etag, last_modified, fetched_at or time.time(),
+              json.dumps(fields, ensure_ascii=False, default=str) if fields is not None else None, fields_key))
+        self.conn.commit()
+
+    def revalidated(self, url: str):
+        """The server answered 304 Not Modified: restart the entry's TTL"""
+        self.conn.execute("UPDATE http_cache SET fetched_at = ? WHERE url = ?", (time.time(), url))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,149 @@
+# src/utils/http_fetcher.py
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Optional
+import aiohttp
+from yarl import URL
+from src.config.settings import HTTP_MAX_CONNECTIONS, HTTP_MAX_CONNECTIONS_PER_HOST, HTTP_TIMEOUT, USER_AGENT
+from src.utils.adaptive_limiter import HostLimiters, LimiterSlot, is_throttle_status
+from src.utils.traffic import TrafficArchive
+
+logger = logging.getLogger(__name__)
+
+
+class FetchedPage:
+    """A successful GET: the body (None for 304 Not Modified) and its cache validators"""
+
+    def __init__(self, status: int, text: Optional[str], etag: Optional[str] = None,
+                 last_modified: Optional[str] = None):
+        self.status = status
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+class HttpFetcher:
+    """
+    Pooled async HTTP client for detail pages (and JSON APIs) that do not need a browser.
+
+    With limiters, each request holds a slot of its host's adaptive limit
+    and reports timeouts and 429/5xx responses back to it. With a traffic
+    archive, responses are recorded into it or served from it without any request.
+    """
+
+    def __init__(self, max_connections: int = HTTP_MAX_CONNECTIONS,
+                 max_per_host: int = HTTP_MAX_CONNECTIONS_PER_HOST,
+                 timeout: int = HTTP_TIMEOUT, user_agent: str = USER_AGENT,
+                 limiters: Optional[HostLimiters] = None, archive: Optional[TrafficArchive] = None):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.limiters = limiters
+        self.archive = archive
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self):
+        """Open the shared connection pool"""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_per_host)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': self.user_agent}
+            )
+
+    async def close(self):
+        """Close the connection pool"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def fetch_text(self, url: str) -> Optional[str]:
+        """
+        GET an HTML page and return its body.
+
+        Returns None on any failure so the caller can fall back to the browser.
+        """
+        page = await self.fetch_page(url)
+        return page.text if page is not None else None
+
+    async def fetch_page(self, url: str, headers: Optional[Dict[str, str]] = None,
+                         content_type: str = 'html') -> Optional[FetchedPage]:
+        """
+        GET an HTML page (or another content_type) with extra (e.g. conditional) headers.
+
+        Returns a 200 or 304 FetchedPage, or None on any failure.
+        """
+        if self.archive is not None and self.archive.replaying:
+            return self._replay(url)
+        if self.session is None:
+            await self.start()
+        if self.limiters is None:
+            return await self._get(url, headers=headers, content_type=content_type)
+        async with self.limiters.slot(url) as slot:
+            return await self._get(url, slot, headers, content_type)
+
+    async def fetch_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        GET a JSON API response, with params added to the query string, and decode it.
+
+        Returns None on any failure, like fetch_text.
+        """
+        if params:
+            url = str(URL(url).update_query({key: str(value) for key, value in params.items()}))
+        page = await self.fetch_page(url, {'Accept': 'application/json'}, content_type='json')
+        if page is None:
+            return None
+        try:
+            return json.loads(page.text)
+        except ValueError as e:
+            logger.debug(f"Invalid JSON from {url}: {str(e)}")
+            return None
+
+    async def _get(self, url: str, slot: Optional[LimiterSlot] = None,
+                   headers: Optional[Dict[str, str]] = None,
+                   content_type: str = 'html') -> Optional[FetchedPage]:
+        try:
+            async with self.session.get(url, headers=headers) as response:
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if response.status == 304:
+                    return FetchedPage(304, None, etag, last_modified)
+                if response.status != 200:
+                    logger.debug(f"HTTP {response.status} for {url}")
+                    if slot is not None and is_throttle_status(response.status):
+                        slot.overload(f"HTTP {response.status}")
+                    return None
+                if content_type not in response.headers.get('Content-Type', content_type):
+                    logger.debug(f"Non-{content_type.upper()} response for {url}")
+                    return None
+                text = await response.text()
+                if self.archive is not None:
+                    self.archive.record_response(url, 200, text, {'ETag': etag, 'Last-Modified': last_modified})
+                return FetchedPage(200, text, etag, last_modified)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"HTTP fetch failed for {url}: {str(e)}")
+            if slot is not None:
+                slot.overload("timeout" if isinstance(e, asyncio.TimeoutError) else type(e).__name__)
+            return None
+
+    def _replay(self, url: str) -> Optional[FetchedPage]:
+        recorded = self.archive.replay_response(url)
+        if recorded is None or recorded['status'] != 200:
+            return None
+        headers = recorded.get('headers', {})
+        return FetchedPage(200, recorded['text'], headers.get('ETag'), headers.get('Last-Modified'))
@@ -0,0 +1,202 @@
+# src/utils/metrics.py
+
+import json
+import logging
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+from src.config.settings import METRICS_DIR
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the phase latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class Histogram:
+    """Latencies of one phase: bucket counts for Prometheus and exact quantiles for the report"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # The last bucket is +Inf
+        self.samples: List[float] = []
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.samples.append(seconds)
+
+    @property
+    def count(self) -> int:
+        return len(self.samples)
+
+    @property
+    def total(self) -> float:
+        return sum(self.samples)
+
+    def quantile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def cumulative(self) -> List[tuple]:
+        """(upper bound, observations at or below it) pairs, ending with +Inf"""
+        pairs, running = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+    def as_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'total_seconds': round(self.total, 3),
+            'mean_seconds': round(self.total / self.count, 3) if self.count else 0.0,
+            'p50_seconds': round(self.quantile(0.5), 3),
+            'p95_seconds': round(self.quantile(0.95), 3),
+            'max_seconds': round(max(self.samples), 3) if self.samples else 0.0,
+        }
+
+
+class RunMetrics:
+    """
+    Counters and per-phase timers of one source's run.
+
+    Phases are wall-clock time spent in a step (listing_navigation,
+    listing_extraction, detail_navigation, detail_http, detail_extraction,
+    output); concurrent detail workers each add their own time, so phase
+    totals can exceed the run's duration.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.counters: Dict[str, float] = {}
+        self.phases: Dict[str, Histogram] = {}
+        self.started_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+        self.success: Optional[bool] = None
+
+    def count(self, name: str, amount: float = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set(self, name: str, value: float):
+        """Record a total kept elsewhere (e.g. the retrier's retry count)"""
+        self.counters[name] = value
+
+    def observe(self, phase: str, seconds: float):
+        if phase not in self.phases:
+            self.phases[phase] = Histogram()
+        self.phases[phase].observe(seconds)
+
+    @contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block (awaits included) as one observation of phase"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.monotonic() - started)
+
+    def finish(self, success: bool):
+        self.finished_at = datetime.now()
+        self.success = success
+
+    @property
+    def duration(self) -> float:
+        return ((self.finished_at or datetime.now()) - self.started_at).total_seconds()
+
+    def as_dict(self) -> Dict:
+        return {
+            'source': self.source,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'finished_at': self.finished_at.isoformat(timespec='seconds') if self.finished_at else None,
+            'duration_seconds': round(self.duration, 3),
+            'success': self.success,
+            'counters': dict(sorted(self.counters.items())),
+            'phases': {phase: histogram.as_dict() for phase, histogram in sorted(self.phases.items())},
+        }
+
+    def summary(self) -> str:
+        slowest = sorted(self.phases.items(), key=lambda item: item[1].total, reverse=True)[:3]
+        phases = ", ".join(f"{phase} {histogram.total:.1f}s/{histogram.count}" for phase, histogram in slowest)
+        return f"{self.duration:.1f}s, {int(self.counters.get('rows_emitted', 0))} rows; slowest phases: {phases or 'none'}"
+
+
+def _atomic_write(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_text(text, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def write_run_report(metrics: Iterable[RunMetrics], path: Optional[Path] = None) -> Path:
+    """Write a run's per-source metrics as JSON, to METRICS_DIR/run_<timestamp>.json by default"""
+    metrics = list(metrics)
+    if path is None:
+        path = Path(METRICS_DIR) / f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'sources': [m.as_dict() for m in metrics],
+    }
+    _atomic_write(Path(path), json.dumps(report, indent=2))
+    logger.info(f"Run metrics written to {path}")
+    return Path(path)
+
+
+def _label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _bound(value: float) -> str:
+    return "+Inf" if value == float('inf') else repr(float(value))
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def to_prometheus(metrics: Iterable[RunMetrics], prefix: str = "tender_scraper") -> str:
+    """Render the run's metrics in the Prometheus text exposition format"""
+    metrics = list(metrics)
+    lines = [
+        f"# HELP {prefix}_run_duration_seconds Wall-clock duration of the source's last run",
+        f"# TYPE {prefix}_run_duration_seconds gauge",
+    ]
+    lines += [f'{prefix}_run_duration_seconds{{source="{_label(m.source)}"}} {m.duration:.3f}' for m in metrics]
+
+    lines += [
+        f"# HELP {prefix}_run_success Whether the source's last run completed (1) or failed (0)",
+        f"# TYPE {prefix}_run_success gauge",
+    ]
+    lines += [f'{prefix}_run_success{{source="{_label(m.source)}"}} {int(bool(m.success))}' for m in metrics]
+
+    lines += [
+        f"# HELP {prefix}_events_total Events counted during the source's last run",
+        f"# TYPE {prefix}_events_total counter",
+    ]
+    for m in metrics:
+        for name, value in sorted(m.counters.items()):
+            lines.append(f'{prefix}_events_total{{source="{_label(m.source)}",event="{_label(name)}"}} {_number(value)}')
+
+    lines += [
+        f"# HELP {prefix}_phase_seconds Time spent per step of the source's last run",
+        f"# TYPE {prefix}_phase_seconds histogram",
+    ]
+    for m in metrics:
+        for phase, histogram in sorted(m.phases.items()):
+            labels = f'source="{_label(m.source)}",phase="{_label(phase)}"'
+            for bound, count in histogram.cumulative():
+                lines.append(f'{prefix}_phase_seconds_bucket{{{labels},le="{_bound(bound)}"}} {count}')
+            lines.append(f'{prefix}_phase_seconds_sum{{{labels}}} {histogram.total:.3f}')
+            lines.append(f'{prefix}_phase_seconds_count{{{labels}}} {histogram.count}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(metrics: Iterable[RunMetrics], path: Path):
+    """Write the metrics atomically, e.g. into node_exporter's textfile collector directory"""
+    _atomic_write(Path(path), to_prometheus(metrics))
+    logger.info(f"Prometheus metrics written to {path}")
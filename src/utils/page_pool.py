@@ -0,0 +1,174 @@
+# src/utils/page_pool.py
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Tuple, Union
+from playwright.async_api import BrowserContext, Page
+from src.config.settings import IDLE_PAGE_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# handler(page, url) -> result, run on one of the pool's pages
+PageHandler = Callable[[Page, str], Awaitable[Any]]
+
+
+class DetailPagePool:
+    """
+    Long-lived pages reused from URL to URL, leased one handler at a time.
+
+    A page is only opened for a handler that is already running, i.e. after
+    the caller took its source's or host's slot, so the pages a source has
+    open follow its current concurrency. Every open page holds one permit of
+    the optional limiter (the global page limit of a shared browser pool),
+    so the limit caps open pages across all sources. Finished pages are kept
+    for the next URL: handed straight to a handler of this pool waiting for
+    one, kept up to size idle pages, or closed when the limiter has no
+    permits left so other sources can open theirs. Idle pages are closed
+    after idle_timeout seconds, or as soon as the limiter runs out while
+    they wait, so a source that stopped using the browser gives its permits back.
+    """
+
+    def __init__(self, context: BrowserContext, size: Union[int, Callable[[], int]],
+                 limiter: Optional[asyncio.Semaphore] = None, idle_timeout: float = IDLE_PAGE_TIMEOUT,
+                 reap_interval: float = 0.5):
+        self.context = context
+        # Idle pages to keep, or a callable returning the current number
+        self.size = size
+        self.limiter = limiter
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        # (page, time it went idle)
+        self.idle: List[Tuple[Page, float]] = []
+        self._reaper: Optional[asyncio.Task] = None
+        # Handlers waiting for a permit, each taking the first page released to it instead
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.open_pages = 0
+        self.peak_pages = 0
+        self.closed = False
+
+    @property
+    def max_idle(self) -> int:
+        return self.size() if callable(self.size) else self.size
+
+    async def run(self, url: str, handler: PageHandler) -> Any:
+        """Run handler(page, url) on an idle page, or on a new one once the limiter allows it"""
+        page = await self._lease()
+        try:
+            return await handler(page, url)
+        finally:
+            await self._release(page)
+
+    async def _lease(self) -> Page:
+        while self.idle:
+            page, _ = self.idle.pop()
+            if not page.is_closed():
+                return page
+            self._closed()
+        if self.limiter:
+            page = await self._wait_for_page()
+            if page is not None:
+                return page
+        try:
+            page = await self.context.new_page()
+        except BaseException:
+            if self.limiter:
+                self.limiter.release()
+            raise
+        self.open_pages += 1
+        self.peak_pages = max(self.peak_pages, self.open_pages)
+        return page
+
+    async def _wait_for_page(self) -> Optional[Page]:
+        """A page released by this pool's other handlers, or None once a permit for a new one is taken"""
+        handoff = asyncio.get_running_loop().create_future()
+        self.waiters.append(handoff)
+        permit = asyncio.ensure_future(self.limiter.acquire())
+        cancelled = False
+        try:
+            await asyncio.wait([handoff, permit], return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            cancelled = True
+        if handoff in self.waiters:
+            self.waiters.remove(handoff)
+        if not permit.done():
+            permit.cancel()
+        if not handoff.done():
+            handoff.cancel()
+        page = handoff.result() if handoff.done() and not handoff.cancelled() else None
+        got_permit = permit.done() and not permit.cancelled() and permit.exception() is None
+
+        if cancelled:
+            # Give back whatever arrived before the cancellation
+            if page is not None:
+                await self._release(page)
+            if got_permit:
+                self.limiter.release()
+            raise asyncio.CancelledError()
+        if page is not None and got_permit:
+            # Both arrived: keep the page, the extra permit is given back
+            self.limiter.release()
+        return page
+
+    async def _release(self, page: Page):
+        """Hand the page to a waiting handler, keep it for the next URL, or close it and give back its permit"""
+        if page.is_closed():
+            self._closed()
+            return
+        while self.waiters and not self.closed:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(page)
+                return
+        if (not self.closed and len(self.idle) < self.max_idle
+                and not (self.limiter and self.limiter.locked())):
+            self.idle.append((page, time.monotonic()))
+            if self._reaper is None or self._reaper.done():
+                self._reaper = asyncio.ensure_future(self._reap_idle())
+            return
+        await self._close_page(page)
+
+    async def _reap_idle(self):
+        """Close idle pages once they time out, or all of them while the limiter has no permits left"""
+        while self.idle and not self.closed:
+            await asyncio.sleep(self.reap_interval)
+            starved = self.limiter is not None and self.limiter.locked()
+            now = time.monotonic()
+            expired = [entry for entry in self.idle if starved or now - entry[1] >= self.idle_timeout]
+            if not expired:
+                continue
+            self.idle = [entry for entry in self.idle if entry not in expired]
+            for page, _ in expired:
+                if page.is_closed():
+                    self._closed()
+                else:
+                    await self._close_page(page)
+
+    async def _close_page(self, page: Page):
+        try:
+            await page.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled page: {str(e)}")
+        finally:
+            self._closed()
+
+    def _closed(self):
+        self.open_pages -= 1
+        if self.limiter:
+            self.limiter.release()
+
+    async def close(self):
+        """Close the idle pages; pages still leased are closed when their handlers finish"""
+        self.closed = True
+        if self._reaper is not None and not self._reaper.done():
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+        idle, self.idle = self.idle, []
+        for page, _ in idle:
+            if page.is_closed():
+                self._closed()
+            else:
+                await self._close_page(page)
+        if self.peak_pages:
+            logger.debug(f"Detail page pool closed (peak {self.peak_pages} open pages)")
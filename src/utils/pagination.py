@@ -0,0 +1,55 @@
+# src/utils/pagination.py
+
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+
+class PageUrls:
+    """
+    URLs of a listing whose pages are addressed by a numeric query parameter.
+
+    The scraper names the parameter; whether it counts from 0 (Drupal's
+    ?page=1 is the second page) or from 1 is read from the first page's URL
+    and its next link.
+    """
+
+    def __init__(self, next_url: str, param: str, second_page_value: int):
+        self.next_url = next_url
+        self.param = param
+        self.second_page_value = second_page_value
+
+    @classmethod
+    def from_next_link(cls, current_url: str, next_href: str, param: str) -> Optional["PageUrls"]:
+        """
+        Page URLs from next_href, the next link of the first listing page at current_url.
+
+        None when the link's param is not a page number following the
+        current page's, e.g. a javascript: link or an opaque pager token.
+        """
+        next_url = urljoin(current_url, next_href)
+        if urlsplit(next_url).scheme not in ('http', 'https'):
+            return None
+        value = dict(parse_qsl(urlsplit(next_url).query, keep_blank_values=True)).get(param, '')
+        if not value.isdigit():
+            return None
+        number = int(value)
+        current = dict(parse_qsl(urlsplit(current_url).query, keep_blank_values=True)).get(param)
+        if current is not None:
+            # Already on the current page: it has to go up by exactly one
+            if not current.isdigit() or int(current) != number - 1:
+                return None
+        elif number not in (1, 2):
+            # First pages usually leave it out: 1 when counting from 0, 2 from 1
+            return None
+        return cls(next_url, param, number)
+
+    def url(self, page: int) -> str:
+        """URL of listing page `page` (1-based)"""
+        value = str(self.second_page_value + page - 2)
+        parts = urlsplit(self.next_url)
+        query = [(key, value if key == self.param else item)
+                 for key, item in parse_qsl(parts.query, keep_blank_values=True)]
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def __repr__(self) -> str:
+        return f"PageUrls({self.param}={self.second_page_value} on page 2 of {self.next_url})"
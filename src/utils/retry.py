@@ -0,0 +1,180 @@
+# src/utils/retry.py
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+from src.config.settings import (
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT, RETRY_ATTEMPTS, RETRY_BASE_DELAY,
+    RETRY_BUDGET_MIN, RETRY_BUDGET_RATIO, RETRY_MAX_DELAY
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of navigating while a source's circuit breaker is open"""
+
+
+class TransientHTTPError(Exception):
+    """A 429/5xx response worth retrying, with the server's Retry-After seconds if it sent one"""
+
+    def __init__(self, status: int, retry_after: Optional[str] = None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        try:
+            self.retry_after = float(retry_after) if retry_after else None
+        except ValueError:
+            # HTTP-date form, not worth parsing for a short back-off
+            self.retry_after = None
+
+
+class RetryPolicy:
+    """Attempts per operation and exponential back-off with full jitter between them"""
+
+    def __init__(self, attempts: int = RETRY_ATTEMPTS, base_delay: float = RETRY_BASE_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait after failed attempt number attempt (0-based)"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+class RetryBudget:
+    """
+    Caps a source's retries at ratio x operations (plus a small allowance),
+    so a host failing everything does not multiply the load by the attempt count.
+    """
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, minimum: int = RETRY_BUDGET_MIN):
+        self.ratio = ratio
+        self.minimum = minimum
+        self.operations = 0
+        self.retries = 0
+
+    def record_operation(self):
+        self.operations += 1
+
+    def can_retry(self) -> bool:
+        return self.retries < self.minimum + self.ratio * self.operations
+
+    def spend(self):
+        self.retries += 1
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures and then rejects calls
+    for reset_timeout seconds. After that one trial call is let through: its
+    success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_running = False
+        self.times_opened = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if not self.trial_running and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.trial_running = True
+            logger.info(f"{self.name}: circuit half-open, trying one request")
+            return True
+        return False
+
+    def record_success(self):
+        if self.opened_at is not None:
+            logger.info(f"{self.name}: circuit closed, host is responding again")
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+
+    def end_trial(self):
+        """The trial call ended without an outcome (e.g. it was cancelled), let the next one through"""
+        self.trial_running = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.opened_at is not None and self.trial_running:
+            # The trial failed, stay open for another reset_timeout
+            self.opened_at = time.monotonic()
+            self.trial_running = False
+        elif self.opened_at is None and self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+            logger.warning(f"{self.name}: {self.failures} consecutive failures, circuit open "
+                           f"for {self.reset_timeout:.0f}s")
+
+
+class Retrier:
+    """Runs operations under one source's retry policy, retry budget and circuit breaker"""
+
+    def __init__(self, name: str, policy: Optional[RetryPolicy] = None,
+                 budget: Optional[RetryBudget] = None, breaker: Optional[CircuitBreaker] = None):
+        self.name = name
+        self.policy = policy or RetryPolicy()
+        self.budget = budget or RetryBudget()
+        self.breaker = breaker or CircuitBreaker(name)
+
+    async def run(self, operation: Callable[[], Awaitable[T]], description: str,
+                  retry_on: Tuple[Type[BaseException], ...],
+                  sleep: Optional[Callable[[float], Awaitable[None]]] = None) -> T:
+        """
+        Await operation(), retrying the retry_on exceptions with back-off.
+
+        Raises the last error once attempts or the retry budget run out, and
+        CircuitOpenError without calling operation while the circuit is open.
+        sleep(seconds) waits out the back-off (asyncio.sleep by default), so
+        callers can give back what they hold while waiting.
+        """
+        self.budget.record_operation()
+        for attempt in range(self.policy.attempts):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"{self.name}: circuit open, skipping {description}")
+            try:
+                try:
+                    result = await operation()
+                except retry_on:
+                    raise
+                except BaseException:
+                    # Other errors and cancellation say nothing about the host, but must not
+                    # leave a half-open circuit waiting forever for this trial's outcome
+                    self.breaker.end_trial()
+                    raise
+            except retry_on as e:
+                self.breaker.record_failure()
+                if attempt + 1 >= self.policy.attempts or not self.budget.can_retry():
+                    raise
+                self.budget.spend()
+                delay = self.policy.backoff(attempt, getattr(e, 'retry_after', None))
+                # Playwright errors carry a multi-line call log, the first line is the reason
+                reason = str(e).splitlines()[0] if str(e) else type(e).__name__
+                logger.warning(f"{description} failed ({reason}), "
+                               f"retry {attempt + 1}/{self.policy.attempts - 1} in {delay:.1f}s")
+                await (sleep or asyncio.sleep)(delay)
+            else:
+                self.breaker.record_success()
+                return result
+
+    def summary(self) -> str:
+        return (f"{self.budget.retries} retries over {self.budget.operations} navigations, "
+                f"circuit opened {self.breaker.times_opened} times")
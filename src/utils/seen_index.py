@@ -0,0 +1,75 @@
+# src/utils/seen_index.py
+
+import hashlib
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Set, Tuple
+from src.config.settings import SEEN_INDEX_PATH
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(row: Dict) -> str:
+    """Content fingerprint of a scraped row, stable across key order"""
+    payload = json.dumps(row, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class SeenIndex:
+    """
+    Persistent index of notices already scraped, shared across runs.
+
+    Each entry is keyed by (source, notice key) and stores a content
+    fingerprint plus first-seen and last-seen timestamps. Keys are cached in
+    memory per source so lookups during a run never touch the database.
+    """
+
+    def __init__(self, path: Path = SEEN_INDEX_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_notices (
+                source TEXT NOT NULL,
+                notice_key TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                PRIMARY KEY (source, notice_key)
+            )
+        """)
+        self.conn.commit()
+        self.cache: Dict[str, Set[str]] = {}
+
+    def known_keys(self, source: str) -> Set[str]:
+        """All notice keys already indexed for a source"""
+        if source not in self.cache:
+            rows = self.conn.execute(
+                "SELECT notice_key FROM seen_notices WHERE source = ?", (source,)
+            ).fetchall()
+            self.cache[source] = {row[0] for row in rows}
+            logger.info(f"Seen index has {len(self.cache[source])} known notices for {source}")
+        return self.cache[source]
+
+    def is_known(self, source: str, key: str) -> bool:
+        return key in self.known_keys(source)
+
+    def mark_seen(self, source: str, entries: Iterable[Tuple[str, str]]) -> int:
+        """Record (notice key, fingerprint) pairs, keeping the original first-seen time"""
+        now = datetime.now().isoformat(timespec='seconds')
+        entries = list(entries)
+        self.conn.executemany("""
+            INSERT INTO seen_notices (source, notice_key, fingerprint, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (source, notice_key)
+            DO UPDATE SET fingerprint = excluded.fingerprint, last_seen = excluded.last_seen
+        """, [(source, key, digest, now, now) for key, digest in entries])
+        self.conn.commit()
+        self.known_keys(source).update(key for key, _ in entries)
+        return len(entries)
+
+    def close(self):
+        self.conn.close()
\ No newline at end of file
@@ -0,0 +1,117 @@
+# src/utils/traffic.py
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+from playwright.async_api import BrowserContext
+from src.config.settings import TRAFFIC_DIR
+from src.utils.date_window import DateWindow
+
+logger = logging.getLogger(__name__)
+
+# Traffic modes: capture a live run, or serve a captured run back with no network
+RECORD = 'record'
+REPLAY = 'replay'
+TRAFFIC_MODES = (RECORD, REPLAY)
+
+
+class TrafficArchive:
+    """
+    Recorded traffic of one source, for running its scraper offline.
+
+    Browser traffic goes through Playwright's HAR support into
+    <source>.har.zip (bodies stored as zip entries rather than base64 in the
+    JSON); HTTP fast-path responses, which never reach the browser, go into
+    <source>.http.json next to it, with the recorded run's date window so a
+    replay pages through the same listing. In replay mode unknown browser
+    requests are aborted and unknown HTTP requests fail, so nothing touches
+    the network.
+    """
+
+    def __init__(self, source: str, mode: str, root: Path = TRAFFIC_DIR):
+        if mode not in TRAFFIC_MODES:
+            raise ValueError(f"Unknown traffic mode {mode!r}, expected one of {TRAFFIC_MODES}")
+        self.source = source
+        self.mode = mode
+        self.root = Path(root)
+        self.responses: Dict[str, Dict] = {}
+        self.date_window: Optional[DateWindow] = None
+        self.hits = 0
+        self.misses = 0
+        if self.replaying:
+            if not self.har_path.exists():
+                raise FileNotFoundError(f"No recorded {source} traffic at {self.har_path}, run with --record first")
+            if self.http_path.exists():
+                recorded = json.loads(self.http_path.read_text(encoding='utf-8'))
+                self.responses = recorded.get('responses', {})
+                if recorded.get('date_window'):
+                    self.date_window = DateWindow(**recorded['date_window'])
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    @property
+    def har_path(self) -> Path:
+        return self.root / f"{self.source}.har.zip"
+
+    @property
+    def http_path(self) -> Path:
+        return self.root / f"{self.source}.http.json"
+
+    async def apply(self, context: BrowserContext):
+        """
+        Record the context's traffic (written when the context closes) or serve it from the HAR.
+
+        Call after any other context.route handlers: the routes registered
+        last run first, so replay answers every request before they see it.
+        """
+        if self.recording:
+            self.root.mkdir(parents=True, exist_ok=True)
+            await context.route_from_har(self.har_path, update=True, update_content='attach',
+                                         update_mode='minimal')
+        else:
+            await context.route_from_har(self.har_path, not_found='abort')
+
+    def record_response(self, url: str, status: int, text: str, headers: Dict[str, Optional[str]]):
+        """Keep an HTTP fast-path response for replay"""
+        self.responses[url] = {'status': status, 'text': text, 'headers': headers}
+
+    def replay_response(self, url: str) -> Optional[Dict]:
+        """The recorded response for url, None when the recorded run never fetched it"""
+        response = self.responses.get(url)
+        if response is None:
+            self.misses += 1
+            logger.debug(f"No recorded HTTP response for {url}")
+        else:
+            self.hits += 1
+        return response
+
+    def save(self):
+        """Write the recorded HTTP responses (the HAR is written by Playwright on context close)"""
+        if not self.recording:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.http_path.with_suffix('.tmp')
+        recorded = {
+            'date_window': {
+                'since': self.date_window.since.isoformat(),
+                'until': self.date_window.until.isoformat(),
+            } if self.date_window else None,
+            'responses': self.responses,
+        }
+        tmp_path.write_text(json.dumps(recorded, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, self.http_path)
+        logger.info(f"{self.source}: traffic recorded to {self.har_path} and {self.http_path} "
+                    f"({len(self.responses)} HTTP responses)")
+
+    def summary(self) -> str:
+        if self.recording:
+            return f"recorded {len(self.responses)} HTTP responses"
+        return f"replayed {self.hits} HTTP responses, {self.misses} not recorded"
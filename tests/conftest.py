@@ -0,0 +1,99 @@
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+
+from src.scrapers.base_scraper import BaseScraper
+from src.storage.sink import ResultSink
+from src.storage.writers import ResultWriter
+from src.utils.date_window import DateWindow
+
+
+class SampleScraper(BaseScraper):
+    """A scraper with no browser whose scrape_data emits the given listing pages"""
+
+    SOURCE_NAME = "Sample"
+    COUNTRY_FIELD = 'country'
+    TITLE_FIELD = 'title'
+    CONCURRENT_PAGES = 2
+
+    def __init__(self, pages: Optional[List[List[Dict]]] = None, fail_after: Optional[int] = None, **kwargs):
+        kwargs.setdefault('incremental', False)
+        kwargs.setdefault('date_window', DateWindow("2025-02-01", "2025-02-28"))
+        super().__init__("https://example.org/list", **kwargs)
+        self.pages = pages or []
+        self.fail_after = fail_after
+
+    async def extract_table_data(self):
+        return []
+
+    async def check_next_page(self) -> bool:
+        return False
+
+    async def scrape_data(self):
+        for number, rows in enumerate(self.pages, start=1):
+            if number <= self.resume_page:
+                continue
+            if self.fail_after is not None and number > self.fail_after:
+                raise RuntimeError(f"listing page {number} failed")
+            await self.emit(rows, page=number)
+        return self.results_frame()
+
+
+class ListWriter(ResultWriter):
+    """Keeps every batch it is given"""
+
+    name = "list"
+
+    def __init__(self):
+        self.batches = []
+
+    def write(self, scraper, df):
+        self.batches.append(df)
+        return len(df)
+
+
+def sample_rows(page: int, count: int = 3) -> List[Dict]:
+    return [{
+        'title': f"Notice {page}-{i}",
+        'country': "Kenya",
+        'publish_date': f"{20 - page} Feb 2025",
+        'url': f"https://example.org/notice/{page}-{i}",
+    } for i in range(count)]
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path):
+    return tmp_path / "checkpoints"
+
+
+@pytest.fixture
+def scraper_class():
+    """SampleScraper, for tests that subclass it"""
+    return SampleScraper
+
+
+@pytest.fixture
+def make_scraper(checkpoint_dir):
+    """Build a SampleScraper (or subclass) checkpointing into a temporary directory"""
+    def make(pages=None, cls=SampleScraper, **kwargs):
+        kwargs.setdefault('checkpoint_dir', checkpoint_dir)
+        return cls(pages, **kwargs)
+    return make
+
+
+@pytest.fixture
+def make_rows():
+    """make_rows(page, count) builds a listing page of rows published on 20 - page Feb 2025"""
+    return sample_rows
+
+
+@pytest.fixture
+def consume():
+    """consume(scraper, batch_size) streams the scraper through a ResultSink into a ListWriter"""
+    def run(scraper, batch_size: int = 4, writer: Optional[ResultWriter] = None):
+        writer = writer or ListWriter()
+        sink = ResultSink(scraper, [writer], batch_size=batch_size)
+        written = asyncio.run(sink.consume(scraper.iter_rows()))
+        return written, writer
+    return run
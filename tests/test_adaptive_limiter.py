@@ -0,0 +1,112 @@
+import asyncio
+
+from src.utils.adaptive_limiter import AdaptiveLimiter, HostLimiters, is_throttle_status
+
+
+def test_throttle_statuses():
+    assert is_throttle_status(429)
+    assert is_throttle_status(503)
+    assert not is_throttle_status(200)
+    assert not is_throttle_status(404)
+    assert not is_throttle_status(None)
+
+
+def test_initial_limit_is_clamped():
+    assert AdaptiveLimiter("h", 0, min_limit=1, max_limit=4).current == 1
+    assert AdaptiveLimiter("h", 10, min_limit=1, max_limit=4).current == 4
+
+
+def test_saturated_successes_grow_the_limit():
+    limiter = AdaptiveLimiter("h", 2, max_limit=8)
+    for _ in range(20):
+        limiter.on_success(0.1, saturated=True)
+    assert limiter.current > 2
+    assert limiter.peak == limiter.limit
+
+
+def test_unsaturated_successes_keep_the_limit():
+    limiter = AdaptiveLimiter("h", 2, max_limit=8)
+    for _ in range(20):
+        limiter.on_success(0.1, saturated=False)
+    assert limiter.current == 2
+
+
+def test_overload_halves_once_per_burst():
+    limiter = AdaptiveLimiter("h", 8, max_limit=16)
+    limiter.on_overload("HTTP 503")
+    limiter.on_overload("HTTP 503")
+    assert limiter.current == 4
+    assert limiter.decreases == 1
+
+
+def test_latency_far_above_the_baseline_backs_off():
+    limiter = AdaptiveLimiter("h", 8, max_limit=16, latency_factor=3.0)
+    for _ in range(5):
+        limiter.on_success(0.1, saturated=False)
+    for _ in range(10):
+        limiter.on_success(5.0, saturated=False)
+    assert limiter.current < 8
+
+
+def test_slots_cap_requests_in_flight():
+    limiter = AdaptiveLimiter("h", 2, max_limit=2)
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(request() for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+    assert limiter.in_flight == 0
+    assert limiter.requests == 6
+
+
+def test_timeout_in_a_slot_backs_off():
+    limiter = AdaptiveLimiter("h", 4, max_limit=8)
+
+    async def main():
+        try:
+            async with limiter.slot():
+                raise asyncio.TimeoutError()
+        except asyncio.TimeoutError:
+            pass
+
+    asyncio.run(main())
+    assert limiter.current == 2
+    assert limiter.in_flight == 0
+
+
+def test_paused_slot_lets_another_request_in():
+    limiter = AdaptiveLimiter("h", 1, max_limit=1)
+    order = []
+
+    async def other():
+        async with limiter.slot():
+            order.append("other")
+
+    async def main():
+        async with limiter.slot() as slot:
+            waiting = asyncio.ensure_future(other())
+            await slot.pause(0.01)
+            order.append("first")
+            await waiting
+
+    asyncio.run(main())
+    assert order == ["other", "first"]
+    assert limiter.in_flight == 0
+
+
+def test_host_limiters_per_host_and_channel():
+    limits = HostLimiters(3)
+    http = limits.for_url("https://Example.org/a")
+    assert limits.for_url("https://example.org/b") is http
+    assert limits.for_url("https://example.org/a", channel="browser") is not http
+    assert http.current == 3
+    limits.report_status("https://example.org/a", 429, channel="http")
+    assert http.current == 1
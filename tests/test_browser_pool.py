@@ -0,0 +1,72 @@
+import asyncio
+
+from src.utils.browser_pool import BrowserPool
+
+
+class FakeContext:
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, args):
+        self.args = args
+
+    async def new_context(self, **options):
+        return FakeContext()
+
+    async def close(self):
+        pass
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launched = []
+
+    async def launch(self, headless, args):
+        browser = FakeBrowser(args)
+        self.launched.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+    async def stop(self):
+        pass
+
+
+def make_pool(**kwargs):
+    pool = BrowserPool(**kwargs)
+    pool.playwright = FakePlaywright()
+    return pool
+
+
+def test_sources_with_launch_args_get_their_own_browser():
+    async def run():
+        pool = make_pool(max_browsers=1, launch_args=['--mute-audio'])
+        plain = await pool.new_context()
+        shared = await pool.new_context(launch_args=[])
+        http1 = await pool.new_context(launch_args=['--disable-http2'])
+        again = await pool.new_context(launch_args=['--disable-http2', '--mute-audio'])
+        return pool, [pool.context_owners[c] for c in (plain, shared, http1, again)]
+
+    pool, owners = asyncio.run(run())
+    assert [browser.args for browser in pool.playwright.chromium.launched] == [
+        ['--mute-audio'], ['--mute-audio', '--disable-http2']
+    ]
+    assert owners[0] is owners[1]
+    assert owners[2] is owners[3] is not owners[0]
+
+
+def test_contexts_spread_over_browsers_with_the_same_args():
+    async def run():
+        pool = make_pool(max_browsers=2)
+        contexts = [await pool.new_context(launch_args=['--disable-http2']) for _ in range(3)]
+        await pool.release_context(contexts[0])
+        return pool
+
+    pool = asyncio.run(run())
+    assert len(pool.browsers) == 2
+    assert sorted(pool.context_counts.values()) == [1, 1]
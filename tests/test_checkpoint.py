@@ -0,0 +1,71 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.utils.checkpoint import Checkpoint
+
+
+def test_checkpoint_round_trip(tmp_path):
+    checkpoint = Checkpoint("EBRD", directory=tmp_path)
+    checkpoint.page = 3
+    checkpoint.pending = ["https://example.org/a"]
+    checkpoint.rows_emitted = 42
+    checkpoint.save()
+
+    loaded = Checkpoint("EBRD", directory=tmp_path)
+    assert loaded.load()
+    assert (loaded.page, loaded.pending, loaded.rows_emitted) == (3, ["https://example.org/a"], 42)
+    loaded.clear()
+    assert not loaded.path.exists()
+    assert not Checkpoint("EBRD", directory=tmp_path).load()
+
+
+def test_old_or_broken_checkpoints_are_ignored(tmp_path):
+    checkpoint = Checkpoint("EBRD", directory=tmp_path)
+    checkpoint.page = 3
+    checkpoint.save()
+    state = json.loads(checkpoint.path.read_text())
+    state['updated_at'] = (datetime.now() - timedelta(hours=48)).isoformat(timespec='seconds')
+    checkpoint.path.write_text(json.dumps(state))
+    assert not Checkpoint("EBRD", directory=tmp_path).load(max_age_hours=24)
+
+    checkpoint.path.write_text("{broken")
+    assert not Checkpoint("EBRD", directory=tmp_path).load()
+
+
+def test_scraper_checkpoints_into_its_directory(make_scraper, checkpoint_dir):
+    scraper = make_scraper()
+    assert scraper.checkpoint.path == checkpoint_dir / "Sample.json"
+    scraper.start_checkpoint()
+    assert scraper.checkpoint.path == checkpoint_dir / "Sample.json"
+
+
+def test_completed_crawl_clears_its_checkpoint(make_scraper, make_rows, consume, checkpoint_dir):
+    written, _ = consume(make_scraper([make_rows(1), make_rows(2)]))
+    assert written == 6
+    assert not (checkpoint_dir / "Sample.json").exists()
+
+
+def test_failed_crawl_resumes_after_its_last_saved_page(make_scraper, make_rows, consume, checkpoint_dir):
+    pages = [make_rows(1), make_rows(2), make_rows(3)]
+    with pytest.raises(RuntimeError):
+        consume(make_scraper(pages, fail_after=2), batch_size=100)
+
+    checkpoint = Checkpoint("Sample", directory=checkpoint_dir)
+    assert checkpoint.load()
+    assert (checkpoint.page, checkpoint.rows_emitted) == (2, 6)
+
+    written, writer = consume(make_scraper(pages, resume=True))
+    assert written == 3
+    assert list(writer.batches[0]['title']) == ["Notice 3-0", "Notice 3-1", "Notice 3-2"]
+    assert not checkpoint.path.exists()
+
+
+def test_fresh_crawl_discards_an_old_checkpoint(make_scraper, make_rows, consume, checkpoint_dir):
+    stale = Checkpoint("Sample", directory=checkpoint_dir)
+    stale.page = 5
+    stale.save()
+    written, _ = consume(make_scraper([make_rows(1)]))
+    assert written == 3
+    assert not stale.path.exists()
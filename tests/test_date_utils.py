@@ -0,0 +1,56 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from src.utils.date_utils import DATE_PATTERN, match_date, normalize_date, normalize_dates, parse_date, to_iso_date
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("20 Feb 2025", date(2025, 2, 20)),                # EBRD, TendersInfo
+    ("28-Feb-2025", date(2025, 2, 28)),                # AfDB
+    ("28 December 2022", date(2022, 12, 28)),          # ISDB
+    ("February 24, 2025", date(2025, 2, 24)),          # World Bank
+    ("Feb 28, 2025", date(2025, 2, 28)),               # AIIB, AFD
+    ("Sept 3, 2024", date(2024, 9, 3)),
+    ("02/24/2025", date(2025, 2, 24)),
+    ("2025-02-24", date(2025, 2, 24)),
+    ("  4 Mar 2025 ", date(2025, 3, 4)),
+])
+def test_parse_date_formats(text, expected):
+    assert parse_date(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "N/A", "31 Feb 2025", "20 Foo 2025", "2025-02-241", None, 20250224])
+def test_parse_date_rejects(text):
+    assert parse_date(text) is None
+
+
+def test_pattern_is_anchored_at_the_start():
+    assert DATE_PATTERN.match("Published 20 Feb 2025") is None
+
+
+@pytest.mark.parametrize("text, fmt", [
+    ("28-Feb-2025", "%d-%b-%Y"),
+    ("20 Feb 2025", "%d %b %Y"),
+    ("28 December 2022", "%d %B %Y"),
+    ("Feb 28, 2025", "%b %d, %Y"),
+    ("February 24, 2025", "%B %d, %Y"),
+])
+def test_match_date_keeps_the_site_format(text, fmt):
+    assert match_date(text)[1] == fmt
+    assert normalize_date(text) == text
+
+
+def test_to_iso_date():
+    assert to_iso_date("Feb 28, 2025") == "2025-02-28"
+    assert to_iso_date("not a date") is None
+
+
+def test_normalize_dates_mixed_column():
+    values = pd.Series(["20 Feb 2025", "Feb 21, 2025", None, "unknown", "20 Feb 2025"])
+    result = normalize_dates(values)
+    assert pd.api.types.is_datetime64_any_dtype(result)
+    assert list(result[:2]) == [pd.Timestamp("2025-02-20"), pd.Timestamp("2025-02-21")]
+    assert result[2:4].isna().all()
+    assert result[4] == pd.Timestamp("2025-02-20")
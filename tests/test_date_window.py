@@ -0,0 +1,92 @@
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.utils.date_window import (
+    IN_RANGE, NEWER, OLDER, DateWindow, last_successful_run, record_successful_run, to_date
+)
+
+
+def test_classify_is_inclusive():
+    window = DateWindow("2025-02-20", "2025-02-28")
+    assert window.classify(date(2025, 2, 20)) == IN_RANGE
+    assert window.classify(date(2025, 2, 28)) == IN_RANGE
+    assert window.classify(date(2025, 2, 19)) == OLDER
+    assert window.classify(date(2025, 3, 1)) == NEWER
+    assert date(2025, 2, 24) in window
+
+
+def test_window_must_not_start_after_it_ends():
+    with pytest.raises(ValueError):
+        DateWindow("2025-03-01", "2025-02-28")
+
+
+def test_to_date():
+    assert to_date(None) is None
+    assert to_date("") is None
+    assert to_date(datetime(2025, 2, 24, 13, 5)) == date(2025, 2, 24)
+    assert to_date(" 2025-02-24 ") == date(2025, 2, 24)
+
+
+def test_from_settings_defaults_to_the_last_days():
+    window = DateWindow.from_settings(days=7, since=None, until="2025-02-28", since_last_run=False)
+    assert (window.since, window.until) == (date(2025, 2, 21), date(2025, 2, 28))
+
+
+def test_from_settings_until_defaults_to_today():
+    window = DateWindow.from_settings(days=3, since=None, until=None, since_last_run=False)
+    assert window.until == date.today()
+    assert window.since == date.today() - timedelta(days=3)
+
+
+def test_since_last_run(tmp_path):
+    runs = tmp_path / "last_runs.json"
+    record_successful_run("EBRD", date(2025, 2, 25), path=runs)
+    assert json.loads(runs.read_text()) == {"EBRD": "2025-02-25"}
+    assert last_successful_run("EBRD", path=runs) == date(2025, 2, 25)
+    assert last_successful_run("AFD", path=runs) is None
+
+    window = DateWindow.from_settings("EBRD", days=7, since=None, until="2025-02-28",
+                                      since_last_run=True, last_runs_path=runs)
+    assert window.since == date(2025, 2, 25)
+    # A source that never completed a run falls back to the last days
+    window = DateWindow.from_settings("AFD", days=7, since=None, until="2025-02-28",
+                                      since_last_run=True, last_runs_path=runs)
+    assert window.since == date(2025, 2, 21)
+
+
+def test_record_keeps_other_sources_and_reads_datetimes(tmp_path):
+    runs = tmp_path / "state" / "last_runs.json"
+    record_successful_run("EBRD", datetime(2025, 2, 25, 8, 30), path=runs)
+    record_successful_run("AFD", date(2025, 2, 26), path=runs)
+    assert last_successful_run("EBRD", path=runs) == date(2025, 2, 25)
+    assert last_successful_run("AFD", path=runs) == date(2025, 2, 26)
+
+
+def test_unreadable_run_log_is_ignored(tmp_path):
+    runs = tmp_path / "last_runs.json"
+    runs.write_text("{not json")
+    assert last_successful_run("EBRD", path=runs) is None
+
+
+def test_rows_outside_the_window_are_dropped_and_stop_pagination(make_scraper):
+    scraper = make_scraper(date_window=DateWindow("2025-02-10", "2025-02-20"))
+    rows = [{'publish_date': text} for text in ("22 Feb 2025", "20 Feb 2025", "10 Feb 2025", "9 Feb 2025")]
+    kept = scraper.rows_in_window(rows, 'publish_date')
+    assert [row['publish_date'] for row in kept] == ["20 Feb 2025", "10 Feb 2025"]
+    assert scraper.pagination_stopped
+
+
+def test_incomplete_crawl_keeps_its_checkpoint(make_scraper, make_rows, consume, scraper_class):
+    class TruncatedScraper(scraper_class):
+        async def scrape_data(self):
+            await self.emit(make_rows(1), page=1)
+            self.mark_incomplete("could not read listing page 2")
+
+    scraper = make_scraper(cls=TruncatedScraper)
+    written, _ = consume(scraper)
+    assert written == 3
+    assert not scraper.crawl_complete
+    assert scraper.checkpoint.load()
+    assert scraper.checkpoint.page == 1
@@ -0,0 +1,100 @@
+import pytest
+
+from src.scrapers.afd_scraper import AFDScraper
+from src.scrapers.afdb_scraper import AfDBScraper
+from src.scrapers.ebrd_scraper import EBRDScraper
+from src.scrapers.isdb_scraper import ISDBScraper
+from src.scrapers.tenders_info_scraper import TendersInfoScraper
+from src.scrapers.world_bank_scraper import WorldBankScraper
+
+WORLD_BANK = """
+<div class="project-detail">
+  <div><label>Project ID</label><p class="document-info">P178521</p></div>
+  <div><label>Status</label><p class="document-info">Active</p></div>
+  <div><label>Team Leader</label><p class="document-info">Jane Doe</p></div>
+  <div><label>Borrower</label><span>Ministry of Finance</span></div>
+  <div><label>Total Project Cost</label><p class="document-info">US$ 150.00 million</p></div>
+</div>
+<div class="detail-download-section">Downloads</div>
+"""
+
+EBRD = """
+<div class="project-overview__projectID">53921</div>
+<div class="project-overview__main-card">
+  <div class="project-overview__card-title">Procurement Ref No.</div>
+  <div class="project-overview__card-description">REF-53921</div>
+</div>
+<div class="project-overview__main-card">
+  <div class="project-overview__card-title">City Name</div>
+  <div class="project-overview__card-description"> Tbilisi </div>
+</div>
+<div class="project-overview__main-card">
+  <div class="project-overview__card-title">Location</div>
+  <div class="project-overview__card-description">Georgia</div>
+</div>
+"""
+
+ISDB = """
+<div class="details">
+  <div class="field--name-field-notice-type"><div class="field--item">General Procurement Notice</div></div>
+  <div class="field--name-field-close-date"><div class="field--item">14 March 2025</div></div>
+  <div class="field--name-field-project-code"><div class="field--item">UZB-1043</div></div>
+  <div class="field--name-field-documents">
+    <span class="file-link"><a href="https://example.org/files/gpn.pdf">GPN</a></span>
+  </div>
+</div>
+"""
+
+AFDB = """
+<h1>Notice</h1>
+<div id="block-views-keywords-block"><ul><li><a>Energy</a></li><li><a>Water Supply</a></li></ul></div>
+"""
+
+AFD = """
+<div class="content">Rehabilitation of the   port of Dakar</div>
+<p><span class="label">Funding Agency</span><span>Agence Française de Développement</span></p>
+<p><span class="label">Reference</span><span>AFD-2025-17</span></p>
+<a href="/download/1">Tender document</a><a href="/download/2">Annex</a><a href="/about">About</a>
+"""
+
+TENDERS_INFO = """
+<div class="form-horizontal">
+  <div class="form-group"><label>Tender TI Ref No</label><div><p>TI78013</p></div></div>
+  <div class="form-group"><label>Tender Date</label><div><p>03 Feb 2025</p></div></div>
+  <div class="form-group"><label>Tender Deadline :</label><div><p>05 Mar 2025</p></div></div>
+  <div class="form-group"><label>Tender Sector</label><span>Energy</span></div>
+</div>
+"""
+
+CASES = [
+    (WorldBankScraper, WORLD_BANK, {
+        'project_id': "P178521", 'status': "Active", 'team_leader': "Jane Doe",
+        'total_project_cost': "US$ 150.00 million",
+    }),
+    (EBRDScraper, EBRD, {
+        'project_id': "53921", 'procurement_ref_no': "REF-53921", 'city_name': "Tbilisi", 'location': "Georgia",
+    }),
+    (ISDBScraper, ISDB, {
+        'notice_type': "General Procurement Notice", 'submission_date': "14 March 2025",
+        'project_code': "UZB-1043", 'document_link': "https://example.org/files/gpn.pdf",
+    }),
+    (AfDBScraper, AFDB, {'sectors': ["Energy", "Water Supply"]}),
+    (AFDScraper, AFD, {
+        'description': "Rehabilitation of the port of Dakar", 'funding_agency': "Agence Française de Développement",
+        'reference_number': "AFD-2025-17", 'document_links': ["/download/1", "/download/2"],
+    }),
+    (TendersInfoScraper, TENDERS_INFO, {'ref_no': "TI78013", 'date': "03 Feb 2025", 'deadline': "05 Mar 2025"}),
+]
+
+
+@pytest.mark.parametrize("scraper_class, html, expected", CASES, ids=[case[0].SOURCE_NAME for case in CASES])
+def test_detail_fields(scraper_class, html, expected):
+    # Fields missing from the page, or not in the shape the selector expects, are left out
+    assert scraper_class.DETAIL_SELECTORS.parse(html) == expected
+
+
+@pytest.mark.parametrize("scraper_class", [case[0] for case in CASES], ids=[case[0].SOURCE_NAME for case in CASES])
+def test_pages_without_the_ready_marker_need_the_browser(scraper_class):
+    shell = "<html><body><div id='app'>Loading...</div></body></html>"
+    assert scraper_class.DETAIL_SELECTORS.parse(shell) is None
+    assert not any(scraper_class.DETAIL_SELECTORS.parse(shell, require_ready=False).values())
@@ -0,0 +1,156 @@
+import asyncio
+import time
+
+import pytest
+
+from src.utils.html_extract import Field, SelectorMap
+from src.utils.http_cache import HttpCache
+from src.utils.http_fetcher import FetchedPage, HttpFetcher
+from src.utils.traffic import RECORD, REPLAY, TrafficArchive
+
+URL = "https://example.org/notice/1"
+PAGE = "<div class='notice'><h1>Road works</h1><p class='ref'>REF-1</p></div>"
+
+
+class StubFetcher:
+    """Answers fetch_page from a queue of FetchedPages and records the headers sent"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    async def fetch_page(self, url, headers=None):
+        self.requests.append(headers or {})
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HttpCache(tmp_path / "http_cache.db")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def make_detail_scraper(scraper_class, make_scraper, cache):
+    """make(fetcher, fields) builds a scraper reading `fields` of PAGE through the cache and fetcher"""
+    def make(fetcher, fields=('title', 'ref'), **kwargs):
+        selectors = {'title': Field("h1"), 'ref': Field("p.ref")}
+
+        class DetailScraper(scraper_class):
+            DETAIL_SELECTORS = SelectorMap({key: selectors[key] for key in fields}, ready_selector="div.notice")
+
+        scraper = make_scraper(cls=DetailScraper, http_cache=cache, **kwargs)
+        scraper.http_fetcher = fetcher
+        return scraper
+    return make
+
+
+class StubResponse:
+    def __init__(self, text):
+        self.status = 200
+        self.headers = {'Content-Type': 'text/html', 'ETag': '"live"'}
+        self._text = text
+
+    async def text(self):
+        return self._text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class StubSession:
+    """Stands in for the aiohttp session of an HttpFetcher, serving one body for every URL"""
+
+    def __init__(self, text):
+        self.text = text
+        self.urls = []
+
+    def get(self, url, headers=None):
+        self.urls.append(url)
+        return StubResponse(self.text)
+
+
+def fetch(scraper):
+    return asyncio.run(scraper.fetch_static_fields(URL))
+
+
+def test_entry_freshness(cache):
+    cache.put(URL, PAGE, '"v1"', None, fetched_at=time.time() - 100)
+    entry = cache.get(URL)
+    assert entry.is_fresh(ttl=200)
+    assert not entry.is_fresh(ttl=50)
+    assert entry.validators() == {'If-None-Match': '"v1"'}
+    cache.revalidated(URL)
+    assert cache.get(URL).age < 5
+
+
+def test_fresh_entry_is_used_without_a_request(make_detail_scraper):
+    fetcher = StubFetcher(FetchedPage(200, PAGE, etag='"v1"'))
+    scraper = make_detail_scraper(fetcher)
+    assert fetch(scraper) == {'title': "Road works", 'ref': "REF-1"}
+    assert fetch(scraper) == {'title': "Road works", 'ref': "REF-1"}
+    assert len(fetcher.requests) == 1
+    assert scraper.metrics.counters['cache_hits'] == 1
+
+
+def test_stale_entry_is_revalidated_and_reused_on_304(make_detail_scraper, cache):
+    cache.put(URL, PAGE, '"v1"', "Mon, 03 Mar 2025 10:00:00 GMT", fetched_at=time.time() - 10 ** 6)
+    fetcher = StubFetcher(FetchedPage(304, None))
+    scraper = make_detail_scraper(fetcher)
+    assert fetch(scraper) == {'title': "Road works", 'ref': "REF-1"}
+    assert fetcher.requests == [{'If-None-Match': '"v1"', 'If-Modified-Since': "Mon, 03 Mar 2025 10:00:00 GMT"}]
+    assert scraper.metrics.counters['cache_revalidated'] == 1
+    assert cache.get(URL).is_fresh(scraper.cache_ttl)
+
+
+def test_stale_entry_is_replaced_by_a_new_body(make_detail_scraper, cache):
+    cache.put(URL, PAGE, '"v1"', None, fetched_at=time.time() - 10 ** 6)
+    changed = PAGE.replace("REF-1", "REF-2")
+    scraper = make_detail_scraper(StubFetcher(FetchedPage(200, changed, etag='"v2"')))
+    assert fetch(scraper)['ref'] == "REF-2"
+    entry = cache.get(URL)
+    assert (entry.etag, entry.fields['ref']) == ('"v2"', "REF-2")
+
+
+def test_cached_fields_are_reparsed_when_the_field_set_changes(make_detail_scraper, cache):
+    old = make_detail_scraper(StubFetcher(FetchedPage(200, PAGE)), fields=('title',))
+    assert fetch(old) == {'title': "Road works"}
+    assert cache.get(URL).fields_key == "title"
+
+    fetcher = StubFetcher()
+    new = make_detail_scraper(fetcher)
+    assert fetch(new) == {'title': "Road works", 'ref': "REF-1"}
+    assert fetcher.requests == []  # re-parsed from the cached body
+    assert cache.get(URL).fields_key == "ref,title"
+
+
+def test_pages_needing_javascript_are_not_cached(make_detail_scraper, cache):
+    scraper = make_detail_scraper(StubFetcher(FetchedPage(200, "<div id='app'></div>")))
+    assert fetch(scraper) is None
+    assert cache.get(URL) is None
+
+
+def test_recording_and_replaying_bypass_a_warm_cache(make_detail_scraper, cache, tmp_path):
+    cache.put(URL, PAGE, '"v1"', None, {'title': "Road works", 'ref': "REF-1"}, "ref,title")
+    live = PAGE.replace("REF-1", "REF-2")
+
+    archive = TrafficArchive("Sample", RECORD, tmp_path / "traffic")
+    fetcher = HttpFetcher(archive=archive)
+    fetcher.session = StubSession(live)
+    recorder = make_detail_scraper(fetcher, traffic=archive)
+    assert fetch(recorder)['ref'] == "REF-2"
+    assert fetcher.session.urls == [URL]
+    assert URL in archive.responses
+    archive.save()
+    archive.har_path.touch()
+
+    archive = TrafficArchive("Sample", REPLAY, tmp_path / "traffic")
+    replayer = make_detail_scraper(HttpFetcher(archive=archive), traffic=archive)
+    assert fetch(replayer)['ref'] == "REF-2"
+    assert archive.hits == 1
+    assert 'cache_hits' not in replayer.metrics.counters
+    assert cache.get(URL).fields['ref'] == "REF-1"
@@ -0,0 +1,44 @@
+import re
+from datetime import date
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+from benchmarks.mock_site import MockSite
+from src.utils.date_utils import match_date
+
+TODAY = date(2025, 4, 18)
+
+
+@pytest.fixture
+def site():
+    return MockSite(notices=6, page_size=3, days=6, today=TODAY)
+
+
+@pytest.fixture
+def request_():
+    return make_mocked_request('GET', '/', headers={'Host': '127.0.0.1:8765'})
+
+
+# Listing date formats of the real sites, which the scrapers' date handling is written against
+@pytest.mark.parametrize("source, pattern, fmt", [
+    ('afdb', r"<span class='date-display-single'>([^<]+)</span>", "%d-%b-%Y"),
+    ('afd', r"<td class='published'>([^<]+)</td>", "%b %d, %Y"),
+    ('aiib', r"<span class='s2'>([^<]+)</span>", "%b %d, %Y"),
+])
+def test_listing_dates_use_the_site_format(site, request_, source, pattern, fmt):
+    body = getattr(site, f"{source}_list")(request_, 1)
+    dates = re.findall(pattern, body)
+    assert len(dates) == 3
+    for i, text in enumerate(dates):
+        assert match_date(text) == (site.published(i), fmt)
+
+
+def test_afdb_listing_date(site, request_):
+    assert "<span class='date-display-single'>18-Apr-2025</span>" in site.afdb_list(request_, 1)
+
+
+def test_afd_listing_dates(site, request_):
+    body = site.afd_list(request_, 1)
+    assert "<td class='published'>Apr 18, 2025</td>" in body
+    assert "<td class='deadline'>May 18, 2025</td>" in body
@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from src.utils.page_pool import DetailPagePool
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+def open_pages(context):
+    return sum(not page.closed for page in context.pages)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_pages_hold_permits_until_closed():
+    async def main():
+        limiter = asyncio.Semaphore(3)
+        context = FakeContext()
+        pool = DetailPagePool(context, size=2, limiter=limiter, idle_timeout=60)
+
+        async def handler(page, url):
+            await asyncio.sleep(0.01)
+            return url
+
+        assert await asyncio.gather(*(pool.run(f"u{i}", handler) for i in range(3))) == ["u0", "u1", "u2"]
+        # Two pages kept idle with their permits, the third closed
+        assert (len(pool.idle), open_pages(context), limiter._value) == (2, 2, 1)
+        await pool.close()
+        assert (open_pages(context), limiter._value, pool.open_pages) == (0, 3, 0)
+    run(main())
+
+
+def test_idle_pages_are_reused():
+    async def main():
+        context = FakeContext()
+        pool = DetailPagePool(context, size=1, limiter=asyncio.Semaphore(2), idle_timeout=60)
+        for i in range(5):
+            await pool.run(f"u{i}", lambda page, url: asyncio.sleep(0))
+        assert len(context.pages) == 1
+        await pool.close()
+    run(main())
+
+
+def test_released_page_is_handed_to_a_waiting_handler():
+    async def main():
+        limiter = asyncio.Semaphore(1)
+        context = FakeContext()
+        pool = DetailPagePool(context, size=1, limiter=limiter, idle_timeout=60)
+        seen = []
+
+        async def handler(page, url):
+            seen.append(page)
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(pool.run(f"u{i}", handler) for i in range(4)))
+        assert len(context.pages) == 1
+        assert len(set(seen)) == 1
+        await pool.close()
+        assert limiter._value == 1
+    run(main())
+
+
+def test_permits_are_never_exceeded():
+    async def main():
+        limiter = asyncio.Semaphore(3)
+        context = FakeContext()
+        pool = DetailPagePool(context, size=lambda: 2, limiter=limiter, idle_timeout=60)
+        peak = 0
+
+        async def handler(page, url):
+            nonlocal peak
+            peak = max(peak, open_pages(context))
+            await asyncio.sleep(0.001)
+
+        await asyncio.gather(*(pool.run(f"u{i}", handler) for i in range(30)))
+        assert peak <= 3
+        assert pool.peak_pages <= 3
+        await pool.close()
+        assert limiter._value == 3
+    run(main())
+
+
+def test_cancelled_waiter_gives_back_its_permit():
+    async def main():
+        limiter = asyncio.Semaphore(1)
+        pool = DetailPagePool(FakeContext(), size=1, limiter=limiter, idle_timeout=60)
+        gate = asyncio.Event()
+
+        async def hold(page, url):
+            await gate.wait()
+
+        holder = asyncio.ensure_future(pool.run("a", hold))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(pool.run("b", hold))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        gate.set()
+        await holder
+        await pool.close()
+        assert limiter._value == 1
+        assert pool.open_pages == 0
+    run(main())
+
+
+def test_idle_pages_time_out():
+    async def main():
+        limiter = asyncio.Semaphore(2)
+        context = FakeContext()
+        pool = DetailPagePool(context, size=2, limiter=limiter, idle_timeout=0.02, reap_interval=0.01)
+        await pool.run("u", lambda page, url: asyncio.sleep(0))
+        assert limiter._value == 1
+        await asyncio.sleep(0.05)
+        assert (pool.idle, open_pages(context), limiter._value) == ([], 0, 2)
+        await pool.close()
+    run(main())
+
+
+def test_idle_pages_are_given_up_to_another_source():
+    async def main():
+        limiter = asyncio.Semaphore(2)
+        pool = DetailPagePool(FakeContext(), size=1, limiter=limiter, idle_timeout=60, reap_interval=0.01)
+        other = DetailPagePool(FakeContext(), size=2, limiter=limiter, idle_timeout=60)
+        await pool.run("u", lambda page, url: asyncio.sleep(0))
+        assert len(pool.idle) == 1
+
+        async def handler(page, url):
+            await asyncio.sleep(0.02)
+
+        # The other source's second page needs the permit the idle page holds
+        await asyncio.wait_for(asyncio.gather(other.run("v", handler), other.run("w", handler)), timeout=1)
+        assert pool.idle == []
+        assert other.peak_pages == 2
+        await pool.close()
+        await other.close()
+        assert limiter._value == 2
+    run(main())
@@ -0,0 +1,36 @@
+from src.utils.pagination import PageUrls
+
+
+def test_drupal_pager_counts_from_zero():
+    urls = PageUrls.from_next_link("https://example.org/tenders", "/tenders?page=1", "page")
+    assert urls.second_page_value == 1
+    assert urls.url(2) == "https://example.org/tenders?page=1"
+    assert urls.url(5) == "https://example.org/tenders?page=4"
+
+
+def test_pager_counting_from_one():
+    urls = PageUrls.from_next_link("https://example.org/list?page=1", "list?page=2", "page")
+    assert urls.url(3) == "https://example.org/list?page=3"
+
+
+def test_declared_parameter_is_used_among_other_numbers():
+    urls = PageUrls.from_next_link("https://example.org/list?items_per_page=2",
+                                   "?items_per_page=2&page=1", "page")
+    assert urls.param == "page"
+    assert urls.url(3) == "https://example.org/list?items_per_page=2&page=2"
+
+
+def test_other_query_parameters_are_kept():
+    urls = PageUrls.from_next_link("https://example.org/list?sort=date", "?sort=date&page=2", "page")
+    assert urls.url(4) == "https://example.org/list?sort=date&page=4"
+
+
+def test_links_without_a_page_number():
+    assert PageUrls.from_next_link("https://example.org/list", "javascript:void(0)", "page") is None
+    assert PageUrls.from_next_link("https://example.org/list", "?page=next", "page") is None
+    assert PageUrls.from_next_link("https://example.org/list", "?offset=20", "page") is None
+
+
+def test_page_number_has_to_follow_the_current_page():
+    assert PageUrls.from_next_link("https://example.org/list?page=3", "?page=7", "page") is None
+    assert PageUrls.from_next_link("https://example.org/list", "?page=7", "page") is None
@@ -0,0 +1,21 @@
+import pandas as pd
+import pytest
+
+from src.storage.writers import ParquetWriter
+
+
+def test_parquet_writer_partitions_by_source_and_month(tmp_path, make_scraper, make_rows):
+    pytest.importorskip("pyarrow")
+    scraper = make_scraper()
+    rows = make_rows(1) + [{'title': "Undated", 'country': "Kenya", 'publish_date': "N/A",
+                            'url': "https://example.org/notice/undated", 'documents': ["a.pdf", "b.pdf"]}]
+    df = scraper.normalize_frame(pd.DataFrame(rows))
+    assert ParquetWriter(root=tmp_path).write(scraper, df) == 4
+
+    months = sorted(p.name for p in (tmp_path / "source=Sample").iterdir())
+    assert months == ["publish_month=2025-02", "publish_month=unknown"]
+    dated = pd.read_parquet(tmp_path / "source=Sample" / "publish_month=2025-02")
+    assert len(dated) == 3
+    assert set(dated['published_on'].astype(str)) == {"2025-02-19"}
+    undated = pd.read_parquet(tmp_path / "source=Sample" / "publish_month=unknown")
+    assert list(undated['documents'][0]) == ["a.pdf", "b.pdf"]
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from src.utils.retry import CircuitBreaker, CircuitOpenError, Retrier, RetryBudget, RetryPolicy, TransientHTTPError
+
+
+def make_retrier(attempts=3, threshold=5, reset_timeout=60.0, budget=None):
+    return Retrier("test", policy=RetryPolicy(attempts=attempts, base_delay=0, max_delay=0),
+                   budget=budget or RetryBudget(), breaker=CircuitBreaker("test", threshold, reset_timeout))
+
+
+def failing(times, error=ValueError):
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        if len(calls) <= times:
+            raise error("boom")
+        return len(calls)
+    return operation, calls
+
+
+def test_backoff_is_capped_and_honours_retry_after():
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+    assert all(0 <= policy.backoff(attempt) <= 4.0 for attempt in range(10))
+    assert policy.backoff(0, retry_after=3.0) >= 3.0
+    assert policy.backoff(0, retry_after=100.0) <= 4.0
+
+
+def test_retry_after_header():
+    assert TransientHTTPError(429, "7").retry_after == 7.0
+    assert TransientHTTPError(503, "Wed, 21 Oct 2015 07:28:00 GMT").retry_after is None
+
+
+def test_retries_until_success():
+    operation, calls = failing(2)
+    assert asyncio.run(make_retrier().run(operation, "op", retry_on=(ValueError,))) == 3
+    assert len(calls) == 3
+
+
+def test_raises_the_last_error_after_the_attempts():
+    operation, calls = failing(5)
+    with pytest.raises(ValueError):
+        asyncio.run(make_retrier(attempts=3).run(operation, "op", retry_on=(ValueError,)))
+    assert len(calls) == 3
+
+
+def test_other_errors_are_not_retried():
+    operation, calls = failing(1, error=KeyError)
+    with pytest.raises(KeyError):
+        asyncio.run(make_retrier().run(operation, "op", retry_on=(ValueError,)))
+    assert len(calls) == 1
+
+
+def test_budget_limits_retries():
+    budget = RetryBudget(ratio=0, minimum=1)
+    operation, calls = failing(5)
+    with pytest.raises(ValueError):
+        asyncio.run(make_retrier(attempts=5, budget=budget).run(operation, "op", retry_on=(ValueError,)))
+    assert len(calls) == 2
+    assert budget.retries == 1
+
+
+def test_backoff_uses_the_given_sleep():
+    slept = []
+
+    async def sleep(seconds):
+        slept.append(seconds)
+
+    operation, _ = failing(2)
+    asyncio.run(make_retrier().run(operation, "op", retry_on=(ValueError,), sleep=sleep))
+    assert len(slept) == 2
+
+
+def test_breaker_opens_and_rejects():
+    retrier = make_retrier(attempts=1, threshold=2)
+    operation, calls = failing(10)
+
+    async def main():
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await retrier.run(operation, "op", retry_on=(ValueError,))
+        with pytest.raises(CircuitOpenError):
+            await retrier.run(operation, "op", retry_on=(ValueError,))
+
+    asyncio.run(main())
+    assert len(calls) == 2
+    assert retrier.breaker.is_open
+    assert retrier.breaker.times_opened == 1
+
+
+def test_half_open_trial_closes_or_reopens():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow()
+    assert not breaker.allow()  # one trial at a time
+    breaker.record_failure()
+    assert breaker.is_open and not breaker.trial_running
+    assert breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open
+
+
+def test_cancelled_trial_ends_the_trial():
+    retrier = make_retrier(attempts=1, threshold=1, reset_timeout=0)
+    retrier.breaker.record_failure()
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def main():
+        task = asyncio.ensure_future(retrier.run(hang, "op", retry_on=(ValueError,)))
+        await asyncio.sleep(0)
+        assert retrier.breaker.trial_running
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert not retrier.breaker.trial_running
+    assert retrier.breaker.allow()
+
+
+def test_unexpected_error_in_a_trial_ends_the_trial():
+    retrier = make_retrier(attempts=1, threshold=1, reset_timeout=0)
+    retrier.breaker.record_failure()
+    operation, _ = failing(1, error=KeyError)
+    with pytest.raises(KeyError):
+        asyncio.run(retrier.run(operation, "op", retry_on=(ValueError,)))
+    assert not retrier.breaker.trial_running
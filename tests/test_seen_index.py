@@ -0,0 +1,84 @@
+import pytest
+
+from src.utils.seen_index import SeenIndex, fingerprint
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return tmp_path / "seen_notices.db"
+
+
+@pytest.fixture
+def incremental_scraper(scraper_class, make_scraper, index_path):
+    """make(pages) builds a scraper that skips known notices, like the real ones, over a shared index"""
+    class IncrementalScraper(scraper_class):
+        async def scrape_data(self):
+            self.visited = []
+            for number, rows in enumerate(self.pages, start=1):
+                self.visited.append(number)
+                known_page = self.page_is_known([row['url'] for row in rows])
+                await self.emit([row for row in rows if not self.is_known_notice(row['url'])], page=number)
+                if known_page or self.pagination_stopped:
+                    break
+
+    def make(pages):
+        return make_scraper(pages, cls=IncrementalScraper, incremental=True, seen_index=SeenIndex(index_path))
+    return make
+
+
+def test_fingerprint_ignores_key_order():
+    assert fingerprint({'a': 1, 'b': "x"}) == fingerprint({'b': "x", 'a': 1})
+    assert fingerprint({'a': 1}) != fingerprint({'a': 2})
+
+
+def test_index_persists_across_instances(index_path):
+    index = SeenIndex(index_path)
+    assert index.mark_seen("EBRD", [("https://example.org/a", "f1")]) == 1
+    assert index.is_known("EBRD", "https://example.org/a")
+    assert not index.is_known("AFD", "https://example.org/a")
+    index.close()
+
+    reopened = SeenIndex(index_path)
+    assert reopened.is_known("EBRD", "https://example.org/a")
+    first_seen = reopened.conn.execute("SELECT first_seen FROM seen_notices").fetchone()[0]
+    reopened.mark_seen("EBRD", [("https://example.org/a", "f2")])
+    assert reopened.conn.execute("SELECT COUNT(*), MIN(first_seen), MIN(fingerprint) FROM seen_notices"
+                                 ).fetchone() == (1, first_seen, "f2")
+    reopened.close()
+
+
+def test_notice_keys(make_scraper):
+    scraper = make_scraper()
+    assert scraper.notice_key("/notice/1#top") == "https://example.org/notice/1"
+    assert scraper.notice_key("N/A") is None
+    assert scraper.notice_key(None) is None
+
+
+def test_second_run_skips_known_notices_and_stops_on_a_known_page(incremental_scraper, make_rows, consume):
+    written, _ = consume(incremental_scraper([make_rows(2), make_rows(3)]))
+    assert written == 6
+
+    # A new page was published on top; page 2 (the first run's first page) is all known
+    second = incremental_scraper([make_rows(1), make_rows(2), make_rows(3)])
+    written, writer = consume(second)
+    assert written == 3
+    assert list(writer.batches[0]['title']) == ["Notice 1-0", "Notice 1-1", "Notice 1-2"]
+    assert second.visited == [1, 2]
+    assert second.stop_reason == "all notices on this page were scraped by earlier runs"
+
+
+def test_partly_known_page_does_not_stop(incremental_scraper, make_rows, consume):
+    consume(incremental_scraper([make_rows(2, count=1)]))
+    scraper = incremental_scraper([make_rows(2), make_rows(3)])
+    written, _ = consume(scraper)
+    assert written == 5
+    assert scraper.visited == [1, 2]
+    assert not scraper.pagination_stopped
+
+
+def test_not_incremental_ignores_the_index(make_scraper, index_path):
+    index = SeenIndex(index_path)
+    index.mark_seen("Sample", [("https://example.org/notice/1-0", "f")])
+    scraper = make_scraper(incremental=False, seen_index=index)
+    assert not scraper.is_known_notice("https://example.org/notice/1-0")
+    assert not scraper.page_is_known(["https://example.org/notice/1-0"])
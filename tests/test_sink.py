@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from src.storage.sink import ResultSink
+from src.storage.writers import ResultWriter
+
+
+class FailingWriter(ResultWriter):
+    """Raises from its fail_on-th write on"""
+
+    name = "failing"
+
+    def __init__(self, fail_on: int = 1):
+        self.calls = 0
+        self.fail_on = fail_on
+
+    def write(self, scraper, df):
+        self.calls += 1
+        if self.calls >= self.fail_on:
+            raise OSError("disk full")
+        return len(df)
+
+
+def test_rows_are_flushed_in_batches(make_scraper, make_rows, consume):
+    written, writer = consume(make_scraper([make_rows(1), make_rows(2), make_rows(3)]), batch_size=4)
+    assert written == 9
+    assert [len(batch) for batch in writer.batches] == [4, 4, 1]
+    # Every batch gets the canonical publish date next to the site's string
+    assert 'published_on' in writer.batches[0].columns
+
+
+def test_rows_before_a_crawl_error_are_kept(make_scraper, make_rows):
+    scraper = make_scraper([make_rows(1), make_rows(2), make_rows(3)], fail_after=2)
+    counting = FailingWriter(fail_on=99)
+    sink = ResultSink(scraper, [counting], batch_size=100)
+    with pytest.raises(RuntimeError):
+        asyncio.run(sink.consume(scraper.iter_rows()))
+    assert sink.written == 6
+    assert counting.calls == 1
+
+
+def test_failed_write_is_not_repeated(make_scraper, make_rows):
+    scraper = make_scraper([make_rows(1), make_rows(2)])
+    first, second = FailingWriter(fail_on=99), FailingWriter(fail_on=1)
+    sink = ResultSink(scraper, [first, second], batch_size=3)
+    with pytest.raises(OSError, match="disk full"):
+        asyncio.run(sink.consume(scraper.iter_rows()))
+    # The first writer got the batch once, not again from a second flush
+    assert first.calls == 1
+    assert sink.written == 0
+    assert not scraper.checkpoint.path.exists()
+
+
+def test_crawl_error_is_not_hidden_by_a_failing_final_flush(make_scraper, make_rows):
+    scraper = make_scraper([make_rows(1), make_rows(2)], fail_after=1)
+    sink = ResultSink(scraper, [FailingWriter(fail_on=1)], batch_size=100)
+    with pytest.raises(RuntimeError, match="listing page 2 failed"):
+        asyncio.run(sink.consume(scraper.iter_rows()))
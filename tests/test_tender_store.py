@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from src.storage.tender_store import TenderStore
+from src.storage.writers import StoreWriter
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TenderStore(tmp_path / "tenders.db")
+    yield store
+    store.close()
+
+
+def record(source, notice_id, publish_date, country="Kenya", title=None, **data):
+    return {'source': source, 'notice_id': notice_id, 'publish_date': publish_date, 'country': country,
+            'title': title or f"Notice {notice_id}", 'url': f"https://example.org/{notice_id}",
+            'data': dict(data, title=title or f"Notice {notice_id}")}
+
+
+def test_upserting_a_notice_twice_keeps_one_updated_row(store):
+    store.upsert([record("EBRD", "a", "2025-02-20", title="Old title", status="open")])
+    first_seen = store.query("EBRD")['first_seen'][0]
+    store.upsert([record("EBRD", "a", "2025-02-21", country="Peru", title="New title", status="closed")])
+
+    assert store.count() == 1
+    row = store.query("EBRD").iloc[0]
+    assert (row['title'], row['country'], row['publish_date']) == ("New title", "Peru", "2025-02-21")
+    assert row['status'] == "closed"
+    assert row['first_seen'] == first_seen
+
+
+def test_same_notice_id_in_two_sources(store):
+    store.upsert([record("EBRD", "a", "2025-02-20"), record("AFD", "a", "2025-02-20")])
+    assert store.count() == 2
+    assert store.count("AFD") == 1
+
+
+def test_query_filters(store):
+    store.upsert([
+        record("EBRD", "a", "2025-02-18", country="Kenya"),
+        record("EBRD", "b", "2025-02-20", country="Peru", title="Water supply"),
+        record("AFD", "c", "2025-02-22", country="Kenya"),
+        record("AIIB", "d", None, country="India"),
+    ])
+    assert list(store.query()['notice_id']) == ["c", "b", "a", "d"]  # newest first, undated last
+    assert list(store.query(source="EBRD")['notice_id']) == ["b", "a"]
+    assert set(store.query(source=["EBRD", "AFD"])['notice_id']) == {"a", "b", "c"}
+    assert list(store.query(country="Kenya")['notice_id']) == ["c", "a"]
+    assert list(store.query(published_from="2025-02-20")['notice_id']) == ["c", "b"]
+    assert list(store.query(published_from="2025-02-19", published_to="2025-02-21")['notice_id']) == ["b"]
+    assert list(store.query(search="water")['notice_id']) == ["b"]
+    assert list(store.query(limit=1)['notice_id']) == ["c"]
+    assert 'data' not in store.query(expand=False).columns
+
+
+def test_store_writer_upserts_scraped_rows(store, make_scraper, make_rows):
+    scraper = make_scraper()
+    writer = StoreWriter(store)
+    df = scraper.normalize_frame(pd.DataFrame(make_rows(1)))
+    writer.write(scraper, df)
+    writer.write(scraper, df)
+    assert store.count("Sample") == 3
+    stored = store.query("Sample")
+    assert set(stored['publish_date']) == {"2025-02-19"}
+    assert set(stored['url']) == {f"https://example.org/notice/1-{i}" for i in range(3)}
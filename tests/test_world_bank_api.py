@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from src.scrapers import world_bank_scraper
+from src.scrapers.world_bank_scraper import WorldBankScraper
+from src.utils.date_window import DateWindow
+from src.utils.seen_index import SeenIndex
+
+NOTICE = {
+    'id': "OP00312345",
+    'bid_description': " Supply of Medical Equipment ",
+    'project_ctry_name': "Kenya",
+    'project_name': "Health Systems Strengthening",
+    'project_id': "P178521",
+    'notice_type': "Invitation for Bids",
+    'notice_lang_name': "English",
+    'noticedate': "2025-02-24T00:00:00Z",
+}
+
+
+def notice(number, date):
+    return dict(NOTICE, id=f"OP{number:08d}", bid_description=f"Notice {number}", noticedate=date)
+
+
+class StubApi:
+    """Answers fetch_json from a queue of canned payloads and records the params of each request"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    async def fetch_json(self, url, params=None):
+        self.requests.append(params)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def world_bank(make_scraper, monkeypatch):
+    """make(api, **kwargs) builds an API-mode scraper over February 2025 with two notices per API page"""
+    monkeypatch.setattr(world_bank_scraper, 'WORLD_BANK_API_PAGE_SIZE', 2)
+
+    def make(api, **kwargs):
+        kwargs.setdefault('incremental', False)
+        scraper = make_scraper("https://projects.worldbank.org/en/projects-operations/procurement", cls=WorldBankScraper,
+                               date_window=DateWindow("2025-02-01", "2025-02-28"), **kwargs)
+        scraper.api_fetcher = api
+        return scraper
+    return make
+
+
+def listing(scraper):
+    async def collect():
+        return [page async for page in scraper.api_listing_pages()]
+    return asyncio.run(collect())
+
+
+def test_notice_row_has_the_table_columns(world_bank):
+    scraper = world_bank(StubApi())
+    assert scraper.notice_row(NOTICE) == {
+        'description': "Supply of Medical Equipment",
+        'description_link': "https://projects.worldbank.org/en/projects-operations/procurement-detail/OP00312345",
+        'country': "Kenya",
+        'project_title': "Health Systems Strengthening",
+        'notice_type': "Invitation for Bids",
+        'language': "English",
+        'publish_date': "February 24, 2025",
+        'project_link': "https://projects.worldbank.org/en/projects-operations/project-detail/P178521",
+    }
+    row = scraper.notice_row({'id': "OP1", 'project_name': "Roads", 'project_ctry_name': ["Kenya", "Uganda"]})
+    assert (row['description'], row['country'], row['project_link']) == ("Roads", "Kenya; Uganda", None)
+
+
+def test_pages_are_filtered_to_the_window_until_an_older_notice(world_bank):
+    api = StubApi(
+        {'total': 6, 'procnotices': [notice(1, "2025-03-02T00:00:00Z"), notice(2, "2025-02-20T00:00:00Z")]},
+        # Some responses key the notices by id instead of listing them
+        {'total': 6, 'procnotices': {'a': notice(3, "2025-02-03T00:00:00Z"), 'b': notice(4, "2025-01-30T00:00:00Z")}},
+    )
+    scraper = world_bank(api)
+    pages = listing(scraper)
+
+    assert [(number, [row['description'] for row in rows]) for number, rows in pages] == [
+        (1, ["Notice 2"]), (2, ["Notice 3"])
+    ]
+    # The older notice on page 2 stops pagination before page 3 is requested
+    assert len(api.requests) == 2
+    assert "older than" in scraper.stop_reason
+    assert [params['os'] for params in api.requests] == [0, 2]
+    assert (api.requests[0]['strdate'], api.requests[0]['enddate']) == ("2025-02-01", "2025-02-28")
+
+
+def test_a_short_page_is_the_last(world_bank):
+    api = StubApi({'total': 3, 'procnotices': [notice(1, "2025-02-20T00:00:00Z")]})
+    scraper = world_bank(api)
+    assert [number for number, _ in listing(scraper)] == [1]
+    assert scraper.stop_reason is None and scraper.crawl_complete
+
+
+def test_a_page_of_known_notices_stops_pagination(world_bank, tmp_path):
+    known = [notice(1, "2025-02-20T00:00:00Z"), notice(2, "2025-02-19T00:00:00Z")]
+    index = SeenIndex(tmp_path / "seen_notices.db")
+    scraper = world_bank(StubApi({'total': 6, 'procnotices': known}), incremental=True, seen_index=index)
+    index.mark_seen(scraper.SOURCE_NAME, [(scraper.notice_row(n)['description_link'], "f") for n in known])
+
+    assert listing(scraper) == [(1, [])]
+    assert "earlier runs" in scraper.stop_reason
+    index.close()
+
+
+def test_failed_requests(world_bank):
+    # A failed first page yields nothing so scrape_data falls back to the table
+    scraper = world_bank(StubApi(None))
+    assert listing(scraper) == []
+    assert scraper.crawl_complete
+
+    # A failed later page leaves the crawl incomplete
+    scraper = world_bank(StubApi(
+        {'total': 6, 'procnotices': [notice(1, "2025-02-20T00:00:00Z"), notice(2, "2025-02-19T00:00:00Z")]},
+        None,
+    ))
+    assert [number for number, _ in listing(scraper)] == [1]
+    assert not scraper.crawl_complete
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from src.storage.writers import CsvWriter, make_writers
+
+
+@pytest.fixture
+def scraper(make_scraper):
+    return make_scraper()
+
+
+@pytest.fixture
+def frame(scraper):
+    return lambda rows: scraper.normalize_frame(pd.DataFrame(rows))
+
+
+def test_csv_writer_appends_later_batches(tmp_path, scraper, frame, make_rows):
+    writer = CsvWriter(output_dir=tmp_path)
+    assert writer.write(scraper, frame(make_rows(1))) == 3
+    assert writer.write(scraper, frame(make_rows(2, count=2))) == 2
+    files = list(tmp_path.glob("Sample_data_*.csv"))
+    assert len(files) == 1
+    df = pd.read_csv(files[0])
+    assert len(df) == 5
+    assert list(df['title'][-2:]) == ["Notice 2-0", "Notice 2-1"]
+
+
+def test_csv_writer_keeps_columns_of_later_batches(tmp_path, scraper, frame, make_rows):
+    writer = CsvWriter(output_dir=tmp_path)
+    writer.write(scraper, frame(make_rows(1, count=2)))
+    writer.write(scraper, frame([dict(row, sector="Energy") for row in make_rows(2, count=2)]))
+    writer.write(scraper, frame(make_rows(3, count=1)))
+    df = pd.read_csv(next(tmp_path.glob("Sample_data_*.csv")), keep_default_na=False)
+    assert len(df) == 5
+    assert list(df.columns[-1:]) == ["sector"]
+    assert list(df['sector']) == ["", "", "Energy", "Energy", ""]
+    assert list(df['publish_date'][:2]) == ["19 Feb 2025", "19 Feb 2025"]
+
+
+def test_make_writers_rejects_unknown_names():
+    assert [type(w) for w in make_writers(["csv"])] == [CsvWriter]
+    with pytest.raises(ValueError):
+        make_writers(["excel"])